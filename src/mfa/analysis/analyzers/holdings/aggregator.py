@@ -6,18 +6,18 @@ This module aggregates holdings data across multiple funds using proper dependen
 
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from typing import Any
 
 from mfa.config.settings import ConfigProvider
 
 from ..utils.aggregator_utils import AggregatorUtils
 from ..utils.output_builder_utils import OutputBuilderUtils
-from .data_processor import ProcessedFund
+from .data_processor import ProcessedFund, ProcessedHolding
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyData:
     """Aggregated data for a single company."""
 
@@ -36,6 +36,16 @@ class AggregatedData:
     funds_info: dict[str, dict[str, Any]]
 
 
+@dataclass(slots=True)
+class _CompanyStats:
+    """Running totals for one company while aggregating."""
+
+    total_weight: float = 0.0
+    fund_count: int = 0
+    last_fund_id: int = -1
+    sample_funds: list[str] = field(default_factory=list)
+
+
 class HoldingsAggregator:
     """Aggregates holdings data across multiple funds."""
 
@@ -70,53 +80,53 @@ class HoldingsAggregator:
         if isinstance(max_samples, int) and max_samples < 0:
             max_samples = 0
 
-        company_to_funds: defaultdict[str, set] = defaultdict(set)
-        company_total_weights: defaultdict[str, float] = defaultdict(float)
-        company_examples: defaultdict[str, list] = defaultdict(list)
+        stats: dict[str, _CompanyStats] = {}
         funds_info = {}
 
-        # Process each fund
         for fund in processed_funds:
-            fund_key = fund.name
-            funds_info[fund_key] = {
+            funds_info[fund.name] = {
                 "name": fund.name,
                 "aum": fund.aum,
                 "holdings_count": len(fund.holdings),
             }
 
-            # Process holdings in this fund
-            for holding in fund.holdings:
-                company_name = holding.company_name
-                weight = holding.allocation_percentage
-
-                # Track fund associations
-                company_to_funds[company_name].add(fund_key)
-                company_total_weights[company_name] += weight
+        # Funds are keyed by name; repeated names are merged so each fund is walked
+        # exactly once. Names are normally unique, so funds are used as-is.
+        fund_holdings: Iterable[tuple[str, list[ProcessedHolding]]]
+        if len(funds_info) == len(processed_funds):
+            fund_holdings = ((fund.name, fund.holdings) for fund in processed_funds)
+        else:
+            merged: dict[str, list[ProcessedHolding]] = {}
+            for fund in processed_funds:
+                merged[fund.name] = merged.get(fund.name, []) + fund.holdings
+            fund_holdings = merged.items()
+
+        # Single pass: one dict lookup per holding updates all running totals. Since
+        # each fund's holdings are contiguous, comparing against the last fund id
+        # counts distinct funds without keeping a per-company set.
+        for fund_id, (fund_key, holdings) in enumerate(fund_holdings):
+            for holding in holdings:
+                entry = stats.get(holding.company_name)
+                if entry is None:
+                    entry = stats[holding.company_name] = _CompanyStats()
+
+                entry.total_weight += holding.allocation_percentage
+                if entry.last_fund_id != fund_id:
+                    entry.last_fund_id = fund_id
+                    entry.fund_count += 1
+                    if len(entry.sample_funds) < max_samples:
+                        entry.sample_funds.append(fund_key)
 
-                # Limit sample funds using utility
-                if len(company_examples[company_name]) < max_samples:
-                    company_examples[company_name].append(fund_key)
-
-        # Build company data
         companies = {}
-        for company_name in company_to_funds:
-            fund_count = len(company_to_funds[company_name])
-            total_weight = company_total_weights[company_name]
-
-            # Calculate average weight using utility
-            average_weight = AggregatorUtils.calculate_average_weight(total_weight, fund_count)
-
-            # Limit sample funds using utility
-            sample_funds = AggregatorUtils.limit_sample_funds(
-                company_examples[company_name], max_samples
-            )
-
+        for company_name, entry in stats.items():
             companies[company_name] = CompanyData(
                 name=company_name,
-                fund_count=fund_count,
-                total_weight=total_weight,
-                average_weight=average_weight,
-                sample_funds=sample_funds,
+                fund_count=entry.fund_count,
+                total_weight=entry.total_weight,
+                average_weight=AggregatorUtils.calculate_average_weight(
+                    entry.total_weight, entry.fund_count
+                ),
+                sample_funds=entry.sample_funds,
             )
 
         return AggregatedData(companies=companies, funds_info=funds_info)
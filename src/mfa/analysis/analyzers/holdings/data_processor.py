@@ -67,12 +67,15 @@ class HoldingsDataProcessor:
                 "Holdings analysis configuration not found",
                 {"analysis": "holdings"},
             )
-        excluded_holdings = set(holdings_config.params.exclude_from_analysis or [])
+        # Upper-case exclusions once rather than per holding
+        excluded_keywords = DataProcessorUtils.build_excluded_keywords(
+            holdings_config.params.exclude_from_analysis
+        )
         processed_funds = []
 
         for fund_json in fund_jsons:
             try:
-                processed_fund = self._process_single_fund(fund_json, excluded_holdings)
+                processed_fund = self._process_single_fund(fund_json, excluded_keywords)
                 if processed_fund:
                     processed_funds.append(processed_fund)
             except Exception as e:
@@ -82,7 +85,9 @@ class HoldingsDataProcessor:
         logger.debug(f"Processed {len(processed_funds)} funds from {len(fund_jsons)} JSON files")
         return processed_funds
 
-    def _process_single_fund(self, fund_json: dict, excluded_holdings: set) -> ProcessedFund | None:
+    def _process_single_fund(
+        self, fund_json: dict, excluded_keywords: frozenset[str]
+    ) -> ProcessedFund | None:
         """Process a single fund JSON into structured data."""
         try:
             # Extract fund info
@@ -98,8 +103,8 @@ class HoldingsDataProcessor:
             for holding_data in top_holdings:
                 company_name = holding_data.get("company_name", "").strip()
 
-                # Skip excluded holdings using utility
-                if DataProcessorUtils.is_excluded_holding(company_name, excluded_holdings):
+                # Skip excluded holdings (cash, TREPS, ...) before any parsing or normalization
+                if DataProcessorUtils.contains_excluded_keyword(company_name, excluded_keywords):
                     continue
 
                 # Parse allocation percentage using utility
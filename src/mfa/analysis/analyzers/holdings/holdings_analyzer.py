@@ -8,6 +8,7 @@ scraping and analysis phases.
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -123,22 +124,36 @@ class HoldingsAnalyzer(BaseAnalyzer):
     def _process_all_categories(
         self, loaded_data: dict[str, list[dict[str, Any]]], date: str
     ) -> tuple[list[Path], dict[str, Any]]:
-        """Process all categories and return output paths and summary."""
+        """
+        Process all categories and return output paths and summary.
+
+        Category results are written by a background thread so the next category
+        is processed while the previous file is saved. All writes finish, and any
+        write error is raised, before this returns.
+        """
         output_paths = []
         summary = self._initialize_summary(loaded_data)
+        pending_writes: list[Future[None]] = []
 
-        for category, fund_data_list in loaded_data.items():
-            if self._should_skip_category(category, fund_data_list):
-                continue
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mfa-output") as writer:
+            for category, fund_data_list in loaded_data.items():
+                if self._should_skip_category(category, fund_data_list):
+                    continue
 
-            # Process single category
-            category_results = self._process_single_category(category, fund_data_list, date)
+                # Process single category
+                category_results = self._process_single_category(
+                    category, fund_data_list, date, writer
+                )
 
-            # Update tracking
-            output_paths.append(category_results["output_path"])
-            self._update_summary(summary, category_results)
+                # Update tracking
+                output_paths.append(category_results["output_path"])
+                pending_writes.append(category_results["write"])
+                self._update_summary(summary, category_results)
 
-            self._log_category_completion(category, category_results)
+                self._log_category_completion(category, category_results)
+
+        for write in pending_writes:
+            write.result()
 
         return output_paths, summary
 
@@ -159,9 +174,13 @@ class HoldingsAnalyzer(BaseAnalyzer):
         return False
 
     def _process_single_category(
-        self, category: str, fund_data_list: list[dict[str, Any]], date: str
+        self,
+        category: str,
+        fund_data_list: list[dict[str, Any]],
+        date: str,
+        writer: ThreadPoolExecutor,
     ) -> dict[str, Any]:
-        """Process a single category and return results."""
+        """Process a single category, queue its output for writing and return results."""
         logger.info(f"📊 Analyzing category: {category}")
 
         # Process using components with dependency injection
@@ -169,11 +188,13 @@ class HoldingsAnalyzer(BaseAnalyzer):
         aggregated_data = self.aggregator.aggregate_holdings(processed_funds)
         category_output = self.output_builder.build_category_output(category, aggregated_data)
 
-        # Save analysis result
-        output_path = self._save_category_result(category, category_output, date)
+        # Save analysis result in the background
+        output_path = self._category_output_path(category, date)
+        write = writer.submit(self._save_category_result, category, category_output, output_path)
 
         return {
             "output_path": output_path,
+            "write": write,
             "processed_funds": processed_funds,
             "category_output": category_output,
         }
@@ -197,23 +218,22 @@ class HoldingsAnalyzer(BaseAnalyzer):
             f"{summary['categories_processed']}/{summary['total_categories']} categories"
         )
 
-    def _save_category_result(
-        self, category: str, category_output: dict[str, Any], date: str
-    ) -> Path:
-        """Save category analysis result to file using PathGenerator."""
+    def _category_output_path(self, category: str, date: str) -> Path:
+        """Generate the category analysis output path using PathGenerator."""
         # Create analysis config for path generation
         analysis_config = {
             "type": self.analysis_type,
             # Could add analysis_output_template here in future
         }
 
-        # Generate path using PathGenerator
-        output_path = self.path_generator.generate_analysis_output_path(
+        return self.path_generator.generate_analysis_output_path(
             category=category, analysis_config=analysis_config, date_str=date
         )
 
-        # Save using JsonStore
+    def _save_category_result(
+        self, category: str, category_output: dict[str, Any], output_path: Path
+    ) -> None:
+        """Save category analysis result to file using JsonStore."""
         JsonStore.save_with_path(data=category_output, file_path=output_path)
 
         logger.debug(f"💾 Saved {category} analysis to: {output_path}")
-        return output_path
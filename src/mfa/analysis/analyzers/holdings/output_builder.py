@@ -47,11 +47,8 @@ class HoldingsOutputBuilder:
         # Extract fund references
         funds = self._extract_fund_references(aggregated_data)
 
-        # Sort companies by different criteria
-        sorted_companies = self._sort_companies_by_criteria(aggregated_data, funds)
-
-        # Apply result limits
-        limited_companies = self._apply_result_limits(sorted_companies, max_companies)
+        # Select the top companies by different criteria
+        limited_companies = self._select_top_companies(aggregated_data, funds, max_companies)
 
         # Build final output structure
         return self._build_output_structure(funds, aggregated_data, limited_companies)
@@ -67,33 +64,24 @@ class HoldingsOutputBuilder:
         """Extract fund references from aggregated data."""
         return OutputBuilderUtils.extract_fund_references(aggregated_data)
 
-    def _sort_companies_by_criteria(
-        self, aggregated_data: AggregatedData, funds: list[dict[str, Any]]
+    def _select_top_companies(
+        self, aggregated_data: AggregatedData, funds: list[dict[str, Any]], max_companies: int
     ) -> dict[str, list]:
-        """Sort companies by different criteria for various output sections."""
+        """Select the top companies for each output section, limited to max_companies."""
         company_values = list(aggregated_data.companies.values())
 
         return {
             "by_fund_count": OutputBuilderUtils.sort_companies_by_criteria(
-                company_values, "fund_count"
+                company_values, "fund_count", max_companies
             ),
             "by_total_weight": OutputBuilderUtils.sort_companies_by_criteria(
-                company_values, "total_weight"
+                company_values, "total_weight", max_companies
             ),
             "common_in_all": OutputBuilderUtils.find_companies_in_all_funds(
-                company_values, len(funds)
+                company_values, len(funds), max_companies
             ),
         }
 
-    def _apply_result_limits(
-        self, sorted_companies: dict[str, list], max_companies: int
-    ) -> dict[str, list]:
-        """Apply max companies limit to each category."""
-        return {
-            key: OutputBuilderUtils.limit_results(companies, max_companies)
-            for key, companies in sorted_companies.items()
-        }
-
     def _build_output_structure(
         self,
         funds: list[dict[str, Any]],
@@ -101,20 +89,26 @@ class HoldingsOutputBuilder:
         limited_companies: dict[str, list],
     ) -> dict[str, Any]:
         """Build the final output structure matching dashboard format."""
+        # Leading companies usually appear in several sections; format each only once
+        formatted: dict[str, dict[str, Any]] = {}
+
+        def format_section(companies: list[CompanyData]) -> list[dict[str, Any]]:
+            section = []
+            for company in companies:
+                entry = formatted.get(company.name)
+                if entry is None:
+                    entry = formatted[company.name] = self._format_company_for_output(company)
+                section.append(entry)
+            return section
+
         return {
             "total_files": len(funds),  # Dashboard expects this field
             "total_funds": len(funds),
             "funds": funds,
             "unique_companies": len(aggregated_data.companies),
-            "top_by_fund_count": [
-                self._format_company_for_output(c) for c in limited_companies["by_fund_count"]
-            ],
-            "top_by_total_weight": [
-                self._format_company_for_output(c) for c in limited_companies["by_total_weight"]
-            ],
-            "common_in_all_funds": [
-                self._format_company_for_output(c) for c in limited_companies["common_in_all"]
-            ],
+            "top_by_fund_count": format_section(limited_companies["by_fund_count"]),
+            "top_by_total_weight": format_section(limited_companies["by_total_weight"]),
+            "common_in_all_funds": format_section(limited_companies["common_in_all"]),
         }
 
     def _format_company_for_output(self, company_data: CompanyData) -> dict[str, Any]:
@@ -29,13 +29,9 @@ class PortfolioAggregator:
             for h in fund.get("holdings", []):
                 name = str(h.get("company_name", "")).strip()
 
-                # Use utility for company exclusion check
-                if AggregatorUtils.should_exclude_company(name, exclusion_set):
-                    continue
-
-                # Use utility for name normalization
+                # Normalize once and reuse it for the exclusion check
                 normalized_name = AggregatorUtils.normalize_company_name(name)
-                if not normalized_name:
+                if not normalized_name or normalized_name in exclusion_set:
                     continue
 
                 amt = float(h.get("amount", 0.0))
@@ -7,6 +7,7 @@ in analyzer implementations, particularly around file loading and common pattern
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +18,9 @@ from mfa.storage.json_store import JsonStore
 class AnalyzerUtils:
     """Common utilities for analyzer implementations."""
 
+    # Threads used to overlap reading and parsing of scraped JSON files
+    FILE_LOAD_WORKERS = 8
+
     @staticmethod
     def load_files_from_data_source(data_source: dict[str, Any]) -> dict[str, list[dict[str, Any]]]:
         """
@@ -34,22 +38,31 @@ class AnalyzerUtils:
         file_paths = data_source.get("file_paths", {})
         loaded_data: dict[str, list[dict[str, Any]]] = {}
 
-        for category, paths in file_paths.items():
-            category_data: list[dict[str, Any]] = []
-
-            for file_path in paths:
-                try:
-                    fund_data = JsonStore.load(Path(file_path))
-                    category_data.append(fund_data)
-                except Exception as e:
-                    logger.warning(f"Failed to load {file_path}: {e}")
-                    continue
+        # Load every category's files through one pool; map() keeps input order
+        all_paths = [path for paths in file_paths.values() for path in paths]
+        max_workers = max(1, min(AnalyzerUtils.FILE_LOAD_WORKERS, len(all_paths)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mfa-load") as pool:
+            loaded_files = list(pool.map(AnalyzerUtils._load_file, all_paths))
 
+        offset = 0
+        for category, paths in file_paths.items():
+            category_files = loaded_files[offset : offset + len(paths)]
+            offset += len(paths)
+            category_data = [fund_data for fund_data in category_files if fund_data is not None]
             loaded_data[category] = category_data
             logger.debug(f"📁 Loaded {len(category_data)} files for {category}")
 
         return loaded_data
 
+    @staticmethod
+    def _load_file(file_path: str | Path) -> dict[str, Any] | None:
+        """Load a single JSON file, returning None (and logging) when it cannot be read."""
+        try:
+            return JsonStore.load(Path(file_path))
+        except Exception as e:
+            logger.warning(f"Failed to load {file_path}: {e}")
+            return None
+
     @staticmethod
     def validate_loaded_data(
         loaded_data: dict[str, list[dict[str, Any]]], analysis_type: str
@@ -8,6 +8,7 @@ different analysis types to ensure consistency and eliminate code duplication.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 
 class DataProcessorUtils:
@@ -27,15 +28,25 @@ class DataProcessorUtils:
         re.compile(r"\s+Co\.?\s*$", re.IGNORECASE),
     ]
 
+    # Matches when any of the suffix patterns above would; lets plain names skip the loop
+    _ANY_SUFFIX_PATTERN = re.compile(
+        r"\s(?:Limited|Ltd\.?|Pvt\.?|Inc\.?|Corporation|Corp\.?|Company|Co\.?)\s*$",
+        re.IGNORECASE,
+    )
+
     _TRAILING_DOTS_SPACES_PATTERN = re.compile(r"[\.\s]+$")
     _PERCENT_WS_PATTERN = re.compile(r"[%\s]")
+    _PERCENT_NUMBER_PATTERN = re.compile(r"\d{1,3}(?:\.\d+)?")
+    _CURRENCY_NUMBER_PATTERN = re.compile(r"[\d,.]+(?:\.\d+)?")
 
     @staticmethod
+    @lru_cache(maxsize=8192)
     def normalize_company_name(company_name: str) -> str:
         """
         Normalize company name by removing common suffixes and standardizing format.
 
-        This helps avoid duplicate companies due to slight name variations.
+        This helps avoid duplicate companies due to slight name variations. Results
+        are cached since the same companies recur across funds and categories.
 
         Args:
             company_name: Raw company name from fund data
@@ -50,8 +61,9 @@ class DataProcessorUtils:
         normalized = company_name.strip()
 
         # Apply suffix removal using precompiled patterns
-        for pattern in DataProcessorUtils._SUFFIX_PATTERNS:
-            normalized = pattern.sub("", normalized)
+        if DataProcessorUtils._ANY_SUFFIX_PATTERN.search(normalized):
+            for pattern in DataProcessorUtils._SUFFIX_PATTERNS:
+                normalized = pattern.sub("", normalized)
 
         # Clean up any remaining trailing dots or spaces (precompiled)
         normalized = DataProcessorUtils._TRAILING_DOTS_SPACES_PATTERN.sub("", normalized)
@@ -63,45 +75,57 @@ class DataProcessorUtils:
         return normalized.strip()
 
     @staticmethod
-    def parse_percentage(percentage_str: str | None) -> float:
+    def parse_percentage(percentage_str: str | float | None) -> float:
         """
         Parse percentage string to float value.
 
         Handles various percentage formats consistently across analyses.
 
         Args:
-            percentage_str: Percentage string (e.g., "5.25%", "5.25")
+            percentage_str: Percentage string (e.g., "5.25%", "5.25") or a number
+                already stored numerically by the scraper
 
         Returns:
             Float percentage value (5.25 for "5.25%")
         """
+        if isinstance(percentage_str, int | float):
+            return float(percentage_str)
         if not percentage_str:
             return 0.0
 
+        value = percentage_str if isinstance(percentage_str, str) else str(percentage_str)
+        try:
+            # Fast path for the common "5.25%" shape
+            return float(value.rstrip(" %"))
+        except ValueError:
+            pass
+
         try:
             # Remove % sign and any whitespace
-            clean_str = DataProcessorUtils._PERCENT_WS_PATTERN.sub("", str(percentage_str))
+            clean_str = DataProcessorUtils._PERCENT_WS_PATTERN.sub("", value)
             return float(clean_str)
         except (ValueError, TypeError):
             return 0.0
 
     @staticmethod
-    def parse_percentage_as_decimal(percentage_str: str | None) -> float:
+    def parse_percentage_as_decimal(percentage_str: str | float | None) -> float:
         """
         Parse percentage string to decimal value (for portfolio calculations).
 
         Args:
-            percentage_str: Percentage string (e.g., "5.25%")
+            percentage_str: Percentage string (e.g., "5.25%") or a number
 
         Returns:
             Decimal value (0.0525 for "5.25%")
         """
+        if isinstance(percentage_str, int | float):
+            return float(percentage_str) / 100.0
         if not percentage_str:
             return 0.0
 
         try:
             # Extract numeric part
-            match = re.search(r"\d{1,3}(?:\.\d+)?", str(percentage_str))
+            match = DataProcessorUtils._PERCENT_NUMBER_PATTERN.search(str(percentage_str))
             if not match:
                 return 0.0
             return float(match.group(0)) / 100.0
@@ -126,13 +150,46 @@ class DataProcessorUtils:
 
         try:
             # Extract number from strings like "₹ 123.45" or "Rs. 123.45"
-            match = re.search(r"[\d,.]+(?:\.\d+)?", str(currency_str))
+            match = DataProcessorUtils._CURRENCY_NUMBER_PATTERN.search(str(currency_str))
             if not match:
                 return 0.0
             return float(match.group(0).replace(",", ""))
         except (ValueError, TypeError):
             return 0.0
 
+    @staticmethod
+    def build_excluded_keywords(excluded_holdings: set[str] | list[str] | None) -> frozenset[str]:
+        """
+        Upper-case excluded holding names once for repeated substring checks.
+
+        Args:
+            excluded_holdings: Excluded holding names from configuration
+
+        Returns:
+            Frozen set of upper-cased, non-empty keywords
+        """
+        if not excluded_holdings:
+            return frozenset()
+        return frozenset(name.upper() for name in excluded_holdings if name)
+
+    @staticmethod
+    def contains_excluded_keyword(company_name: str, excluded_keywords: frozenset[str]) -> bool:
+        """
+        Check a raw company name against prebuilt keywords from build_excluded_keywords.
+
+        Args:
+            company_name: Company name to check
+            excluded_keywords: Upper-cased excluded keywords
+
+        Returns:
+            True if any keyword occurs in the company name
+        """
+        if not company_name or not excluded_keywords:
+            return False
+
+        company_upper = company_name.upper()
+        return any(keyword in company_upper for keyword in excluded_keywords)
+
     @staticmethod
     def is_excluded_holding(company_name: str, excluded_holdings: set[str]) -> bool:
         """
@@ -145,8 +202,6 @@ class DataProcessorUtils:
         Returns:
             True if company should be excluded
         """
-        if not company_name or not excluded_holdings:
-            return False
-
-        company_upper = company_name.upper()
-        return any(excluded.upper() in company_upper for excluded in excluded_holdings)
+        return DataProcessorUtils.contains_excluded_keyword(
+            company_name, DataProcessorUtils.build_excluded_keywords(excluded_holdings)
+        )
@@ -7,6 +7,8 @@ formatting and structure across different analysis types.
 
 from __future__ import annotations
 
+import heapq
+from collections.abc import Callable
 from typing import Any
 
 from mfa.config.settings import ConfigProvider
@@ -16,6 +18,13 @@ from mfa.core.exceptions import ConfigurationError
 class OutputBuilderUtils:
     """Common utilities for building analysis outputs."""
 
+    # Ascending sort keys producing the descending orders used in outputs
+    _COMPANY_SORT_KEYS: dict[str, Callable[[Any], Any]] = {
+        "fund_count": lambda c: (-c.fund_count, -c.total_weight),
+        "total_weight": lambda c: (-c.total_weight, -c.fund_count),
+        "weight_then_count": lambda c: -c.total_weight,
+    }
+
     @staticmethod
     def format_currency_value(value: float) -> int:
         """
@@ -194,25 +203,24 @@ class OutputBuilderUtils:
         }
 
     @staticmethod
-    def sort_companies_by_criteria(companies: list[Any], sort_type: str) -> list[Any]:
+    def sort_companies_by_criteria(
+        companies: list[Any], sort_type: str, limit: int | None = None
+    ) -> list[Any]:
         """
         Sort companies by different criteria.
 
         Args:
             companies: List of company objects with fund_count and total_weight
             sort_type: "fund_count", "total_weight", or "weight_then_count"
+            limit: Keep only the top N companies (None or non-positive for all)
 
         Returns:
             Sorted list of companies
         """
-        if sort_type == "fund_count":
-            return sorted(companies, key=lambda c: (-c.fund_count, -c.total_weight))
-        elif sort_type == "total_weight":
-            return sorted(companies, key=lambda c: (-c.total_weight, -c.fund_count))
-        elif sort_type == "weight_then_count":
-            return sorted(companies, key=lambda c: -c.total_weight)
-        else:
+        key = OutputBuilderUtils._COMPANY_SORT_KEYS.get(sort_type)
+        if key is None:
             raise ValueError(f"Unknown sort_type: {sort_type}")
+        return OutputBuilderUtils._top_sorted(companies, key, limit)
 
     @staticmethod
     def extract_fund_references(aggregated_data: Any) -> list[dict[str, Any]]:
@@ -231,16 +239,29 @@ class OutputBuilderUtils:
         ]
 
     @staticmethod
-    def find_companies_in_all_funds(companies: list[Any], total_fund_count: int) -> list[Any]:
+    def find_companies_in_all_funds(
+        companies: list[Any], total_fund_count: int, limit: int | None = None
+    ) -> list[Any]:
         """
         Find companies that appear in all funds.
 
         Args:
             companies: List of company objects with fund_count
             total_fund_count: Total number of funds
+            limit: Keep only the top N companies (None or non-positive for all)
 
         Returns:
             List of companies that appear in all funds, sorted by total_weight
         """
         companies_in_all = [c for c in companies if c.fund_count == total_fund_count]
-        return sorted(companies_in_all, key=lambda c: -c.total_weight)
+        return OutputBuilderUtils._top_sorted(
+            companies_in_all, OutputBuilderUtils._COMPANY_SORT_KEYS["weight_then_count"], limit
+        )
+
+    @staticmethod
+    def _top_sorted(items: list[Any], key: Callable[[Any], Any], limit: int | None) -> list[Any]:
+        """Sort items by key, selecting only the first `limit` with a heap when bounded."""
+        if limit is None or limit <= 0 or limit >= len(items):
+            return sorted(items, key=key)
+        # Equivalent to sorted(items, key=key)[:limit], in O(n log limit)
+        return heapq.nsmallest(limit, items, key=key)
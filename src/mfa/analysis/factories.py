@@ -7,6 +7,7 @@ with direct config access, enabling easy extension with new analysis types.
 
 from __future__ import annotations
 
+import importlib
 from collections.abc import Callable
 
 from mfa.config.settings import ConfigProvider
@@ -18,6 +19,11 @@ class AnalyzerFactory:
     """Factory for creating analyzer instances with direct config access."""
 
     _analyzers: dict[str, type[IAnalyzer]] = {}
+    # Built-in analyzers, imported (and thereby registered) when first requested
+    _builtin_modules: dict[str, str] = {
+        "holdings": "mfa.analysis.analyzers.holdings",
+        "portfolio": "mfa.analysis.analyzers.portfolio",
+    }
 
     @classmethod
     def create_analyzer(cls, analysis_type: str, config_provider: ConfigProvider) -> IAnalyzer:
@@ -31,6 +37,9 @@ class AnalyzerFactory:
         Returns:
             Initialized analyzer instance
         """
+        if analysis_type not in cls._analyzers and analysis_type in cls._builtin_modules:
+            importlib.import_module(cls._builtin_modules[analysis_type])
+
         if analysis_type not in cls._analyzers:
             raise ValueError(f"Unknown analysis type: {analysis_type}")
 
@@ -44,14 +53,19 @@ class AnalyzerFactory:
 
     @classmethod
     def get_available_types(cls) -> list[str]:
-        """Get list of available analyzer types."""
-        return list(cls._analyzers.keys())
+        """Get list of available analyzer types, including built-ins not yet imported."""
+        return list(dict.fromkeys([*cls._builtin_modules, *cls._analyzers]))
 
 
 class ScrapingCoordinatorFactory:
     """Factory for creating scraping coordinator instances."""
 
     _coordinators: dict[str, type[IScrapingCoordinator]] = {}
+    # Built-in coordinators, imported (and thereby registered) when first requested
+    _builtin_modules: dict[str, str] = {
+        "categories": "mfa.analysis.scraping.category_coordinator",
+        "targeted_funds": "mfa.analysis.scraping.targeted_coordinator",
+    }
 
     @classmethod
     def create_coordinator(
@@ -67,6 +81,9 @@ class ScrapingCoordinatorFactory:
         Returns:
             Initialized coordinator instance
         """
+        if strategy not in cls._coordinators and strategy in cls._builtin_modules:
+            importlib.import_module(cls._builtin_modules[strategy])
+
         if strategy not in cls._coordinators:
             raise ValueError(f"Unknown scraping strategy: {strategy}")
 
@@ -82,8 +99,8 @@ class ScrapingCoordinatorFactory:
 
     @classmethod
     def get_available_strategies(cls) -> list[str]:
-        """Get list of available scraping strategies."""
-        return list(cls._coordinators.keys())
+        """Get list of available scraping strategies, including built-ins not yet imported."""
+        return list(dict.fromkeys([*cls._builtin_modules, *cls._coordinators]))
 
 
 def register_analyzer(analysis_type: str) -> Callable[[type[IAnalyzer]], type[IAnalyzer]]:
@@ -131,8 +131,6 @@ class BaseAnalyzer(IAnalyzer):
         Returns:
             Properly structured AnalysisResult
         """
-        from pathlib import Path
-
         return AnalysisResult(
             analysis_type=self.analysis_type,
             date=date,
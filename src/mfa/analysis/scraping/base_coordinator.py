@@ -7,18 +7,90 @@ across different scraping strategies with any scraper type (API or Playwright).
 
 from __future__ import annotations
 
+import dataclasses
+import os
+import queue
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from mfa.config.settings import ConfigProvider
 from mfa.logging.logger import logger
 from mfa.scraping.scraper_factory import IScraper, ScraperFactory
+from mfa.storage.json_store import JsonStore
 from mfa.storage.path_generator import PathGenerator
+from mfa.storage.storage_config import StorageConfig
+
+
+class _ScraperThreadPool:
+    """
+    Worker threads that each own one scraper for their whole lifetime.
+
+    Playwright's sync API binds a browser to the thread that launched it, so a
+    regular ThreadPoolExecutor cannot share browsers between its threads. Here
+    every worker lazily creates its own scraper, reuses it for every task it runs
+    and closes it on the same thread at shutdown.
+    """
+
+    def __init__(self, size: int, create_scraper: Callable[[], IScraper]):
+        self._create_scraper = create_scraper
+        self._tasks: queue.SimpleQueue[tuple[Future[Any], Callable[..., Any], tuple] | None] = (
+            queue.SimpleQueue()
+        )
+        self._threads = [
+            threading.Thread(target=self._work, name=f"mfa-browser_{i}", daemon=True)
+            for i in range(size)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future[Any]:
+        """Queue fn(scraper, *args) to run on the next free worker."""
+        future: Future[Any] = Future()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def shutdown(self) -> None:
+        """Let workers finish queued tasks, close their scrapers and exit."""
+        for _ in self._threads:
+            self._tasks.put(None)
+        for thread in self._threads:
+            thread.join()
+
+    def _work(self) -> None:
+        """Run queued tasks with this thread's scraper until a shutdown marker arrives."""
+        scraper: IScraper | None = None
+        try:
+            while (task := self._tasks.get()) is not None:
+                future, fn, args = task
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if scraper is None:
+                        scraper = self._create_scraper()
+                    future.set_result(fn(scraper, *args))
+                except BaseException as e:  # Delivered to the caller through the future
+                    future.set_exception(e)
+        finally:
+            if scraper is not None:
+                try:
+                    scraper.close()
+                except Exception as e:
+                    logger.warning(
+                        "Failed to close scraper on {}: {}", threading.current_thread().name, e
+                    )
 
 
 class BaseScrapingCoordinator:
     """Base class for scraping coordinators with configurable scraper types."""
 
+    # Background threads used to write scraped documents while the next URL is fetched
+    WRITER_POOL_SIZE = 2
+
     def __init__(self, config_provider: ConfigProvider):
         """
         Initialize base coordinator with injected config provider.
@@ -29,6 +101,11 @@ class BaseScrapingCoordinator:
         self.config_provider = config_provider
         self.path_generator = PathGenerator(config_provider)
         self._scraper: IScraper | None = None
+        self._writer_pool: ThreadPoolExecutor | None = None
+        self._browser_pool: _ScraperThreadPool | None = None
+        self._request_pool: ThreadPoolExecutor | None = None
+        # Guards lazy creation of the shared scraper and pools when categories run in parallel
+        self._resource_lock = threading.Lock()
 
     def _get_scraper(self, scraper_type: str | None = None) -> IScraper:
         """
@@ -41,16 +118,66 @@ class BaseScrapingCoordinator:
         Returns:
             Scraper instance implementing IScraper interface
         """
-        if self._scraper is None:
-            # Determine scraper type
-            if scraper_type is None:
-                config = self.config_provider.get_config()
-                scraper_type = getattr(config.scraping, "default_scraper", "api")
+        with self._resource_lock:
+            if self._scraper is None:
+                # Determine scraper type
+                if scraper_type is None:
+                    config = self.config_provider.get_config()
+                    scraper_type = getattr(config.scraping, "default_scraper", "api")
+
+                logger.debug(f"🔧 Creating {scraper_type} scraper")
+                self._scraper = ScraperFactory.create_scraper(scraper_type, self.config_provider)
+
+            return self._scraper
+
+    @staticmethod
+    def _unique_urls(urls: list[str]) -> list[str]:
+        """
+        Strip URLs and drop blanks and duplicates, keeping first-seen order.
+
+        Args:
+            urls: URLs as listed in the configuration or requirement
+
+        Returns:
+            URLs to scrape, each fetched once
+        """
+        return list(dict.fromkeys(stripped for url in urls if (stripped := url.strip())))
+
+    def _get_writer_pool(self) -> ThreadPoolExecutor:
+        """Get or create the background pool used for writing scraped documents."""
+        with self._resource_lock:
+            if self._writer_pool is None:
+                self._writer_pool = ThreadPoolExecutor(
+                    max_workers=self.WRITER_POOL_SIZE, thread_name_prefix="mfa-writer"
+                )
+            return self._writer_pool
 
-            logger.debug(f"🔧 Creating {scraper_type} scraper")
-            self._scraper = ScraperFactory.create_scraper(scraper_type, self.config_provider)
+    def _get_request_pool(self) -> ThreadPoolExecutor:
+        """
+        Get or create the pool running concurrent API requests for every category.
+
+        Sharing one pool keeps parallel categories within max_concurrent_requests,
+        and so within the HTTP client's keep-alive pool, instead of each category
+        opening its own set of connections.
+        """
+        with self._resource_lock:
+            if self._request_pool is None:
+                config = self.config_provider.get_config()
+                self._request_pool = ThreadPoolExecutor(
+                    max_workers=max(1, config.scraping.max_concurrent_requests),
+                    thread_name_prefix="mfa-scrape",
+                )
+            return self._request_pool
 
-        return self._scraper
+    def _get_browser_pool(self, scraper_type: str) -> _ScraperThreadPool:
+        """Get or create the browser workers shared by every category."""
+        with self._resource_lock:
+            if self._browser_pool is None:
+                self._browser_pool = _ScraperThreadPool(
+                    self._max_browsers(),
+                    lambda: ScraperFactory.create_scraper(scraper_type, self.config_provider),
+                )
+            return self._browser_pool
 
     def _get_scraping_settings(self) -> dict[str, Any]:
         """Get scraping settings from config."""
@@ -63,12 +190,109 @@ class BaseScrapingCoordinator:
             "save_extracted_json": scraping_config.save_extracted_json,
         }
 
+    def _scrape_urls(
+        self,
+        urls: list[str],
+        max_holdings: int,
+        scraper_type: str,
+        storage_config: StorageConfig | None = None,
+        keep_in_memory: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Scrape URLs in parallel when the scraper is thread-safe, sequentially otherwise.
+
+        The API scraper shares one thread-safe HTTP session. Playwright's sync API
+        binds each browser to one thread, so Playwright URLs are spread over
+        browser workers that each own a browser, or scraped on one thread when
+        only one browser is allowed. Hybrid scraping sends every URL to the API
+        first and only the ones it could not serve to the browser workers.
+
+        URLs whose document was already saved for today are not fetched again
+        unless scraping.force_refresh is set.
+
+        Returns:
+            Saved results for reused URLs, then newly scraped data in URL order
+            (failed URLs are skipped)
+        """
+        if not urls:
+            return []
+
+        saved = self._load_saved_results(urls, storage_config, keep_in_memory)
+        if saved:
+            logger.info(f"♻️  Reusing {len(saved)}/{len(urls)} documents saved earlier today")
+            urls = [url for url in urls if url not in saved]
+            if not urls:
+                return list(saved.values())
+
+        if scraper_type == "api":
+            scrape_urls = self._scrape_urls_concurrently
+        elif scraper_type == "hybrid":
+            scrape_urls = self._scrape_urls_hybrid
+        elif self._max_browsers() > 1:
+            scrape_urls = self._scrape_urls_in_browsers
+        else:
+            scrape_urls = self._scrape_urls_with_delay
+        results = scrape_urls(urls, max_holdings, scraper_type, storage_config, keep_in_memory)
+        return [*saved.values(), *results]
+
+    def _load_saved_results(
+        self, urls: list[str], storage_config: StorageConfig | None, keep_in_memory: bool
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Find URLs whose document was already saved today, so they need no request.
+
+        Fund data changes at most daily and files are bucketed by date, so a file
+        for today is as fresh as a new scrape. Saves are atomic, so an existing
+        file is always complete.
+
+        Returns:
+            URL to its saved document (or file stub when not kept in memory)
+        """
+        if storage_config is None or not storage_config.should_save:
+            return {}
+        if self.config_provider.get_config().scraping.force_refresh:
+            return {}
+
+        paths = self.path_generator.generate_scraped_data_paths(
+            urls,
+            category=storage_config.category,
+            analysis_config=storage_config.to_analysis_config(),
+            date_str=datetime.now().strftime("%Y%m%d"),
+        )
+        saved: dict[str, dict[str, Any]] = {}
+        for url, path in zip(urls, paths, strict=True):
+            if not os.path.isfile(path):
+                continue
+            if not keep_in_memory:
+                saved[url] = {"url": url, "status": "ok", "path": path}
+                continue
+            try:
+                saved[url] = JsonStore.load(Path(path))
+            except Exception:
+                continue  # Unreadable file; scrape the URL again
+        return saved
+
+    def _max_browsers(self) -> int:
+        """Number of browsers Playwright scraping may run at once."""
+        return self.config_provider.get_config().scraping.max_concurrent_browsers
+
+    def _can_scrape_from_threads(self, scraper_type: str) -> bool:
+        """
+        Whether _scrape_urls may be called from several threads at once.
+
+        True for the thread-safe API scraper, for hybrid scraping (whose browser
+        fallback always runs on browser workers) and for Playwright spread over
+        browser workers; a single Playwright browser is bound to one thread.
+        """
+        return scraper_type in ("api", "hybrid") or self._max_browsers() > 1
+
     def _scrape_urls_with_delay(
         self,
         urls: list[str],
         max_holdings: int,
         scraper_type: str,
-        storage_config: dict[str, Any] | None = None,
+        storage_config: StorageConfig | None = None,
+        keep_in_memory: bool = True,
     ) -> list[dict[str, Any]]:
         """
         Scrape a list of URLs with proper delays between requests.
@@ -78,28 +302,41 @@ class BaseScrapingCoordinator:
             max_holdings: Maximum holdings per fund
             scraper_type: Type of scraper to use ("api" or "playwright")
             storage_config: Optional storage configuration
+            keep_in_memory: Return full documents; when False and documents are
+                saved, return lightweight {url, status, path} stubs instead
 
         Returns:
-            List of scraped fund data
+            List of scraped fund data (or stubs pointing at the saved files);
+            URLs that failed to scrape or save are skipped
         """
         scraper = self._get_scraper(scraper_type)
-        results = []
+        scraped: list[tuple[str, dict[str, Any]]] = []
+        pending_writes: dict[Future[None], str] = {}
 
         config = self.config_provider.get_config()
         delay_seconds = config.scraping.delay_between_requests
+        scrape_config, write_config = self._split_storage_config(storage_config)
+        save_dir = self._save_directory(write_config)
 
         for i, url in enumerate(urls):
             try:
-                logger.info(f"Scraping {i + 1}/{len(urls)} with {scraper_type}: {url}")
+                logger.info("Scraping {}/{} with {}: {}", i + 1, len(urls), scraper_type, url)
 
-                result = scraper.scrape(
-                    url=url, max_holdings=max_holdings, storage_config=storage_config
+                result, write_future = self._scrape_single_url(
+                    scraper,
+                    url,
+                    max_holdings,
+                    scrape_config,
+                    save_dir,
+                    keep_in_memory,
                 )
-                results.append(result)
+                scraped.append((url, result))
+                if write_future is not None:
+                    pending_writes[write_future] = url
 
                 # Add delay between requests (except for the last one)
                 if i < len(urls) - 1 and delay_seconds > 0:
-                    logger.debug(f"Waiting {delay_seconds}s before next request...")
+                    logger.debug("Waiting {}s before next request...", delay_seconds)
                     time.sleep(delay_seconds)
 
             except Exception as e:
@@ -107,8 +344,271 @@ class BaseScrapingCoordinator:
                 # Continue with other URLs even if one fails
                 continue
 
+        failed_writes = self._wait_for_pending_writes(pending_writes)
+        return [result for url, result in scraped if url not in failed_writes]
+
+    def _scrape_urls_concurrently(
+        self,
+        urls: list[str],
+        max_holdings: int,
+        scraper_type: str,
+        storage_config: StorageConfig | None = None,
+        keep_in_memory: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Scrape a list of URLs in parallel over the scraper's shared connection pool.
+
+        Only suitable for thread-safe scrapers (the API scraper). Rate limiting is
+        left to the scraper, which delays each request it makes.
+
+        Args:
+            urls: List of URLs to scrape
+            max_holdings: Maximum holdings per fund
+            scraper_type: Type of scraper to use
+            storage_config: Optional storage configuration
+            keep_in_memory: Return full documents instead of saved-file stubs
+
+        Returns:
+            List of scraped fund data in URL order (URLs that failed to scrape or
+            save are skipped)
+        """
+        results, _ = self._scrape_with_request_pool(
+            urls, max_holdings, scraper_type, storage_config, keep_in_memory
+        )
         return results
 
+    def _scrape_urls_hybrid(
+        self,
+        urls: list[str],
+        max_holdings: int,
+        scraper_type: str,
+        storage_config: StorageConfig | None = None,
+        keep_in_memory: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Scrape URLs through the API, then retry the ones it failed for in browsers.
+
+        The API side shares the coordinator's API scraper, request pool and pacing
+        with plain API scraping, so funds the API can serve never wait on a
+        browser. Browsers are launched only when a URL needs one.
+
+        Args:
+            urls: List of URLs to scrape
+            max_holdings: Maximum holdings per fund
+            scraper_type: Scraper type requested ("hybrid")
+            storage_config: Optional storage configuration
+            keep_in_memory: Return full documents instead of saved-file stubs
+
+        Returns:
+            API results in URL order, then browser results in URL order
+            (URLs that failed both ways are skipped)
+        """
+        results, failed_urls = self._scrape_with_request_pool(
+            urls, max_holdings, "api", storage_config, keep_in_memory
+        )
+        if not failed_urls:
+            return results
+
+        logger.info(f"🌐 Retrying {len(failed_urls)} URLs the API could not serve with Playwright")
+        return results + self._scrape_urls_in_browsers(
+            failed_urls, max_holdings, "playwright", storage_config, keep_in_memory
+        )
+
+    def _scrape_with_request_pool(
+        self,
+        urls: list[str],
+        max_holdings: int,
+        scraper_type: str,
+        storage_config: StorageConfig | None,
+        keep_in_memory: bool,
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """
+        Scrape URLs on the shared request pool.
+
+        Returns:
+            tuple: (results in URL order, URLs whose scrape raised)
+        """
+        scraper = self._get_scraper(scraper_type)
+        scraped: list[tuple[str, dict[str, Any]]] = []
+        failed_urls: list[str] = []
+        pending_writes: dict[Future[None], str] = {}
+
+        scrape_config, write_config = self._split_storage_config(storage_config)
+        save_dir = self._save_directory(write_config)
+
+        # The request pool is shared by every category, so concurrency is not per-call
+        logger.info(f"Scraping {len(urls)} URLs with {scraper_type} on the shared request pool")
+        pool = self._get_request_pool()
+        futures = [
+            pool.submit(
+                self._scrape_single_url,
+                scraper,
+                url,
+                max_holdings,
+                scrape_config,
+                save_dir,
+                keep_in_memory,
+            )
+            for url in urls
+        ]
+
+        for url, future in zip(urls, futures, strict=True):
+            try:
+                result, write_future = future.result()
+            except Exception as e:
+                logger.error(f"Failed to scrape {url}: {e}")
+                failed_urls.append(url)
+                continue
+            scraped.append((url, result))
+            if write_future is not None:
+                pending_writes[write_future] = url
+
+        failed_writes = self._wait_for_pending_writes(pending_writes)
+        return [result for url, result in scraped if url not in failed_writes], failed_urls
+
+    def _scrape_urls_in_browsers(
+        self,
+        urls: list[str],
+        max_holdings: int,
+        scraper_type: str,
+        storage_config: StorageConfig | None = None,
+        keep_in_memory: bool = True,
+    ) -> list[dict[str, Any]]:
+        """
+        Scrape a list of URLs across several browsers, one per worker thread.
+
+        Browsers are launched on first use and kept until close_session(), so
+        later categories reuse them. Each worker waits the configured delay
+        after each of its requests.
+
+        Args:
+            urls: List of URLs to scrape
+            max_holdings: Maximum holdings per fund
+            scraper_type: Type of scraper each worker creates
+            storage_config: Optional storage configuration
+            keep_in_memory: Return full documents instead of saved-file stubs
+
+        Returns:
+            List of scraped fund data in URL order (URLs that failed to scrape or
+            save are skipped)
+        """
+        config = self.config_provider.get_config()
+        delay_seconds = config.scraping.delay_between_requests
+        scrape_config, write_config = self._split_storage_config(storage_config)
+        save_dir = self._save_directory(write_config)
+
+        browser_pool = self._get_browser_pool(scraper_type)
+
+        def scrape_in_browser(
+            scraper: IScraper, url: str
+        ) -> tuple[dict[str, Any], Future[None] | None]:
+            try:
+                return self._scrape_single_url(
+                    scraper,
+                    url,
+                    max_holdings,
+                    scrape_config,
+                    save_dir,
+                    keep_in_memory,
+                )
+            finally:
+                if delay_seconds > 0:
+                    time.sleep(delay_seconds)
+
+        logger.info(
+            f"Scraping {len(urls)} URLs with {scraper_type} "
+            f"({self._max_browsers()} browsers in parallel)"
+        )
+        futures = [browser_pool.submit(scrape_in_browser, url) for url in urls]
+
+        scraped: list[tuple[str, dict[str, Any]]] = []
+        pending_writes: dict[Future[None], str] = {}
+        for url, future in zip(urls, futures, strict=True):
+            try:
+                result, write_future = future.result()
+            except Exception as e:
+                logger.error(f"Failed to scrape {url}: {e}")
+                continue
+            scraped.append((url, result))
+            if write_future is not None:
+                pending_writes[write_future] = url
+
+        failed_writes = self._wait_for_pending_writes(pending_writes)
+        return [result for url, result in scraped if url not in failed_writes]
+
+    def _split_storage_config(
+        self, storage_config: StorageConfig | None
+    ) -> tuple[StorageConfig | None, StorageConfig | None]:
+        """
+        Split storage config into the scraper's copy and the coordinator's write config.
+
+        Scrapers only extract; documents are written in the background so the
+        next request can start while the previous file is still being saved.
+
+        Returns:
+            tuple: (config passed to the scraper, config used for writing or None)
+        """
+        if storage_config is None or not storage_config.should_save:
+            return storage_config, None
+        return dataclasses.replace(storage_config, should_save=False), storage_config
+
+    def _save_directory(self, write_config: StorageConfig | None) -> str | None:
+        """
+        Resolve today's directory for a batch's documents once, rather than per URL.
+
+        Returns:
+            Directory path string, or None when documents are not saved
+        """
+        if write_config is None:
+            return None
+        return self.path_generator.generate_scraped_data_dir(
+            category=write_config.category,
+            analysis_config=write_config.to_analysis_config(),
+            date_str=datetime.now().strftime("%Y%m%d"),
+        )
+
+    def _scrape_single_url(
+        self,
+        scraper: IScraper,
+        url: str,
+        max_holdings: int,
+        scrape_config: StorageConfig | None,
+        save_dir: str | None,
+        keep_in_memory: bool,
+    ) -> tuple[dict[str, Any], Future[None] | None]:
+        """Scrape one URL and queue its document for writing into save_dir, if given."""
+        result = scraper.scrape(url=url, max_holdings=max_holdings, storage_config=scrape_config)
+        if save_dir is None:
+            return result, None
+
+        file_path = Path(save_dir, self.path_generator.generate_scraped_data_filename(url))
+        write_future = self._get_writer_pool().submit(JsonStore.save, result, file_path)
+
+        # The saved file is the source of truth for file-based analysis
+        if not keep_in_memory:
+            result = {"url": url, "status": "ok", "path": str(file_path)}
+        return result, write_future
+
+    def _wait_for_pending_writes(self, pending_writes: dict[Future[None], str]) -> set[str]:
+        """
+        Block until background writes finish, logging any that failed.
+
+        Returns:
+            URLs whose document could not be saved; callers drop them from their
+            results so no stub points at a file that was never written
+        """
+        if not pending_writes:
+            return set()
+
+        wait(pending_writes)
+        failed: set[str] = set()
+        for future, url in pending_writes.items():
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Failed to save scraped data for {url}: {error}")
+                failed.add(url)
+        return failed
+
     def _log_scraping_start(self, strategy: str, total_urls: int) -> None:
         """Log the start of scraping process."""
         logger.info(f"🕷️  Starting {strategy} scraping for {total_urls} URLs")
@@ -118,11 +618,31 @@ class BaseScrapingCoordinator:
         logger.info(f"✅ {strategy} scraping completed: {successful}/{total} URLs successful")
 
     def close_session(self) -> None:
-        """Close scraper and clean up resources."""
-        if self._scraper is not None:
+        """Close scraper and clean up resources. Safe to call more than once."""
+        if (
+            self._writer_pool is None
+            and self._scraper is None
+            and self._browser_pool is None
+            and self._request_pool is None
+        ):
+            return
+
+        # Detach before closing so a failing close is never retried on re-entry
+        writer_pool, self._writer_pool = self._writer_pool, None
+        scraper, self._scraper = self._scraper, None
+        browser_pool, self._browser_pool = self._browser_pool, None
+        request_pool, self._request_pool = self._request_pool, None
+
+        if browser_pool is not None:
+            logger.debug("🔒 Closing browser workers")
+            browser_pool.shutdown()
+        if request_pool is not None:
+            request_pool.shutdown(wait=True)
+        if writer_pool is not None:
+            writer_pool.shutdown(wait=True)
+        if scraper is not None:
             logger.debug("🔒 Closing scraper session")
-            self._scraper.close()
-            self._scraper = None
+            scraper.close()
 
     def __enter__(self) -> BaseScrapingCoordinator:
         """Context manager entry."""
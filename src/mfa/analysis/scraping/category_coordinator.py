@@ -7,10 +7,15 @@ saves data to files, and provides file paths for analysis.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 from mfa.config.settings import ConfigProvider
 from mfa.logging.logger import logger
+from mfa.storage.json_store import JsonStore
+from mfa.storage.storage_config import StorageConfig
 
 from ..factories import register_coordinator
 from ..interfaces import DataRequirement, IScrapingCoordinator
@@ -21,6 +26,9 @@ from .base_coordinator import BaseScrapingCoordinator
 class CategoryScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator):
     """Scraping coordinator for category-based fund collection with file-based output."""
 
+    # Categories scraped at the same time when the scraper can be shared across threads
+    CATEGORY_WORKERS = 4
+
     def __init__(self, config_provider: ConfigProvider):
         """
         Initialize category coordinator with injected config provider.
@@ -37,7 +45,11 @@ class CategoryScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator)
         Returns file paths for analysis instead of in-memory data.
         Uses configurable scraper type (API or Playwright).
         """
-        categories = requirement.metadata["categories"]
+        # Repeated URLs (common after manual config edits) are only scraped once
+        categories = {
+            category: self._unique_urls(urls)
+            for category, urls in requirement.metadata["categories"].items()
+        }
         analysis_id = requirement.metadata.get("analysis_id", "default")
 
         # Read config directly for this analysis
@@ -53,6 +65,9 @@ class CategoryScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator)
         scraper_type = getattr(analysis_config.data_requirements, "scraper_type", "api")
         logger.info(f"🔧 Using {scraper_type} scraper for category-based scraping")
 
+        # A fund listed under several categories is scraped for the first one only
+        owned_urls, shared_urls = self._split_shared_urls(categories)
+
         # Calculate total URLs for logging
         total_urls = sum(len(urls) for urls in categories.values())
         self._log_scraping_start(f"category-based ({scraper_type})", total_urls)
@@ -66,24 +81,22 @@ class CategoryScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator)
         successful_scrapes = 0
 
         try:
-            # Use shared session for all categories
-            for category, urls in categories.items():
-                logger.info(f"📂 Scraping category: {category} ({len(urls)} funds)")
-
-                # Scrape and save to files using configured scraper type
-                category_results, file_paths = self._scrape_and_save_category(
-                    urls, category, max_holdings, scraper_type, analysis_config, analysis_id
-                )
-
-                # Store both in-memory data (for compatibility) and file paths
+            for category, (category_results, file_paths) in self._scrape_categories(
+                owned_urls, max_holdings, scraper_type, analysis_config, analysis_id
+            ):
+                # Store results (full documents only when keep_in_memory) and file paths
                 scraped_data["data"][category] = category_results
                 scraped_data["file_paths"][category] = file_paths
-
                 successful_scrapes += len(category_results)
-                logger.info(
-                    f"   ✅ Category '{category}': {len(category_results)}/{len(urls)} funds scraped"
+
+            # Owners' documents are saved by now; give the other categories their copies
+            for category, owners in shared_urls.items():
+                linked_results, linked_paths = self._link_shared_documents(
+                    category, owners, analysis_config, analysis_id
                 )
-                logger.info(f"   📁 Saved to {len(file_paths)} files")
+                scraped_data["data"][category].extend(linked_results)
+                scraped_data["file_paths"][category].extend(linked_paths)
+                successful_scrapes += len(linked_results)
 
         finally:
             # Ensure session cleanup
@@ -92,6 +105,153 @@ class CategoryScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator)
         self._log_scraping_complete("category-based", successful_scrapes, total_urls)
         return scraped_data
 
+    @staticmethod
+    def _split_shared_urls(
+        categories: dict[str, list[str]],
+    ) -> tuple[dict[str, list[str]], dict[str, dict[str, str]]]:
+        """
+        Assign each URL to the first category that lists it.
+
+        Args:
+            categories: Category name to its (already de-duplicated) URLs
+
+        Returns:
+            tuple: (category -> URLs it scrapes,
+                    category -> {URL: owning category} for URLs scraped elsewhere)
+        """
+        owners: dict[str, str] = {}
+        owned: dict[str, list[str]] = {}
+        shared: dict[str, dict[str, str]] = {}
+        for category, urls in categories.items():
+            owned[category] = []
+            for url in urls:
+                owner = owners.setdefault(url, category)
+                if owner == category:
+                    owned[category].append(url)
+                else:
+                    shared.setdefault(category, {})[url] = owner
+        return owned, shared
+
+    def _link_shared_documents(
+        self, category: str, owners: dict[str, str], analysis_config: Any, analysis_id: str
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """
+        Link documents scraped for another category into this category's directory.
+
+        Args:
+            category: Category receiving the documents
+            owners: URL to the category that scraped it
+            analysis_config: Analysis configuration
+            analysis_id: Analysis identifier
+
+        Returns:
+            tuple: (results for the linked URLs, file paths for all of them)
+        """
+        urls = list(owners)
+        storage_config = self._build_storage_config_for_category(
+            category, analysis_config, analysis_id
+        )
+        file_paths = self._generate_expected_file_paths(urls, category, storage_config)
+        keep_in_memory = analysis_config.params.keep_in_memory
+
+        results: list[dict[str, Any]] = []
+        for url, file_path in zip(urls, file_paths, strict=True):
+            owner = owners[url]
+            owner_config = self._build_storage_config_for_category(
+                owner, analysis_config, analysis_id
+            )
+            source_path = Path(self._generate_expected_file_paths([url], owner, owner_config)[0])
+            if not source_path.is_file():
+                continue  # Scraping failed for the owning category
+
+            try:
+                JsonStore.link(source_path, Path(file_path))
+                result = (
+                    JsonStore.load(Path(file_path))
+                    if keep_in_memory
+                    else {"url": url, "status": "ok", "path": file_path}
+                )
+            except Exception as e:
+                logger.error(f"Failed to reuse {owner} document for {url}: {e}")
+                continue
+            results.append(result)
+
+        logger.info(
+            f"   🔗 Category '{category}': reused {len(results)}/{len(urls)} funds "
+            "scraped for other categories"
+        )
+        return results, file_paths
+
+    def _scrape_categories(
+        self,
+        categories: dict[str, list[str]],
+        max_holdings: int,
+        scraper_type: str,
+        analysis_config: Any,
+        analysis_id: str,
+    ) -> Iterator[tuple[str, tuple[list[dict[str, Any]], list[str]]]]:
+        """
+        Scrape every category, several at a time when the scraper allows it.
+
+        Categories share the coordinator's scraper, browser workers and writer
+        pool, so fanning out overlaps one category's waits with another's work
+        without opening more sessions. A single Playwright browser is bound to
+        one thread, so categories then run one after another.
+
+        Yields:
+            (category, (scraped_data_list, file_paths_list)) in configuration order
+        """
+        workers = min(self.CATEGORY_WORKERS, len(categories))
+        if workers <= 1 or not self._can_scrape_from_threads(scraper_type):
+            for category, urls in categories.items():
+                yield (
+                    category,
+                    self._scrape_category(
+                        category, urls, max_holdings, scraper_type, analysis_config, analysis_id
+                    ),
+                )
+            return
+
+        logger.info(f"📂 Scraping {len(categories)} categories ({workers} in parallel)")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mfa-category") as pool:
+            futures = {
+                category: pool.submit(
+                    self._scrape_category,
+                    category,
+                    urls,
+                    max_holdings,
+                    scraper_type,
+                    analysis_config,
+                    analysis_id,
+                )
+                for category, urls in categories.items()
+            }
+            for category, future in futures.items():
+                yield category, future.result()
+
+    def _scrape_category(
+        self,
+        category: str,
+        urls: list[str],
+        max_holdings: int,
+        scraper_type: str,
+        analysis_config: Any,
+        analysis_id: str,
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Scrape and save one category, logging its progress."""
+        logger.info(f"📂 Scraping category: {category} ({len(urls)} funds)")
+
+        # Scrape and save to files using configured scraper type
+        category_results, file_paths = self._scrape_and_save_category(
+            urls, category, max_holdings, scraper_type, analysis_config, analysis_id
+        )
+
+        logger.info(
+            f"   ✅ Category '{category}': {len(category_results)}/{len(urls)} funds scraped"
+        )
+        logger.info(f"   📁 Saved to {len(file_paths)} files")
+        return category_results, file_paths
+
     def _scrape_and_save_category(
         self,
         urls: list[str],
@@ -120,9 +280,13 @@ class CategoryScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator)
             category, analysis_config, analysis_id
         )
 
-        # Scrape with file saving enabled using specified scraper type
-        category_results = self._scrape_urls_with_delay(
-            urls, max_holdings, scraper_type, storage_config
+        # Scrape with file saving enabled; API requests run in parallel
+        category_results = self._scrape_urls(
+            urls,
+            max_holdings,
+            scraper_type,
+            storage_config,
+            keep_in_memory=analysis_config.params.keep_in_memory,
         )
 
         # Generate file paths that were created
@@ -132,45 +296,25 @@ class CategoryScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator)
 
     def _build_storage_config_for_category(
         self, category: str, analysis_config: Any, analysis_id: str
-    ) -> dict[str, Any]:
+    ) -> StorageConfig:
         """Build storage configuration for a specific category."""
         config = self.config_provider.get_config()
 
-        storage_config = {
-            "should_save": True,  # Always save for file-based analysis
-            "base_dir": config.paths.output_dir,
-            "category": category,
-            "filename_prefix": "coin_",
-            "type": analysis_id,  # PathGenerator expects "type", not "analysis_type"
-        }
-
-        # Add custom path template if specified
-        if hasattr(analysis_config, "path_template") and analysis_config.path_template:
-            storage_config["path_template"] = analysis_config.path_template
-
-        return storage_config
+        return StorageConfig(
+            should_save=True,  # Always save for file-based analysis
+            base_dir=config.paths.output_dir,
+            category=category,
+            filename_prefix="coin_",
+            analysis_type=analysis_id,
+            # Add custom path template if specified
+            path_template=getattr(analysis_config, "path_template", None) or None,
+        )
 
     def _generate_expected_file_paths(
-        self, urls: list[str], category: str, storage_config: dict[str, Any]
+        self, urls: list[str], category: str, storage_config: StorageConfig
     ) -> list[str]:
         """Generate the expected file paths where scraped data was saved."""
-        from datetime import datetime
-
-        file_paths = []
-        date_str = datetime.now().strftime("%Y%m%d")
-
-        # Create analysis config for path generation
-        analysis_config = {
-            "type": storage_config.get("type", "default"),
-            "path_template": storage_config.get("path_template"),
-        }
-
-        for url in urls:
-            # Use PathGenerator to generate consistent paths
-            file_path = self.path_generator.generate_scraped_data_path(
-                url=url, category=category, analysis_config=analysis_config, date_str=date_str
-            )
-
-            file_paths.append(str(file_path))
-
-        return file_paths
+        # Use PathGenerator to generate consistent paths
+        return self.path_generator.generate_scraped_data_paths(
+            urls, category=category, analysis_config=storage_config.to_analysis_config()
+        )
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import Any
 
 from mfa.config.settings import ConfigProvider
+from mfa.storage.storage_config import StorageConfig
 
 from ..factories import register_coordinator
 from ..interfaces import DataRequirement, IScrapingCoordinator
@@ -36,7 +37,7 @@ class TargetedScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator)
         Returns file paths for analysis instead of in-memory data.
         Uses configurable scraper type (API or Playwright).
         """
-        urls = requirement.urls
+        urls = self._unique_urls(requirement.urls)
         analysis_id = requirement.metadata.get("analysis_id", "default")
 
         # Read config directly for this analysis
@@ -58,7 +59,13 @@ class TargetedScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator)
             storage_config = self._build_storage_config_for_targeted(analysis_config, analysis_id)
 
             # Scrape and save to files using configured scraper type
-            results = self._scrape_urls_with_delay(urls, max_holdings, scraper_type, storage_config)
+            results = self._scrape_urls(
+                urls,
+                max_holdings,
+                scraper_type,
+                storage_config,
+                keep_in_memory=analysis_config.params.keep_in_memory,
+            )
 
             # Generate file paths that were created
             file_paths = self._generate_expected_file_paths(urls, storage_config)
@@ -78,47 +85,29 @@ class TargetedScrapingCoordinator(BaseScrapingCoordinator, IScrapingCoordinator)
 
     def _build_storage_config_for_targeted(
         self, analysis_config: Any, analysis_id: str
-    ) -> dict[str, Any]:
+    ) -> StorageConfig:
         """Build storage configuration for targeted scraping."""
         config = self.config_provider.get_config()
 
         # Use analysis_id directly, but map portfolio to portfolio folder
         analysis_type_value = "portfolio" if analysis_id == "portfolio" else analysis_id
 
-        storage_config = {
-            "should_save": True,
-            "base_dir": config.paths.output_dir,
+        return StorageConfig(
+            should_save=True,
+            base_dir=config.paths.output_dir,
             # For portfolio analysis we do not want a nested category folder
             # so keep category empty to make path: {output_dir}/{date}/{analysis_type}
-            "category": "",
-            "filename_prefix": "coin_",
-            "type": analysis_type_value,  # PathGenerator expects "type"
-        }
-
-        return storage_config
+            category="",
+            filename_prefix="coin_",
+            analysis_type=analysis_type_value,
+        )
 
     def _generate_expected_file_paths(
-        self, urls: list[str], storage_config: dict[str, Any]
+        self, urls: list[str], storage_config: StorageConfig
     ) -> list[str]:
         """Generate the expected file paths where scraped data was saved."""
-        from datetime import datetime
-
-        file_paths: list[str] = []
-        date_str = datetime.now().strftime("%Y%m%d")
-
-        # Create analysis config for path generation
-        analysis_config = {
-            "type": storage_config.get("type", "default"),
-            "path_template": storage_config.get("path_template"),
-        }
-
-        for url in urls:
-            file_path = self.path_generator.generate_scraped_data_path(
-                url=url,
-                category=storage_config.get("category", ""),
-                analysis_config=analysis_config,
-                date_str=date_str,
-            )
-            file_paths.append(str(file_path))
-
-        return file_paths
+        return self.path_generator.generate_scraped_data_paths(
+            urls,
+            category=storage_config.category,
+            analysis_config=storage_config.to_analysis_config(),
+        )
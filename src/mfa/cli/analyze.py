@@ -1,15 +1,42 @@
 from __future__ import annotations
 
 import argparse
+import sys
 
-# Import analyzers and coordinators to ensure they get registered
-import mfa.analysis.analyzers.holdings  # noqa: F401 - Registers holdings analyzer
-import mfa.analysis.analyzers.portfolio  # noqa: F401 - Registers portfolio analyzer
-import mfa.analysis.scraping.category_coordinator  # noqa: F401 - Registers category coordinator
-import mfa.analysis.scraping.targeted_coordinator  # noqa: F401 - Registers targeted coordinator
-from mfa.config.settings import create_config_provider
 from mfa.logging.logger import setup_logging
-from mfa.orchestration.analysis_orchestrator import AnalysisOrchestrator
+
+
+def _sniff_mode(argv: list[str]) -> str:
+    """
+    Cheaply detect informational invocations before building the full parser.
+
+    Args:
+        argv: Command-line arguments, excluding the program name
+
+    Returns:
+        "list", "status", or "full" when help or a real analysis run is requested
+    """
+    if "--help" in argv or "-h" in argv:
+        return "full"
+    if "--list" in argv or "-l" in argv:
+        return "list"
+    if "--status" in argv or "-s" in argv:
+        return "status"
+    return "full"
+
+
+def _parse_info_args(argv: list[str]) -> argparse.Namespace:
+    """Parse --list/--status invocations with a parser declaring only those flags."""
+    parser = argparse.ArgumentParser(prog="mfa-analyze")
+    parser.add_argument("--list", "-l", action="store_true")
+    parser.add_argument("--status", "-s", action="store_true")
+    parser.add_argument("--verbose", "-v", action="store_true")
+    parser.set_defaults(
+        analysis_type=None, category=None, date=None, analysis_only=False, force=False
+    )
+    # Execution-only options are irrelevant here, so unknown arguments are ignored
+    args, _ = parser.parse_known_args(argv)
+    return args
 
 
 def _parse_args() -> argparse.Namespace:
@@ -40,11 +67,24 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip scraping and run analysis on existing data only",
     )
+    parser.add_argument(
+        "--force",
+        "-f",
+        action="store_true",
+        help="Re-scrape funds even if they were already saved today",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
-    args = _parse_args()
+    argv = sys.argv[1:]
+    args = _parse_args() if _sniff_mode(argv) == "full" else _parse_info_args(argv)
+
+    # Validate analysis_type is provided for actual analysis
+    if not args.list and not args.status and not args.analysis_type:
+        print("❌ Error: analysis_type is required when not using --list or --status")
+        print("💡 Use 'mfa-analyze --help' for usage information")
+        sys.exit(1)
 
     # Setup logging based on verbosity
     if args.verbose:
@@ -53,20 +93,26 @@ def main() -> None:
         setup_logging()
 
     try:
+        # Heavy imports (pydantic, Playwright) are deferred until after argparse
+        # has handled --help and usage errors. Analyzers and coordinators are
+        # imported by their factories when first requested.
+        from mfa.config.settings import create_config_provider
+        from mfa.orchestration.analysis_orchestrator import AnalysisOrchestrator
+
         # Create configuration provider using dependency injection
         config_provider = create_config_provider()
+        if args.force:
+            config_provider.override_scraping(force_refresh=True)
 
-        # Ensure directories exist
-        config = config_provider.get_config()
-        config.ensure_directories()
+        # Only analysis runs write output; informational commands leave the filesystem alone
+        if not args.list and not args.status:
+            config_provider.get_config().ensure_directories()
 
         # Create orchestrator with injected config provider
         orchestrator = AnalysisOrchestrator(config_provider)
     except Exception as e:
         print(f"\n❌ Failed to initialize Mutual Fund Analyzer: {e}")
         print("💡 Check your configuration and try again.")
-        import sys
-
         sys.exit(1)
 
     # Handle informational commands
@@ -91,14 +137,6 @@ def main() -> None:
             print(f"  ❌ Could not retrieve status: {e}")
         return
 
-    # Validate analysis_type is provided for actual analysis
-    if not args.analysis_type:
-        print("❌ Error: analysis_type is required when not using --list or --status")
-        print("💡 Use 'mfa-analyze --help' for usage information")
-        import sys
-
-        sys.exit(1)
-
     # Main analysis execution
     try:
         print("🚀 Starting Mutual Fund Analysis...")
@@ -110,6 +148,8 @@ def main() -> None:
 
         if args.analysis_only:
             print("🔄 Analysis-only mode: skipping scraping")
+        elif args.force:
+            print("♻️  Force mode: re-scraping funds already saved today")
 
         orchestrator.run_analysis(args.analysis_type, args.date, args.analysis_only)
 
@@ -8,43 +8,64 @@ structure, providing type safety and IDE support without complex validation.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
-class PathsConfig(BaseModel):
+class _ConfigModel(BaseModel):
+    """Base for configuration models; loaded configs are shared, so fields are read-only."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class PathsConfig(_ConfigModel):
     """Directory paths configuration."""
 
     output_dir: str
     analysis_dir: str
 
 
-class ScrapingConfig(BaseModel):
+class ScrapingConfig(_ConfigModel):
     """Global scraping configuration."""
 
     headless: bool
     timeout_seconds: int
     delay_between_requests: float
     save_extracted_json: bool
-    default_scraper: str = "api"  # Default scraper type: "api" or "playwright"
+    default_scraper: str = "api"  # Default scraper type: "api", "playwright" or "hybrid"
+    max_concurrent_requests: int = 4  # Parallel requests for the API scraper
+    max_concurrent_browsers: int = 3  # Browsers used in parallel by the Playwright scraper
+    force_refresh: bool = False  # Re-scrape URLs already saved for today
+    # Page load event Playwright navigation waits for before extraction starts
+    page_wait_until: Literal["commit", "domcontentloaded", "load", "networkidle"] = (
+        "domcontentloaded"
+    )
+
 
+class OrchestrationConfig(_ConfigModel):
+    """Analysis orchestration configuration."""
 
-class DataRequirementsConfig(BaseModel):
+    # Run enabled analyses concurrently (scraping stays one at a time); disable to debug
+    parallel_analyses: bool = True
+
+
+class DataRequirementsConfig(_ConfigModel):
     """Data requirements for an analysis."""
 
     scraping_strategy: str
-    scraper_type: str = "api"  # Explicit scraper type: "api" or "playwright"
+    scraper_type: str = "api"  # Explicit scraper type: "api", "playwright" or "hybrid"
     categories: dict[str, list[str]] | None = None
     funds: list[dict[str, Any]] | None = None
 
 
-class AnalysisParamsConfig(BaseModel):
+class AnalysisParamsConfig(_ConfigModel):
     """Parameters for analysis configuration."""
 
     # Common parameters
     max_holdings: int | None = None
     exclude_from_analysis: list[str] | None = None
+    keep_in_memory: bool = False  # Keep full scraped documents alongside saved files
 
     # Holdings analysis specific
     max_companies_in_results: int | None = None
@@ -55,7 +76,7 @@ class AnalysisParamsConfig(BaseModel):
     chart_top_n: int | None = None
 
 
-class AnalysisConfig(BaseModel):
+class AnalysisConfig(_ConfigModel):
     """Configuration for a single analysis."""
 
     enabled: bool
@@ -63,16 +84,28 @@ class AnalysisConfig(BaseModel):
     params: AnalysisParamsConfig
 
 
-class MFAConfig(BaseModel):
+class MFAConfig(_ConfigModel):
     """Main configuration model for the MFA application."""
 
     paths: PathsConfig
     scraping: ScrapingConfig
     analyses: dict[str, AnalysisConfig]
+    orchestration: OrchestrationConfig = Field(default_factory=OrchestrationConfig)
+
+    _enabled_analyses: dict[str, AnalysisConfig] | None = PrivateAttr(default=None)
 
     def get_enabled_analyses(self) -> dict[str, AnalysisConfig]:
-        """Get only the enabled analyses."""
-        return {name: config for name, config in self.analyses.items() if config.enabled}
+        """
+        Get only the enabled analyses.
+
+        The result is computed once per config instance, since the configuration is
+        frozen after loading. Callers must treat the returned dict as read-only.
+        """
+        if self._enabled_analyses is None:
+            self._enabled_analyses = {
+                name: config for name, config in self.analyses.items() if config.enabled
+            }
+        return self._enabled_analyses
 
     def get_analysis(self, name: str) -> AnalysisConfig | None:
         """Get a specific analysis configuration by name."""
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import os
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -12,6 +14,68 @@ from mfa.core.exceptions import ConfigurationError, create_config_error
 
 from .models import AnalysisConfig, MFAConfig
 
+# Prefer the libyaml-backed loader; it parses the same documents as SafeLoader, faster
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+
+
+def _substitute_env_var(match: re.Match[str]) -> str:
+    """Return the value of the matched ${VAR}, or the placeholder itself when unset."""
+    value = os.environ.get(match.group(1))
+    return match.group(0) if value is None else value
+
+
+def _resolve_env_var_string(value: str) -> str:
+    """Substitute ${VAR} references in one string; unset variables keep their placeholder."""
+    if "${" not in value:
+        return value
+    return _ENV_VAR_PATTERN.sub(_substitute_env_var, value)
+
+
+# .env files already loaded into os.environ; each is read once per process
+_LOADED_DOTENV_PATHS: set[Path] = set()
+
+
+@dataclass(slots=True)
+class _CachedConfig:
+    """Parsed YAML for one file version, plus the last model validated from it."""
+
+    raw: dict[str, Any]
+    resolved: dict[str, Any] | None = None
+    typed: MFAConfig | None = None
+
+
+# Keyed by (resolved path, mtime_ns, size); raw documents are never mutated
+_CONFIG_CACHE: dict[tuple[str, int, int], _CachedConfig] = {}
+
+
+def _load_yaml_cached(config_path: Path) -> _CachedConfig:
+    """
+    Read and parse a YAML file, reusing the parsed result while the file is unchanged.
+
+    Environment variables are resolved by the caller on every load, so the cache only
+    holds the raw parsed document and the model last built from it.
+
+    Args:
+        config_path: Path to the YAML file
+
+    Returns:
+        Cache entry whose raw document is an empty dict for an empty file
+    """
+    stat = config_path.stat()
+    key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    entry = _CONFIG_CACHE.get(key)
+    if entry is None:
+        with open(config_path, encoding="utf-8") as fh:
+            entry = _CachedConfig(raw=yaml.load(fh, Loader=_YamlLoader) or {})
+        _CONFIG_CACHE[key] = entry
+    return entry
+
 
 class ConfigProvider:
     """
@@ -28,7 +92,9 @@ class ConfigProvider:
         Args:
             config_path: Optional path to config file. If None, uses default location.
         """
-        self.config_path = config_path or (Path.cwd() / "config" / "config.yaml")
+        # Working directory is read once; it locates both the default config and .env
+        self._base_dir = Path.cwd()
+        self.config_path = config_path or (self._base_dir / "config" / "config.yaml")
         self._raw_config: dict[str, Any] | None = None
         self._typed_config: MFAConfig | None = None
 
@@ -37,37 +103,70 @@ class ConfigProvider:
 
     def _load_config(self) -> None:
         """Load configuration from YAML file with environment variable resolution."""
-        env_path = Path.cwd() / ".env"
-        if env_path.exists():
+        env_path = self._base_dir / ".env"
+        if env_path not in _LOADED_DOTENV_PATHS and env_path.exists():
             load_dotenv(env_path)
+            _LOADED_DOTENV_PATHS.add(env_path)
 
         if not self.config_path.exists():
             raise create_config_error(
                 f"Configuration file not found: {self.config_path}", str(self.config_path)
             )
 
-        with open(self.config_path, encoding="utf-8") as fh:
-            raw = yaml.safe_load(fh) or {}
+        cached = _load_yaml_cached(self.config_path)
+        resolved = self._resolve_env_vars(cached.raw)
 
-        self._raw_config = self._resolve_env_vars(raw)
+        # Create typed configuration model, reusing the last one built from the same
+        # file version when environment variables resolved to the same values
+        if cached.typed is None or not (cached.resolved is resolved or cached.resolved == resolved):
+            cached.typed = MFAConfig(**resolved)
+            cached.resolved = resolved
 
-        # Create typed configuration model
-        self._typed_config = MFAConfig(**self._raw_config)
+        self._raw_config = resolved
+        self._typed_config = cached.typed
 
     def _resolve_env_vars(self, obj: Any) -> Any:
-        """Recursively resolve environment variables in configuration."""
-        if isinstance(obj, dict):
-            return {k: self._resolve_env_vars(v) for k, v in obj.items()}
-        if isinstance(obj, list):
-            return [self._resolve_env_vars(v) for v in obj]
+        """
+        Resolve environment variables in configuration.
+
+        The tree is walked iteratively and only strings containing "${" are
+        substituted. Containers are shallow-copied only along paths to a changed
+        string; everything else is returned as-is, so the result may share structure
+        with the input and must not be mutated.
+        """
         if isinstance(obj, str):
-            pattern = r"\$\{([^}]+)\}"
-            for var in re.findall(pattern, obj):
-                val = os.getenv(var)
-                if val is not None:
-                    obj = obj.replace(f"${{{var}}}", val)
+            return _resolve_env_var_string(obj)
+        if not isinstance(obj, dict | list):
+            return obj
+
+        # Collect substitutions first so unchanged documents are never copied
+        substitutions: list[tuple[tuple[Any, ...], str]] = []
+        stack: list[tuple[Any, tuple[Any, ...]]] = [(obj, ())]
+        while stack:
+            node, path = stack.pop()
+            for key, value in node.items() if isinstance(node, dict) else enumerate(node):
+                if isinstance(value, dict | list):
+                    stack.append((value, (*path, key)))
+                elif isinstance(value, str) and "${" in value:
+                    resolved = _resolve_env_var_string(value)
+                    if resolved != value:
+                        substitutions.append(((*path, key), resolved))
+
+        if not substitutions:
             return obj
-        return obj
+
+        root = obj.copy()
+        copies: dict[tuple[Any, ...], Any] = {(): root}
+        for path, resolved in substitutions:
+            parent = root
+            for depth in range(1, len(path)):
+                child = copies.get(path[:depth])
+                if child is None:
+                    child = copies[path[:depth]] = parent[path[depth - 1]].copy()
+                    parent[path[depth - 1]] = child
+                parent = child
+            parent[path[-1]] = resolved
+        return root
 
     def get_config(self) -> MFAConfig:
         """Get the complete typed configuration model."""
@@ -75,12 +174,26 @@ class ConfigProvider:
             raise ConfigurationError("Configuration not loaded - call load_config() first")
         return self._typed_config
 
+    def override_scraping(self, **settings: Any) -> None:
+        """
+        Replace scraping settings for this provider only, e.g. from command-line flags.
+
+        The loaded model is frozen and shared with other providers reading the same
+        file, so this provider gets an updated copy instead.
+
+        Args:
+            **settings: ScrapingConfig fields to override
+        """
+        config = self.get_config()
+        scraping = config.scraping.model_copy(update=settings)
+        self._typed_config = config.model_copy(update={"scraping": scraping})
+
     def get_analysis_config(self, analysis_name: str) -> AnalysisConfig | None:
         """Get configuration for a specific analysis."""
         return self.get_config().get_analysis(analysis_name)
 
     def get_enabled_analyses(self) -> dict[str, AnalysisConfig]:
-        """Get all enabled analysis configurations."""
+        """Get all enabled analysis configurations (memoized on the loaded config)."""
         return self.get_config().get_enabled_analyses()
 
 
@@ -96,12 +209,7 @@ def create_config_provider(config_path: Path | None = None) -> ConfigProvider:
 
 
 # For backwards compatibility during transition - will be removed
-_default_provider: ConfigProvider | None = None
-
-
+@lru_cache(maxsize=1)
 def get_default_config_provider() -> ConfigProvider:
     """Get default config provider (temporary compatibility function)."""
-    global _default_provider
-    if _default_provider is None:
-        _default_provider = ConfigProvider()
-    return _default_provider
+    return ConfigProvider()
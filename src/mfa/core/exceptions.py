@@ -145,11 +145,7 @@ def create_scraping_error(
     message: str, url: str | None = None, fund_name: str | None = None
 ) -> ScrapingError:
     """Create a scraping error with context."""
-    context = {}
-    if url:
-        context["url"] = url
-    if fund_name:
-        context["fund_name"] = fund_name
+    context = {k: v for k, v in (("url", url), ("fund_name", fund_name)) if v}
     return ScrapingError(message, context)
 
 
@@ -157,11 +153,7 @@ def create_storage_error(
     message: str, file_path: str | None = None, operation: str | None = None
 ) -> StorageError:
     """Create a storage error with context."""
-    context = {}
-    if file_path:
-        context["file_path"] = file_path
-    if operation:
-        context["operation"] = operation
+    context = {k: v for k, v in (("file_path", file_path), ("operation", operation)) if v}
     return StorageError(message, context)
 
 
@@ -169,9 +161,5 @@ def create_analysis_error(
     message: str, analysis_type: str | None = None, category: str | None = None
 ) -> AnalysisError:
     """Create an analysis error with context."""
-    context = {}
-    if analysis_type:
-        context["analysis_type"] = analysis_type
-    if category:
-        context["category"] = category
+    context = {k: v for k, v in (("analysis_type", analysis_type), ("category", category)) if v}
     return AnalysisError(message, context)
@@ -1,24 +1,52 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, PrivateAttr, field_validator
 
 # NOTE: This file defines two sets of models:
 # 1) Extraction models used for per-fund JSON artifacts
 # 2) Analysis models used for per-category analysis outputs
+#
+# Records are frozen: they are built once per scraped fund or analysis result and
+# never modified, so instances can be shared safely.
 
 
 # --- Extraction models ---
 
 
 class TopHolding(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     rank: int
     company_name: str
-    allocation_percentage: str
+    # Stored as a number (5.25 for "5.25%") so analyses never re-parse it
+    allocation_percentage: float
+
+    @field_validator("allocation_percentage", mode="before")
+    @classmethod
+    def _parse_percentage_text(cls, value: object) -> object:
+        """
+        Accept scraped text such as "5.25%" alongside plain numbers.
+
+        Pages show placeholders like "-" or "N/A" for holdings without a published
+        weight; like DataProcessorUtils.parse_percentage, those count as 0.0 rather
+        than rejecting the whole fund.
+        """
+        if value is None:
+            return 0.0
+        if isinstance(value, str):
+            try:
+                return float(value.strip().rstrip("%").strip())
+            except ValueError:
+                return 0.0
+        return value
 
 
 class FundInfo(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     fund_name: str = ""
     current_nav: str = ""
     cagr: str = ""
@@ -30,27 +58,48 @@ class FundInfo(BaseModel):
 
 
 class FundData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     fund_info: FundInfo
     top_holdings: list[TopHolding] = Field(default_factory=list)
 
 
 class ExtractedFundDocument(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     schema_version: str = "1.0"
     extraction_timestamp: datetime
     source_url: HttpUrl
     provider: str
     data: FundData
 
+    _json_dump: dict[str, Any] | None = PrivateAttr(default=None)
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """
+        Dump the document in JSON mode, computing the dump only once.
+
+        The document is frozen, so the dump is shared between saving and returning
+        it; callers must not mutate the result.
+        """
+        if self._json_dump is None:
+            self._json_dump = self.model_dump(mode="json")
+        return self._json_dump
+
 
 # --- Analysis models ---
 
 
 class FundRef(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str
     aum: str = ""
 
 
 class CompanyStat(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     company: str
     fund_count: int
     total_weight: float
@@ -59,6 +108,8 @@ class CompanyStat(BaseModel):
 
 
 class CategoryAnalysis(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     schema_version: str = "1.0"
     total_files: int
     total_funds: int
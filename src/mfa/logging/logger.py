@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from pathlib import Path
 
 from loguru import logger
@@ -8,7 +9,9 @@ from loguru import logger
 def setup_logging(log_dir: str | Path = "outputs") -> None:
     Path(log_dir).mkdir(parents=True, exist_ok=True)
     logger.remove()
-    logger.add(lambda msg: print(msg, end=""))
+    # Stream sink rather than a print() callback: loguru writes formatted records
+    # straight to the stream. Kept synchronous so it interleaves with CLI prints.
+    logger.add(sys.stdout)
     logger.add(
         Path(log_dir) / "mfa.log",
         rotation="10 MB",
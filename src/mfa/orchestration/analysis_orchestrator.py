@@ -7,21 +7,22 @@ between scraping (save to files) and analysis (read from files) phases.
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
-
-# Import analyzers and coordinators to ensure they get registered
-import mfa.analysis.analyzers.holdings  # noqa: F401 - Registers holdings analyzer
-import mfa.analysis.analyzers.portfolio  # noqa: F401 - Registers portfolio analyzer
-import mfa.analysis.scraping.category_coordinator  # noqa: F401 - Registers category coordinator
-import mfa.analysis.scraping.targeted_coordinator  # noqa: F401 - Registers targeted coordinator
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, NoReturn
+
 from mfa.analysis.factories import AnalyzerFactory, ScrapingCoordinatorFactory
-from mfa.analysis.interfaces import DataRequirement
-from mfa.config.models import AnalysisConfig
+from mfa.analysis.interfaces import DataRequirement, IAnalyzer
 from mfa.config.settings import ConfigProvider
 from mfa.core.exceptions import AnalysisError, OrchestrationError
 from mfa.logging.logger import logger
 
+# Errors already describing an analysis failure; anything else is wrapped
+_PASSTHROUGH_ERRORS = (OrchestrationError, AnalysisError)
+
 
 class AnalysisOrchestrator:
     """
@@ -30,6 +31,11 @@ class AnalysisOrchestrator:
     Uses dependency injection for better testability and flexibility.
     """
 
+    __slots__ = ("config_provider", "_config", "_scrape_lock")
+
+    # Threads used to list category directories concurrently in analysis-only runs
+    DISCOVERY_WORKERS = 8
+
     def __init__(self, config_provider: ConfigProvider):
         """
         Initialize orchestrator with injected configuration provider.
@@ -38,6 +44,11 @@ class AnalysisOrchestrator:
             config_provider: Configuration provider instance
         """
         self.config_provider = config_provider
+        # The loaded configuration does not change during a run; fetch it once
+        self._config = config_provider.get_config()
+        # One analysis scrapes at a time so parallel analyses stay within the
+        # configured request rate and browser count
+        self._scrape_lock = threading.Lock()
 
     def run_analysis(
         self, analysis_type: str | None = None, date: str | None = None, analysis_only: bool = False
@@ -55,58 +66,104 @@ class AnalysisOrchestrator:
         logger.info("🚀 Starting analysis orchestration")
 
         # Get enabled analyses from config
-        config = self.config_provider.get_config()
+        config = self._config
         enabled_analyses = config.get_enabled_analyses()
 
         if analysis_type:
             # Run specific analysis
-            if analysis_type in enabled_analyses:
-                analyses_to_run = {analysis_type: enabled_analyses[analysis_type]}
-            else:
+            if analysis_type not in enabled_analyses:
                 raise OrchestrationError(
                     f"Analysis '{analysis_type}' not found or not enabled",
                     {"analysis_type": analysis_type},
                 )
+            analysis_ids: tuple[str, ...] = (analysis_type,)
         else:
-            # Run all enabled analyses
-            analyses_to_run = enabled_analyses
+            # Run all enabled analyses; only the ids are needed, as analyzers read
+            # their own config, so the work list is materialized once
+            analysis_ids = tuple(enabled_analyses)
 
-        if not analyses_to_run:
+        if not analysis_ids:
             logger.warning("No analyses to run")
             return
 
-        logger.info(f"📋 Analyses to run: {list(analyses_to_run.keys())}")
+        logger.info("📋 Analyses to run: {}", list(analysis_ids))
 
-        # Run each analysis
-        for analysis_id, analysis_config in analyses_to_run.items():
-            self._run_single_analysis(analysis_id, analysis_config, date, analysis_only)
+        # Resolve the date once so every analysis in the run reads and writes the same day
+        run_date = date or self._get_current_date()
 
-    def _run_single_analysis(
-        self,
-        analysis_id: str,
-        analysis_config: AnalysisConfig,
-        date: str | None,
-        analysis_only: bool = False,
+        if self._config.orchestration.parallel_analyses and len(analysis_ids) > 1:
+            self._run_analyses_in_parallel(analysis_ids, run_date, analysis_only)
+        else:
+            self._run_analyses_pipelined(analysis_ids, run_date, analysis_only)
+
+    def _run_analyses_in_parallel(
+        self, analysis_ids: tuple[str, ...], date: str, analysis_only: bool
     ) -> None:
         """
-        Run a single analysis with simplified workflow.
+        Run independent analyses concurrently, one thread per analysis.
+
+        Analyses write to separate folders, so one analysis can analyze while
+        another scrapes. Scraping itself stays serialized (see
+        _scrape_and_save_data). The first failure is re-raised once every
+        analysis has finished.
+        """
+        with ThreadPoolExecutor(
+            max_workers=len(analysis_ids), thread_name_prefix="mfa-analysis"
+        ) as pool:
+            futures = [
+                pool.submit(self._run_single_analysis, analysis_id, date, analysis_only)
+                for analysis_id in analysis_ids
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+    def _run_analyses_pipelined(
+        self, analysis_ids: tuple[str, ...], date: str, analysis_only: bool
+    ) -> None:
+        """Run analyses in order, analyzing each in the background while the next one scrapes."""
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="mfa-analyze") as analysis_pool:
+            pending: Future[None] | None = None
+            for analysis_id in analysis_ids:
+                analyzer, scraped_data_info = self._prepare_analysis(
+                    analysis_id, date, analysis_only
+                )
+                if pending is not None:
+                    pending.result()
+                pending = analysis_pool.submit(
+                    self._complete_analysis, analysis_id, analyzer, scraped_data_info, date
+                )
+            if pending is not None:
+                pending.result()
+
+    def _run_single_analysis(self, analysis_id: str, date: str, analysis_only: bool) -> None:
+        """Prepare and complete one analysis end to end."""
+        analyzer, scraped_data_info = self._prepare_analysis(analysis_id, date, analysis_only)
+        self._complete_analysis(analysis_id, analyzer, scraped_data_info, date)
+
+    def _prepare_analysis(
+        self, analysis_id: str, date: str, analysis_only: bool = False
+    ) -> tuple[IAnalyzer, dict[str, Any]]:
+        """
+        Create the analyzer for an analysis and gather its input files.
 
         1. Create analyzer (reads own config)
         2. Get requirements (analyzer reads config)
         3. Scrape and save to files (unless analysis_only=True)
-        4. Analyze from files
+
+        Returns:
+            tuple: (analyzer, scraped data info with file paths)
         """
         try:
-            logger.info(f"\n📊 Starting analysis: {analysis_id}")
-
             # 1. Create analyzer with injected config provider
             analyzer = AnalyzerFactory.create_analyzer(analysis_id, self.config_provider)
 
             # 2. Get data requirements (analyzer reads config directly)
             requirements = analyzer.get_data_requirements()
             logger.info(
-                f"📋 Data requirements: {requirements.strategy.value} strategy, "
-                f"{len(requirements.urls)} URLs"
+                "\n📊 Starting analysis: {}\n📋 Data requirements: {} strategy, {} URLs",
+                analysis_id,
+                requirements.strategy.value,
+                len(requirements.urls),
             )
 
             # 3. Scrape and save to files (unless analysis_only=True)
@@ -117,32 +174,53 @@ class AnalysisOrchestrator:
             else:
                 scraped_data_info = self._scrape_and_save_data(requirements, date)
 
+            return analyzer, scraped_data_info
+
+        except Exception as e:
+            self._raise_analysis_failure(analysis_id, e)
+
+    def _complete_analysis(
+        self,
+        analysis_id: str,
+        analyzer: IAnalyzer,
+        scraped_data_info: dict[str, Any],
+        date: str,
+    ) -> None:
+        """Run the analyzer over the gathered files (step 4) and log the outcome."""
+        try:
             # 4. Analyze from files (not in-memory data)
-            result = analyzer.analyze(scraped_data_info, date or self._get_current_date())
+            result = analyzer.analyze(scraped_data_info, date)
 
-            logger.info(f"✅ Analysis '{analysis_id}' completed successfully")
-            logger.info(f"   📁 Output files: {len(result.output_paths)}")
-            logger.info(f"   📈 Summary: {result.summary}")
+            # One record per outcome keeps lines together when analyses run in parallel
+            logger.info(
+                "✅ Analysis '{}' completed successfully\n   📁 Output files: {}\n   📈 Summary: {}",
+                analysis_id,
+                len(result.output_paths),
+                result.summary,
+            )
 
         except Exception as e:
-            logger.error(f"❌ Analysis '{analysis_id}' failed: {e}")
-            logger.debug("Full traceback:", exc_info=True)
-            if isinstance(e, OrchestrationError | AnalysisError):
-                raise  # Re-raise our custom exceptions
-            else:
-                # Wrap unexpected exceptions
-                raise OrchestrationError(
-                    f"Unexpected error during analysis '{analysis_id}': {e}",
-                    {"analysis_type": analysis_id},
-                ) from e
-
-    def _scrape_and_save_data(
-        self, requirements: DataRequirement, date: str | None
-    ) -> dict[str, Any]:
+            self._raise_analysis_failure(analysis_id, e)
+
+    def _raise_analysis_failure(self, analysis_id: str, error: Exception) -> NoReturn:
+        """Log an analysis failure and raise it, wrapping unexpected exceptions."""
+        logger.error("❌ Analysis '{}' failed: {}", analysis_id, error)
+        logger.debug("Full traceback:", exc_info=True)
+        if isinstance(error, _PASSTHROUGH_ERRORS):
+            raise error  # Re-raise our custom exceptions
+        # Wrap unexpected exceptions
+        raise OrchestrationError(
+            f"Unexpected error during analysis '{analysis_id}': {error}",
+            {"analysis_type": analysis_id},
+        ) from error
+
+    def _scrape_and_save_data(self, requirements: DataRequirement, date: str) -> dict[str, Any]:
         """
         Scrape data and save to files.
 
-        Returns file paths and metadata instead of in-memory data.
+        Returns file paths and metadata instead of in-memory data. Each coordinator
+        paces its own requests and launches its own browsers, so concurrent
+        analyses take turns here rather than multiplying the load on the site.
         """
         try:
             coordinator = ScrapingCoordinatorFactory.create_coordinator(
@@ -150,10 +228,11 @@ class AnalysisOrchestrator:
             )
 
             # Coordinator saves files and returns file path info + metadata
-            return coordinator.scrape_for_requirement(requirements)
+            with self._scrape_lock:
+                return coordinator.scrape_for_requirement(requirements)
 
         except Exception as e:
-            logger.error(f"❌ Scraping failed: {e}")
+            logger.error("❌ Scraping failed: {}", e)
             if isinstance(e, OrchestrationError):
                 raise  # Re-raise our custom exceptions
             else:
@@ -161,8 +240,9 @@ class AnalysisOrchestrator:
                 raise OrchestrationError(f"Unexpected error during scraping: {e}") from e
 
     def _get_current_date(self) -> str:
-        """Get current date string."""
-        return datetime.now().strftime("%Y%m%d")
+        """Get current local date string (YYYYMMDD) without building a datetime."""
+        now = time.localtime()
+        return f"{now.tm_year:04d}{now.tm_mon:02d}{now.tm_mday:02d}"
 
     def list_available_analyses(self) -> list[str]:
         """List all available analysis types."""
@@ -170,7 +250,7 @@ class AnalysisOrchestrator:
 
     def get_analysis_status(self) -> dict[str, dict[str, Any]]:
         """Get status of all configured analyses."""
-        config = self.config_provider.get_config()
+        config = self._config
         status = {}
 
         for name, analysis_config in config.analyses.items():
@@ -183,22 +263,20 @@ class AnalysisOrchestrator:
         return status
 
     def _discover_existing_data_files(
-        self, requirements: DataRequirement, date: str | None
+        self, requirements: DataRequirement, date: str
     ) -> dict[str, Any]:
         """
         Discover existing scraped data files for analysis-only mode.
 
         Args:
             requirements: Data requirements from analyzer
-            date: Optional date string for file discovery
+            date: Date string (YYYYMMDD) of the run whose files are discovered
 
         Returns:
             Dict with strategy and file_paths for analysis
         """
-        from pathlib import Path
-
-        config = self.config_provider.get_config()
-        date_str = date or self._get_current_date()
+        config = self._config
+        date_str = date
 
         scraped_data_info: dict[str, Any] = {
             "strategy": requirements.strategy.value,
@@ -208,43 +286,106 @@ class AnalysisOrchestrator:
 
         # Determine analysis folder from metadata (e.g., 'holdings', 'portfolio')
         analysis_folder = requirements.metadata.get("analysis_id", "holdings")
+        analysis_dir = Path(config.paths.output_dir) / date_str / analysis_folder
 
         if requirements.strategy.value == "categories":
             # Discover files organized by categories
             categories = requirements.metadata.get("categories", {})
 
-            for category, _urls in categories.items():
-                category_files = []
-                base_dir = Path(config.paths.output_dir) / date_str / analysis_folder / category
+            # One scan of the analysis folder tells which category directories exist,
+            # so missing categories cost no syscalls of their own
+            existing_dirs = self._list_subdirectories(analysis_dir)
+            present = [category for category in categories if category in existing_dirs]
+
+            # Directory listings are independent I/O; list them concurrently so slow
+            # filesystems cost the slowest category rather than the sum of all
+            max_workers = max(1, min(self.DISCOVERY_WORKERS, len(present)))
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="mfa-discover"
+            ) as pool:
+                listings = dict(
+                    zip(
+                        present,
+                        pool.map(self._list_json_files, [existing_dirs[c] for c in present]),
+                        strict=True,
+                    )
+                )
 
-                if base_dir.exists():
-                    # Find all JSON files in this category directory
-                    json_files = list(base_dir.glob("*.json"))
-                    category_files = [str(f) for f in json_files]
-                    logger.debug(f"📁 Found {len(category_files)} files for category '{category}'")
+            # Messages use loguru's lazy arguments, so suppressed levels format nothing
+            for category in categories:
+                category_files = listings.get(category)
+                if category_files is not None:
+                    logger.debug(
+                        "📁 Found {} files for category '{}'", len(category_files), category
+                    )
                 else:
                     logger.warning(
-                        f"📁 No data directory found for category '{category}': {base_dir}"
+                        "📁 No data directory found for category '{0}': {1}{2}{0}",
+                        category,
+                        analysis_dir,
+                        os.sep,
                     )
 
-                scraped_data_info["file_paths"][category] = category_files
+                scraped_data_info["file_paths"][category] = category_files or []
 
         elif requirements.strategy.value == "targeted_funds":
             # Discover files for targeted strategy under analysis folder
-            base_dir = Path(config.paths.output_dir) / date_str / analysis_folder
+            base_dir = analysis_dir
 
-            if base_dir.exists():
-                json_files = list(base_dir.glob("*.json"))
-                scraped_data_info["file_paths"]["targeted"] = [str(f) for f in json_files]
-                logger.debug(f"📁 Found {len(json_files)} targeted files in '{base_dir}'")
+            json_files = self._list_json_files(base_dir)
+
+            if json_files is not None:
+                logger.debug("📁 Found {} targeted files in '{}'", len(json_files), base_dir)
             else:
-                logger.warning(f"📁 No data directory found for targeted strategy: {base_dir}")
-                scraped_data_info["file_paths"]["targeted"] = []
+                logger.warning("📁 No data directory found for targeted strategy: {}", base_dir)
+
+            scraped_data_info["file_paths"]["targeted"] = json_files or []
 
-        file_paths_dict = scraped_data_info["file_paths"]
-        total_files = sum(
-            len(files) for files in file_paths_dict.values() if isinstance(files, list)
-        )
-        logger.info(f"📁 Discovered {total_files} existing data files for analysis")
+        # Every value is a list of paths, assigned above
+        total_files = sum(map(len, scraped_data_info["file_paths"].values()))
+        logger.info("📁 Discovered {} existing data files for analysis", total_files)
 
         return scraped_data_info
+
+    @staticmethod
+    def _list_subdirectories(directory: Path) -> dict[str, str]:
+        """
+        Map the names of a directory's immediate subdirectories to their paths.
+
+        Args:
+            directory: Directory to scan (not recursive)
+
+        Returns:
+            Subdirectory name to path string; empty if the directory does not exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name: entry.path for entry in entries if entry.is_dir()}
+        except (FileNotFoundError, NotADirectoryError):
+            return {}
+
+    @staticmethod
+    def _list_json_files(directory: str | Path) -> list[str] | None:
+        """
+        List the JSON files directly inside a directory.
+
+        Uses a single os.scandir pass, whose entries carry their file type, rather
+        than an exists() check followed by a glob that stats every entry.
+
+        Args:
+            directory: Directory to scan (not recursive)
+
+        Returns:
+            JSON file paths as strings, or None if the directory does not exist
+        """
+        try:
+            with os.scandir(directory) as entries:
+                return [
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith(".json")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            return None
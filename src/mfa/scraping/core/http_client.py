@@ -7,9 +7,12 @@ and proper error management for fetching mutual fund data from APIs.
 
 from __future__ import annotations
 
+import random
+import threading
 import time
 from typing import Any
 
+import orjson
 import requests
 from loguru import logger
 from requests.adapters import HTTPAdapter
@@ -17,6 +20,20 @@ from requests.exceptions import ConnectionError, HTTPError, RequestException, Ti
 from urllib3.util.retry import Retry
 
 
+class _JitteredRetry(Retry):
+    """
+    Retry policy that randomizes each backoff between zero and the exponential delay.
+
+    Parallel workers failing together would otherwise all retry at the same
+    instants ("full jitter"). A Retry-After header on 429/503 responses still
+    takes precedence over the computed backoff.
+    """
+
+    def get_backoff_time(self) -> float:
+        """Return a random delay up to the standard exponential backoff."""
+        return random.uniform(0, super().get_backoff_time())
+
+
 class HTTPClient:
     """Robust HTTP client with retry logic and timeout handling."""
 
@@ -26,6 +43,7 @@ class HTTPClient:
         max_retries: int = 3,
         backoff_factor: float = 0.5,
         status_forcelist: list[int] | None = None,
+        pool_maxsize: int = 10,
     ) -> None:
         """
         Initialize HTTP client with retry configuration.
@@ -35,28 +53,38 @@ class HTTPClient:
             max_retries: Maximum number of retry attempts
             backoff_factor: Backoff factor for retries
             status_forcelist: HTTP status codes to retry on
+            pool_maxsize: Keep-alive connections kept per host; should be at least
+                the number of threads sharing this client
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
-        self.status_forcelist = status_forcelist or [500, 502, 503, 504]
+        self.status_forcelist = status_forcelist or [429, 500, 502, 503, 504]
+        self.pool_maxsize = pool_maxsize
 
         self._session = self._create_session()
 
+        # Shared across threads so concurrent callers still honour the request delay
+        self._rate_lock = threading.Lock()
+        self._next_request_at = 0.0
+
     def _create_session(self) -> requests.Session:
         """Create a requests session with retry strategy."""
         session = requests.Session()
 
-        # Configure retry strategy
-        retry_strategy = Retry(
+        # Configure retry strategy; rate-limited responses wait for their Retry-After
+        retry_strategy = _JitteredRetry(
             total=self.max_retries,
             status_forcelist=self.status_forcelist,
             backoff_factor=self.backoff_factor,
             allowed_methods=["GET"],  # Only retry GET requests
+            respect_retry_after_header=True,
         )
 
-        # Mount adapter with retry strategy
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Mount adapter with retry strategy. Connections are kept alive and reused;
+        # a pool smaller than the number of concurrent callers would discard and
+        # re-open (re-handshake) connections under parallel scraping.
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=self.pool_maxsize)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -86,16 +114,16 @@ class HTTPClient:
             HTTPClientError: If request fails after retries
         """
         try:
-            logger.debug(f"🌐 Fetching JSON from: {url}")
+            logger.debug("🌐 Fetching JSON from: {}", url)
 
             response = self._session.get(url, timeout=self.timeout, **kwargs)
 
             # Raise exception for bad status codes
             response.raise_for_status()
 
-            # Parse JSON response
-            json_data: dict[str, Any] = response.json()
-            logger.debug(f"✅ Successfully fetched {len(str(json_data))} bytes of JSON data")
+            # Parse JSON response straight from the raw bytes
+            json_data: dict[str, Any] = orjson.loads(response.content)
+            logger.debug("✅ Successfully fetched {} bytes of JSON data", len(response.content))
 
             return json_data
 
@@ -114,7 +142,7 @@ class HTTPClient:
             logger.error(error_msg)
             raise HTTPClientError(error_msg) from e
 
-        except ValueError as e:  # JSON decode error
+        except ValueError as e:  # JSON decode error (orjson.JSONDecodeError)
             error_msg = f"Invalid JSON response from: {url}"
             logger.error(error_msg)
             raise HTTPClientError(error_msg) from e
@@ -128,20 +156,33 @@ class HTTPClient:
         """
         Perform GET request with delay (for rate limiting).
 
+        Request start times are spaced at least `delay` seconds apart across all
+        threads using this client, while responses can still be awaited in parallel.
+
         Args:
             url: URL to fetch
-            delay: Delay in seconds before request
+            delay: Minimum seconds between the start of consecutive requests
             **kwargs: Additional arguments passed to get_json()
 
         Returns:
             JSON response as dictionary
         """
         if delay > 0:
-            logger.debug(f"⏳ Waiting {delay}s before request...")
-            time.sleep(delay)
+            wait_seconds = self._reserve_request_slot(delay)
+            if wait_seconds > 0:
+                logger.debug("⏳ Waiting {:.2f}s before request...", wait_seconds)
+                time.sleep(wait_seconds)
 
         return self.get_json(url, **kwargs)
 
+    def _reserve_request_slot(self, delay: float) -> float:
+        """Claim the next request start time and return how long to wait for it."""
+        with self._rate_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_request_at)
+            self._next_request_at = start_at + delay
+        return start_at - now
+
     def close(self) -> None:
         """Close the HTTP session."""
         if self._session:
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Iterable
-from typing import Any
+from collections.abc import Callable, Iterable
+from typing import Any, Literal, TypeVar
+from weakref import WeakKeyDictionary
 
 from loguru import logger
 from playwright.sync_api import (
@@ -19,6 +20,16 @@ from playwright.sync_api import (
     TimeoutError as PwTimeoutError,
 )
 
+from mfa.storage.storage_config import StorageConfig
+
+# Page load event navigation waits for; see Page.goto(wait_until=...)
+WaitUntil = Literal["commit", "domcontentloaded", "load", "networkidle"]
+
+T = TypeVar("T")
+
+# Requests aborted when resource blocking is on; nothing scraped depends on them
+BLOCKED_RESOURCES_GLOB = "**/*.{png,jpg,jpeg,gif,webp,svg,ico,woff,woff2,ttf,otf}"
+
 
 class PlaywrightSession:
     def __init__(
@@ -26,28 +37,42 @@ class PlaywrightSession:
         headless: bool = True,
         nav_timeout_ms: int = 30000,
         viewport: ViewportSize | None = None,
+        wait_until: WaitUntil = "domcontentloaded",
+        block_resources: bool = True,
     ) -> None:
         self._headless = headless
         self._timeout = nav_timeout_ms
+        # Scrapers wait for the elements they read, so navigation only needs the DOM;
+        # "networkidle" can hold every URL until the timeout on pages that keep polling
+        self._wait_until: WaitUntil = wait_until
         self._viewport = viewport or ViewportSize(width=1440, height=2200)
+        self._block_resources = block_resources
         self._p: Playwright | None = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._page: Page | None = None
 
+    @property
+    def is_open(self) -> bool:
+        return self._p is not None
+
     def open(self) -> None:
         if self._p is not None:
             return
         self._p = sync_playwright().start()
         self._browser = self._p.chromium.launch(headless=self._headless)
         self._context = self._browser.new_context(viewport=self._viewport)
+        if self._block_resources:
+            self._context.route(BLOCKED_RESOURCES_GLOB, lambda route: route.abort())
         self._page = self._context.new_page()
 
     def goto(self, url: str) -> Page:
         assert self._page is not None
         try:
-            self._page.goto(url, timeout=self._timeout, wait_until="networkidle")
+            self._page.goto(url, timeout=self._timeout, wait_until=self._wait_until)
         except PwTimeoutError:
+            if self._wait_until in ("commit", "domcontentloaded"):
+                raise  # Waiting for the DOM again would only time out again
             self._page.wait_for_load_state("domcontentloaded", timeout=self._timeout)
         logger.debug("Navigated to {} (final URL: {})", url, self._page.url)
         return self._page
@@ -67,6 +92,13 @@ class PlaywrightSession:
         self._context = None
         self._page = None
 
+    def __enter__(self) -> PlaywrightSession:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
 
 class PlaywrightScraper:
     """Base scraper providing Playwright session and common helpers.
@@ -78,6 +110,62 @@ class PlaywrightScraper:
     HOLDINGS_TAB_PATTERNS = [r"^holdings$", r"^top\s+holdings$", r"portfolio"]
     SHOW_ALL_LABELS = [r"show all", r"view all", r"see all"]
     HOLDINGS_HEADER_KEYWORDS = ["holding", "company", "name"]
+    # Navigation returns at DOMContentLoaded; helpers start once this is attached
+    HOLDINGS_READY_SELECTOR = "table, section:has-text('Top holdings')"
+    HOLDINGS_READY_TIMEOUT_MS = 5000
+
+    # Compiled once here rather than on every helper call
+    _TOP_HOLDINGS_RE = re.compile(r"(top\s+)?holdings", re.I)
+    _TOP_HOLDINGS_STRICT = re.compile(r"^top\s+holdings$", re.I)
+    _HOLDINGS_RE = re.compile(r"holdings", re.I)
+    _PERCENT_RE = re.compile(r"\d{1,3}(?:\.\d+)?%")
+    _BODY_WHITESPACE_RE = re.compile(r"[\t\r\f]+")
+
+    # Runs in the page: name, last cell and full text of table rows with 2+ cells
+    _JS_READ_TABLE_ROWS = """
+    (table, limit) => {
+        const text = (el) => el.innerText || el.textContent || "";
+        return Array.from(table.querySelectorAll("tr"))
+            .slice(1, limit)
+            .map((row) => {
+                const cells = row.querySelectorAll("td");
+                if (cells.length < 2) return null;
+                return {
+                    name: text(cells[0]).trim(),
+                    last: text(cells[cells.length - 1]),
+                    row: text(row),
+                };
+            })
+            .filter(Boolean);
+    }
+    """
+
+    # Runs in the page: clicks the first visible element matching the patterns
+    _JS_CLICK_FIRST_MATCH = """
+    (patterns) => {
+        const visible = (el) => el.getClientRects().length > 0;
+        const text = (el) => (el.innerText || el.textContent || "").trim();
+        const clickable = Array.from(
+            document.querySelectorAll("[role=tab], [role=button], a, button")
+        ).filter(visible);
+        let leaves = null;
+        for (const pattern of patterns) {
+            const re = new RegExp(pattern, "i");
+            let el = clickable.find((c) => re.test(text(c)));
+            if (!el) {
+                leaves ??= Array.from(document.body.querySelectorAll("*")).filter(
+                    (l) => l.children.length === 0 && visible(l)
+                );
+                el = leaves.find((l) => re.test(text(l)));
+            }
+            if (el) {
+                el.click();
+                return true;
+            }
+        }
+        return false;
+    }
+    """
 
     def __init__(
         self,
@@ -85,30 +173,45 @@ class PlaywrightScraper:
         *,
         headless: bool = True,
         nav_timeout_ms: int = 30000,
+        wait_until: WaitUntil = "domcontentloaded",
     ) -> None:
         self.session = session or PlaywrightSession(
-            headless=headless, nav_timeout_ms=nav_timeout_ms
+            headless=headless, nav_timeout_ms=nav_timeout_ms, wait_until=wait_until
         )
         self._own = session is None
+        # Per page: (URL the values were read from, DOM lookups by name)
+        self._page_cache: WeakKeyDictionary[Page, tuple[str, dict[str, Any]]] = WeakKeyDictionary()
 
     def scrape(
-        self, url: str, max_holdings: int = 10, storage_config: dict | None = None
+        self,
+        url: str,
+        max_holdings: int = 10,
+        storage_config: StorageConfig | dict | None = None,
     ) -> dict[str, Any]:  # pragma: no cover - abstract by convention
         raise NotImplementedError
 
     def scrape_many(
-        self, urls: Iterable[str], max_holdings: int = 10, storage_config: dict | None = None
+        self,
+        urls: Iterable[str],
+        max_holdings: int = 10,
+        storage_config: StorageConfig | dict | None = None,
     ) -> list[dict[str, Any]]:
+        """Scrape URLs in order through one browser; failed URLs are logged and skipped.
+
+        Scraping coordinators run several browsers at once through their
+        thread-per-browser worker pool (max_concurrent_browsers).
+        """
         results: list[dict[str, Any]] = []
+        # Open once for the whole batch; per-URL scrape() calls then reuse the browser
         opened = False
-        if self._own:
+        if self._own and not self.session.is_open:
             self.session.open()
             opened = True
         try:
             for url in urls:
                 try:
                     results.append(self.scrape(url, max_holdings, storage_config))
-                except Exception as exc:  # noqa: BLE001
+                except Exception as exc:
                     logger.exception("Failed to scrape {}: {}", url, exc)
         finally:
             if opened:
@@ -124,80 +227,79 @@ class PlaywrightScraper:
             pg = None
         if pg is None:
             self.session.open()
-        return self.session.goto(url)
+        else:
+            self._page_cache.pop(pg, None)
+        page = self.session.goto(url)
+        self.wait_for_holdings_ready(page)
+        return page
+
+    def wait_for_holdings_ready(self, page: Page) -> bool:
+        """Wait until the holdings markup is in the DOM, without waiting for the network.
+
+        Returns:
+            True if HOLDINGS_READY_SELECTOR appeared within HOLDINGS_READY_TIMEOUT_MS
+        """
+        try:
+            page.wait_for_selector(
+                self.HOLDINGS_READY_SELECTOR,
+                timeout=self.HOLDINGS_READY_TIMEOUT_MS,
+                state="attached",
+            )
+            return True
+        except Exception:
+            logger.debug("Holdings markup not found on {}, continuing", page.url)
+            return False
+
+    def _cached(self, page: Page, name: str, read: Callable[[], T]) -> T:
+        """Return a DOM lookup already made for the page's current URL, or make it.
+
+        Entries are dropped on navigation and after clicks that change the page.
+        """
+        url = page.url
+        entry = self._page_cache.get(page)
+        if entry is None or entry[0] != url:
+            entry = (url, {})
+            self._page_cache[page] = entry
+        values = entry[1]
+        if name not in values:
+            values[name] = read()
+        return values[name]  # type: ignore[no-any-return]
 
     def get_body_text(self, page: Page) -> str:
-        return re.sub(r"[\t\r\f]+", " ", page.inner_text("body"))
+        return self._cached(
+            page,
+            "body_text",
+            lambda: self._BODY_WHITESPACE_RE.sub(" ", page.inner_text("body")),
+        )
 
     def click_holdings_tab(self, page: Page) -> None:
-        for pattern in self.HOLDINGS_TAB_PATTERNS:
-            # role-based tab
-            try:
-                page.get_by_role("tab", name=re.compile(pattern, re.I)).click(timeout=1800)
-                page.wait_for_timeout(200)
-                return
-            except Exception:
-                pass
-            # anchor or button with text
-            try:
-                page.locator(f"a:has-text('{pattern}')").first.click(timeout=1800)
-                page.wait_for_timeout(200)
-                return
-            except Exception:
-                pass
-            try:
-                page.locator(f"button:has-text('{pattern}')").first.click(timeout=1800)
-                page.wait_for_timeout(200)
-                return
-            except Exception:
-                pass
-            # generic text click
-            try:
-                page.get_by_text(re.compile(pattern, re.I)).first.click(timeout=1800)
-                page.wait_for_timeout(200)
-                return
-            except Exception:
-                pass
+        if self._click_first_match(page, self.HOLDINGS_TAB_PATTERNS):
+            self._page_cache.pop(page, None)
+            page.wait_for_timeout(200)
 
     def click_show_all(self, page: Page) -> None:
-        for label in self.SHOW_ALL_LABELS:
-            # button with accessible name
-            try:
-                page.get_by_role("button", name=re.compile(label, re.I)).click(timeout=1200)
-                page.wait_for_timeout(250)
-                return
-            except Exception:
-                pass
-            # explicit button/anchor contains
-            try:
-                page.locator(f"button:has-text('{label}')").first.click(timeout=1200)
-                page.wait_for_timeout(250)
-                return
-            except Exception:
-                pass
-            try:
-                page.locator(f"a:has-text('{label}')").first.click(timeout=1200)
-                page.wait_for_timeout(250)
-                return
-            except Exception:
-                pass
-            # generic text click
-            try:
-                page.get_by_text(re.compile(label, re.I)).first.click(timeout=1200)
-                page.wait_for_timeout(250)
-                return
-            except Exception:
-                pass
+        if self._click_first_match(page, self.SHOW_ALL_LABELS):
+            self._page_cache.pop(page, None)
+            page.wait_for_timeout(250)
+
+    def _click_first_match(self, page: Page, patterns: list[str]) -> bool:
+        """Click the first visible element matching a pattern, scanning in one round trip.
+
+        Patterns are tried in order. Tabs, buttons and links are preferred; any
+        other element whose own text matches is clicked as a fallback.
+        """
+        try:
+            return bool(page.evaluate(self._JS_CLICK_FIRST_MATCH, patterns))
+        except Exception:
+            return False
 
     def ensure_top_holdings_visible(self, page: Page) -> None:
         try:
-            page.get_by_text(
-                re.compile(r"(top\s+)?holdings", re.I)
-            ).first.scroll_into_view_if_needed(timeout=2000)
+            page.get_by_text(self._TOP_HOLDINGS_RE).first.scroll_into_view_if_needed(timeout=2000)
         except Exception:
             try:
                 page.get_by_role(
-                    "heading", name=re.compile(r"holdings", re.I)
+                    "heading", name=self._HOLDINGS_RE
                 ).first.scroll_into_view_if_needed(timeout=2000)
             except Exception:
                 pass
@@ -211,6 +313,9 @@ class PlaywrightScraper:
                 break
 
     def extract_heading(self, page: Page) -> str | None:
+        return self._cached(page, "heading", lambda: self._read_heading(page))
+
+    def _read_heading(self, page: Page) -> str | None:
         try:
             return page.locator("h1").first.inner_text(timeout=1500).strip()
         except Exception:
@@ -220,8 +325,11 @@ class PlaywrightScraper:
                 return None
 
     def find_holdings_table(self, page: Page) -> ElementHandle | None:
+        return self._cached(page, "holdings_table", lambda: self._locate_holdings_table(page))
+
+    def _locate_holdings_table(self, page: Page) -> ElementHandle | None:
         try:
-            heading = page.get_by_role("heading", name=re.compile(r"^top\s+holdings$", re.I)).first
+            heading = page.get_by_role("heading", name=self._TOP_HOLDINGS_STRICT).first
             h = heading.element_handle(timeout=1000)
             if h:
                 tbl = h.query_selector("xpath=following::table[1]")
@@ -239,9 +347,7 @@ class PlaywrightScraper:
         # Try by text container
         try:
             container = (
-                page.locator("section, div")
-                .filter(has_text=re.compile(r"^top\\s+holdings$", re.I))
-                .first
+                page.locator("section, div").filter(has_text=self._TOP_HOLDINGS_STRICT).first
             )
             h = container.element_handle(timeout=1000)
             if h:
@@ -263,66 +369,17 @@ class PlaywrightScraper:
     ) -> list[dict[str, Any]]:
         if not tbl:
             return []
+        # Skip the header row; a small buffer allows for invalid rows
+        try:
+            rows: list[dict[str, str]] = tbl.evaluate(self._JS_READ_TABLE_ROWS, max_holdings + 10)
+        except Exception:
+            return []
         res: list[dict[str, Any]] = []
-        # Get rows within this table robustly for both Locator and ElementHandle
-        rows: list[Any] = []
-        if hasattr(tbl, "locator"):
-            # This is a Locator object
-            try:
-                rows = tbl.locator("tr").all()
-            except Exception:
-                rows = []
-        else:
-            # This is an ElementHandle object
-            try:
-                rows = tbl.query_selector_all("tr")
-            except Exception:
-                rows = []
         rank = 1
-        # Skip header row if present
-        start_index = 1 if len(rows) > 0 else 0
-        for r in rows[start_index : max_holdings + 10]:  # Small buffer for headers/invalid rows
-            # Get cell locators/handles
-            cells: list[Any] = []
-            if hasattr(r, "locator"):
-                # This is a Locator object
-                try:
-                    cells = r.locator("td").all()
-                except Exception:
-                    cells = []
-            else:
-                # This is an ElementHandle object
-                try:
-                    cells = r.query_selector_all("td")
-                except Exception:
-                    cells = []
-            if len(cells) < 2:
-                continue
-            # Extract name
-            try:
-                name = cells[0].inner_text().strip()
-            except Exception:
-                try:
-                    name = (cells[0].text_content() or "").strip()
-                except Exception:
-                    name = ""
-            # Extract percent allocation (prefer last cell)
-            row_text = ""
-            try:
-                row_text = r.inner_text()
-            except Exception:
-                try:
-                    row_text = r.text_content() or ""
-                except Exception:
-                    row_text = ""
-            try:
-                last_text = cells[-1].inner_text()
-            except Exception:
-                try:
-                    last_text = cells[-1].text_content() or ""
-                except Exception:
-                    last_text = ""
-            alloc = self._percent(last_text) or self._percent(row_text)
+        for row in rows:
+            name = row["name"]
+            # Prefer the percent allocation in the last cell
+            alloc = self._percent(row["last"]) or self._percent(row["row"])
             if name and alloc:
                 res.append({"rank": rank, "company_name": name, "allocation_percentage": alloc})
                 rank += 1
@@ -333,36 +390,13 @@ class PlaywrightScraper:
     def parse_holdings_from_any_table(
         self, page: Page, max_holdings: int = 10
     ) -> list[dict[str, Any]]:
-        # Look for the first few tables near the Top holdings section, then parse
-        try:
-            containers = [
-                page.get_by_role("heading", name=re.compile(r"^top\\s+holdings$", re.I)).first,
-                page.locator("section, div")
-                .filter(has_text=re.compile(r"^top\\s+holdings$", re.I))
-                .first,
-            ]
-            for cont in containers:
-                try:
-                    h = cont.element_handle(timeout=800)
-                except Exception:
-                    h = None
-                if h:
-                    cand = h.query_selector("xpath=following::table[1]")
-                    if cand:
-                        # Validate by header
-                        try:
-                            ths = cand.query_selector_all("th") or []
-                            header_text = " ".join([(t.inner_text() or "").lower() for t in ths])
-                            if not any(k in header_text for k in self.HOLDINGS_HEADER_KEYWORDS):
-                                cand = None
-                        except Exception:
-                            pass
-                        if cand:
-                            parsed = self.parse_holdings_from_table(page, cand, max_holdings)
-                            if parsed:
-                                return parsed
-        except Exception:
-            pass
+        # The table under the Top holdings heading; the lookup is cached per visit,
+        # so callers that already tried find_holdings_table pay no second timeout
+        holdings_table = self.find_holdings_table(page)
+        if holdings_table:
+            parsed = self.parse_holdings_from_table(page, holdings_table, max_holdings)
+            if parsed:
+                return parsed
         # Fallback: try all tables on page
         try:
             tables = page.locator("table").all()
@@ -383,5 +417,5 @@ class PlaywrightScraper:
 
     @staticmethod
     def _percent(text: str) -> str | None:
-        m = re.search(r"\d{1,3}(?:\.\d+)?%", text)
+        m = PlaywrightScraper._PERCENT_RE.search(text)
         return m.group(0) if m else None
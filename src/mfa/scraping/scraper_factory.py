@@ -7,20 +7,30 @@ Playwright-based scrapers with explicit configuration.
 
 from __future__ import annotations
 
-from typing import Any, Protocol
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, Protocol
 
+from mfa.config.models import MFAConfig
 from mfa.config.settings import ConfigProvider
 from mfa.logging.logger import logger
-from mfa.scraping.core.playwright_scraper import PlaywrightSession
-from mfa.scraping.zerodha_api import ZerodhaAPIFundScraper
-from mfa.scraping.zerodha_coin import ZerodhaCoinScraper
+from mfa.storage.storage_config import StorageConfig
+
+if TYPE_CHECKING:
+    # Scraper backends pull in requests, Playwright and the pydantic schemas; they
+    # are imported in create_scraper() only for the type actually requested
+    from mfa.scraping.zerodha_api import ZerodhaAPIFundScraper
+    from mfa.scraping.zerodha_coin import ZerodhaCoinScraper
 
 
 class IScraper(Protocol):
     """Interface that all scrapers must implement."""
 
     def scrape(
-        self, url: str, max_holdings: int = 50, storage_config: dict[str, Any] | None = None
+        self,
+        url: str,
+        max_holdings: int = 50,
+        storage_config: StorageConfig | dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
         Scrape fund data from URL.
@@ -47,13 +57,16 @@ class APIScraperAdapter:
         self._scraper = scraper
 
     def scrape(
-        self, url: str, max_holdings: int = 50, storage_config: dict[str, Any] | None = None
+        self,
+        url: str,
+        max_holdings: int = 50,
+        storage_config: StorageConfig | dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Scrape using API scraper and convert result to dict."""
         result = self._scraper.scrape(url, max_holdings, storage_config)
         # Convert ExtractedFundDocument to dict if needed
-        if hasattr(result, "model_dump"):
-            return result.model_dump(mode="json")
+        if hasattr(result, "to_json_dict"):
+            return result.to_json_dict()
         # This should not happen, but handle it gracefully
         return dict(result) if result else {}
 
@@ -70,7 +83,10 @@ class PlaywrightScraperAdapter:
         self._scraper = scraper
 
     def scrape(
-        self, url: str, max_holdings: int = 50, storage_config: dict[str, Any] | None = None
+        self,
+        url: str,
+        max_holdings: int = 50,
+        storage_config: StorageConfig | dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Scrape using Playwright scraper."""
         return self._scraper.scrape(url, max_holdings, storage_config)
@@ -81,6 +97,59 @@ class PlaywrightScraperAdapter:
             self._scraper.session.close()
 
 
+class HybridScraperAdapter:
+    """
+    Scraper that serves funds from the JSON API and uses Playwright only as a fallback.
+
+    Zerodha Coin URLs carry the fund ID the API needs, so most funds never need a
+    browser. The Playwright scraper is created on the first fallback (and launches
+    its browser on first navigation), and URLs the API could not serve go straight
+    to the browser afterwards.
+    """
+
+    MAX_REMEMBERED_URLS = 1024
+
+    def __init__(self, api_scraper: IScraper, create_browser_scraper: Callable[[], IScraper]):
+        self._api_scraper = api_scraper
+        self._create_browser_scraper = create_browser_scraper
+        self._browser_scraper: IScraper | None = None
+        # URLs the API failed for; bounded so long-lived scrapers don't grow forever
+        self._browser_only_urls: OrderedDict[str, None] = OrderedDict()
+
+    def scrape(
+        self,
+        url: str,
+        max_holdings: int = 50,
+        storage_config: StorageConfig | dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Scrape via the API, falling back to the browser when the API fails."""
+        if url not in self._browser_only_urls:
+            try:
+                return self._api_scraper.scrape(url, max_holdings, storage_config)
+            except Exception as e:
+                logger.warning("⚠️ API unavailable for {}, falling back to Playwright: {}", url, e)
+                self._remember_browser_only(url)
+
+        if self._browser_scraper is None:
+            self._browser_scraper = self._create_browser_scraper()
+        return self._browser_scraper.scrape(url, max_holdings, storage_config)
+
+    def _remember_browser_only(self, url: str) -> None:
+        """Record that url needs the browser, evicting the oldest entry when full."""
+        self._browser_only_urls[url] = None
+        if len(self._browser_only_urls) > self.MAX_REMEMBERED_URLS:
+            self._browser_only_urls.popitem(last=False)
+
+    def close(self) -> None:
+        """Close the API scraper and the browser scraper if one was created."""
+        try:
+            self._api_scraper.close()
+        finally:
+            if self._browser_scraper is not None:
+                self._browser_scraper.close()
+                self._browser_scraper = None
+
+
 class ScraperFactory:
     """Factory for creating scraper instances based on type."""
 
@@ -90,7 +159,7 @@ class ScraperFactory:
         Create scraper based on type.
 
         Args:
-            scraper_type: Type of scraper ("api" or "playwright")
+            scraper_type: Type of scraper ("api", "playwright" or "hybrid")
             config_provider: Configuration provider instance
 
         Returns:
@@ -102,33 +171,60 @@ class ScraperFactory:
         config = config_provider.get_config()
 
         if scraper_type == "api":
-            logger.debug(
-                f"🏭 Creating API scraper with {config.scraping.delay_between_requests}s delay"
-            )
-            api_scraper = ZerodhaAPIFundScraper(
-                delay_between_requests=config.scraping.delay_between_requests
-            )
-            return APIScraperAdapter(api_scraper)
+            return ScraperFactory._create_api_scraper(config)
 
         elif scraper_type == "playwright":
-            logger.debug(
-                f"🏭 Creating Playwright scraper (headless={config.scraping.headless}, "
-                f"timeout={config.scraping.timeout_seconds}s)"
-            )
-            settings = config.scraping
-            session = PlaywrightSession(
-                headless=settings.headless, nav_timeout_ms=settings.timeout_seconds * 1000
+            return ScraperFactory._create_playwright_scraper(config)
+
+        elif scraper_type == "hybrid":
+            logger.debug("🏭 Creating hybrid scraper (API with Playwright fallback)")
+            return HybridScraperAdapter(
+                ScraperFactory._create_api_scraper(config),
+                lambda: ScraperFactory._create_playwright_scraper(config),
             )
-            session.open()
-            playwright_scraper = ZerodhaCoinScraper(session=session)
-            return PlaywrightScraperAdapter(playwright_scraper)
 
         else:
             raise ValueError(
-                f"Unknown scraper type: {scraper_type}. Supported types: 'api', 'playwright'"
+                f"Unknown scraper type: {scraper_type}. "
+                "Supported types: 'api', 'playwright', 'hybrid'"
             )
 
+    @staticmethod
+    def _create_api_scraper(config: MFAConfig) -> APIScraperAdapter:
+        """Create the JSON API scraper."""
+        from mfa.scraping.zerodha_api import ZerodhaAPIFundScraper
+
+        logger.debug(
+            f"🏭 Creating API scraper with {config.scraping.delay_between_requests}s delay"
+        )
+        api_scraper = ZerodhaAPIFundScraper(
+            delay_between_requests=config.scraping.delay_between_requests,
+            max_concurrent_requests=config.scraping.max_concurrent_requests,
+        )
+        return APIScraperAdapter(api_scraper)
+
+    @staticmethod
+    def _create_playwright_scraper(config: MFAConfig) -> PlaywrightScraperAdapter:
+        """Create the browser scraper; its browser launches on first navigation."""
+        from mfa.scraping.core.playwright_scraper import PlaywrightSession
+        from mfa.scraping.zerodha_coin import ZerodhaCoinScraper
+
+        logger.debug(
+            f"🏭 Creating Playwright scraper (headless={config.scraping.headless}, "
+            f"timeout={config.scraping.timeout_seconds}s)"
+        )
+        settings = config.scraping
+        session = PlaywrightSession(
+            headless=settings.headless,
+            nav_timeout_ms=settings.timeout_seconds * 1000,
+            wait_until=settings.page_wait_until,
+        )
+        # The browser launches on the first navigation, so a scraper that is
+        # created but never used (e.g. every fund already saved) costs nothing
+        playwright_scraper = ZerodhaCoinScraper(session=session)
+        return PlaywrightScraperAdapter(playwright_scraper)
+
     @staticmethod
     def get_available_types() -> list[str]:
         """Get list of available scraper types."""
-        return ["api", "playwright"]
+        return ["api", "playwright", "hybrid"]
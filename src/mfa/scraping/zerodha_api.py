@@ -8,6 +8,7 @@ offering a faster and more reliable alternative to Playwright-based scraping.
 from __future__ import annotations
 
 import re
+import threading
 from datetime import datetime
 from typing import Any
 
@@ -16,6 +17,7 @@ from pydantic import HttpUrl
 
 from mfa.core.schemas import ExtractedFundDocument, FundData, FundInfo, TopHolding
 from mfa.scraping.core.http_client import HTTPClient, HTTPClientError
+from mfa.storage.storage_config import StorageConfig, coerce_storage_config
 
 
 class ZerodhaAPIFundScraper:
@@ -53,20 +55,28 @@ class ZerodhaAPIFundScraper:
     HOLDINGS_ASSET_TYPE_IDX = 3
     HOLDINGS_PERCENTAGE_IDX = 5
 
-    def __init__(self, delay_between_requests: float = 1.0) -> None:
+    def __init__(
+        self, delay_between_requests: float = 1.0, max_concurrent_requests: int = 4
+    ) -> None:
         """
         Initialize API scraper.
 
         Args:
             delay_between_requests: Delay between API requests in seconds
+            max_concurrent_requests: Threads expected to share this scraper, used to
+                size the HTTP connection pool
         """
         self.delay_between_requests = delay_between_requests
+        self.max_concurrent_requests = max_concurrent_requests
         self._http_client: HTTPClient | None = None
+        self._http_client_lock = threading.Lock()
 
     def _get_http_client(self) -> HTTPClient:
-        """Get or create HTTP client instance."""
+        """Get or create HTTP client instance (safe to call from worker threads)."""
         if self._http_client is None:
-            self._http_client = self._initialize_http_client()
+            with self._http_client_lock:
+                if self._http_client is None:
+                    self._http_client = self._initialize_http_client()
         return self._http_client
 
     def _initialize_http_client(self) -> HTTPClient:
@@ -75,13 +85,14 @@ class ZerodhaAPIFundScraper:
             timeout=self.DEFAULT_TIMEOUT,
             max_retries=self.DEFAULT_MAX_RETRIES,
             backoff_factor=self.DEFAULT_BACKOFF_FACTOR,
+            pool_maxsize=max(10, self.max_concurrent_requests),
         )
 
     def scrape(
         self,
         url: str,
         max_holdings: int = 50,
-        storage_config: dict[str, Any] | None = None,
+        storage_config: StorageConfig | dict[str, Any] | None = None,
     ) -> ExtractedFundDocument:
         """
         Scrape mutual fund data using Zerodha API.
@@ -89,7 +100,7 @@ class ZerodhaAPIFundScraper:
         Args:
             url: Zerodha Coin fund URL
             max_holdings: Maximum number of holdings to extract
-            storage_config: Storage configuration (optional)
+            storage_config: Storage configuration (optional, dict form still accepted)
 
         Returns:
             Extracted fund document
@@ -98,7 +109,7 @@ class ZerodhaAPIFundScraper:
             ZerodhaAPIError: If scraping fails
         """
         try:
-            logger.debug(f"🌐 Starting API scrape for: {url}")
+            logger.debug("🌐 Starting API scrape for: {}", url)
 
             # Extract fund ID and fetch data
             fund_id = self._extract_fund_id_from_url(url)
@@ -108,9 +119,11 @@ class ZerodhaAPIFundScraper:
             fund_name, metadata, holdings = self._transform_api_data(
                 api_data, max_holdings, url, current_nav
             )
-            document = self._build_document(url, fund_name, metadata, holdings, storage_config)
+            document = self._build_document(
+                url, fund_name, metadata, holdings, coerce_storage_config(storage_config)
+            )
 
-            logger.info(f"✅ Successfully scraped {len(holdings)} holdings via API")
+            logger.info("✅ Successfully scraped {} holdings via API", len(holdings))
             return document
 
         except Exception as e:
@@ -155,7 +168,7 @@ class ZerodhaAPIFundScraper:
             raise ZerodhaAPIError(f"Cannot extract fund ID from URL: {url}")
 
         fund_id = match.group(1)
-        logger.debug(f"🔍 Extracted fund ID '{fund_id}' from URL")
+        logger.debug("🔍 Extracted fund ID '{}' from URL", fund_id)
         return fund_id
 
     def _extract_fund_name_from_url(self, url: str) -> str:
@@ -178,7 +191,7 @@ class ZerodhaAPIFundScraper:
         fund_name_slug = match.group(1)
         formatted_name = self._format_fund_name_from_slug(fund_name_slug)
 
-        logger.debug(f"🏷️ Extracted fund name: '{formatted_name}' from slug: '{fund_name_slug}'")
+        logger.debug("🏷️ Extracted fund name: '{}' from slug: '{}'", formatted_name, fund_name_slug)
         return formatted_name
 
     def _format_fund_name_from_slug(self, fund_name_slug: str) -> str:
@@ -225,7 +238,7 @@ class ZerodhaAPIFundScraper:
             # Validate API response
             self._validate_api_response(response_data, fund_id)
 
-            logger.debug(f"✅ Successfully fetched API data for fund {fund_id}")
+            logger.debug("✅ Successfully fetched API data for fund {}", fund_id)
             return response_data
 
         except HTTPClientError as e:
@@ -264,7 +277,7 @@ class ZerodhaAPIFundScraper:
             Tuple of (fund_name, metadata, holdings)
         """
         holdings_data = api_data.get(self.DATA_FIELD, [])
-        logger.debug(f"📊 Processing {len(holdings_data)} holdings from API")
+        logger.debug("📊 Processing {} holdings from API", len(holdings_data))
 
         # Extract fund name from URL
         fund_name = self._extract_fund_name_from_url(source_url)
@@ -275,7 +288,7 @@ class ZerodhaAPIFundScraper:
         # Transform holdings
         holdings = self._process_holdings_data(holdings_data, max_holdings)
 
-        logger.debug(f"✅ Transformed {len(holdings)} holdings (max: {max_holdings})")
+        logger.debug("✅ Transformed {} holdings (max: {})", len(holdings), max_holdings)
         return fund_name, metadata, holdings
 
     def _build_metadata(self, current_nav: float) -> dict[str, Any]:
@@ -391,7 +404,7 @@ class ZerodhaAPIFundScraper:
         return {
             "rank": rank,
             "company_name": company_name,
-            "allocation_percentage": f"{percentage}%",
+            "allocation_percentage": percentage,
             "sector": sector,  # Additional field from API
         }
 
@@ -401,7 +414,7 @@ class ZerodhaAPIFundScraper:
         fund_name: str,
         metadata: dict[str, Any],
         holdings: list[dict[str, Any]],
-        storage_config: dict[str, Any] | None = None,
+        storage_config: StorageConfig | None = None,
     ) -> ExtractedFundDocument:
         """
         Build standardized fund document.
@@ -430,7 +443,7 @@ class ZerodhaAPIFundScraper:
         )
 
         # Save if storage config provided
-        if storage_config and storage_config.get("should_save", False):
+        if storage_config is not None and storage_config.should_save:
             self._save_document(document, storage_config)
 
         return document
@@ -477,7 +490,7 @@ class ZerodhaAPIFundScraper:
         ]
 
     def _save_document(
-        self, document: ExtractedFundDocument, storage_config: dict[str, Any]
+        self, document: ExtractedFundDocument, storage_config: StorageConfig
     ) -> None:
         """Save document to file using storage configuration."""
         from mfa.config.settings import ConfigProvider
@@ -490,15 +503,15 @@ class ZerodhaAPIFundScraper:
             path_generator = PathGenerator(config_provider)
             file_path = path_generator.generate_scraped_data_path(
                 url=str(document.source_url),
-                category=storage_config.get("category", ""),
-                analysis_config=storage_config,
+                category=storage_config.category,
+                analysis_config=storage_config.to_analysis_config(),
             )
 
             # Save document
             store = JsonStore()
-            store.save(document.model_dump(mode="json"), file_path)
+            store.save(document.to_json_dict(), file_path)
 
-            logger.debug(f"💾 Saved API document to: {file_path}")
+            logger.debug("💾 Saved API document to: {}", file_path)
 
         except Exception as e:
             logger.error(f"❌ Failed to save document: {e}")
@@ -528,7 +541,7 @@ class ZerodhaAPIFundScraper:
             # Extract latest NAV
             current_nav, nav_date = self._extract_latest_nav(response_data, fund_id)
 
-            logger.debug(f"💰 Fetched NAV for {fund_id}: ₹{current_nav} (as of {nav_date})")
+            logger.debug("💰 Fetched NAV for {}: ₹{} (as of {})", fund_id, current_nav, nav_date)
             return current_nav
 
         except HTTPClientError as e:
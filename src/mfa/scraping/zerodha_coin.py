@@ -9,7 +9,8 @@ from pydantic import HttpUrl
 
 from mfa.core.schemas import ExtractedFundDocument, FundData, FundInfo, TopHolding
 from mfa.logging.logger import logger
-from mfa.scraping.core.playwright_scraper import PlaywrightScraper, PlaywrightSession
+from mfa.scraping.core.playwright_scraper import PlaywrightScraper, PlaywrightSession, WaitUntil
+from mfa.storage.storage_config import StorageConfig, coerce_storage_config
 
 
 def _extract_by_label(text: str, label_patterns: list[str], value_pattern: str) -> str | None:
@@ -163,7 +164,7 @@ def _build_document(
         data=fd,
     )
     # Ensure JSON-serializable output (HttpUrl, datetime -> strings)
-    return doc.model_dump(mode="json")
+    return doc.to_json_dict()
 
 
 class ZerodhaCoinScraper(PlaywrightScraper):
@@ -174,12 +175,21 @@ class ZerodhaCoinScraper(PlaywrightScraper):
         session: PlaywrightSession | None = None,
         headless: bool = True,
         nav_timeout_ms: int = 30000,
+        wait_until: WaitUntil = "domcontentloaded",
     ) -> None:
         # Pass session through; base will create one if None and mark _own correctly
-        super().__init__(session=session, headless=headless, nav_timeout_ms=nav_timeout_ms)
+        super().__init__(
+            session=session,
+            headless=headless,
+            nav_timeout_ms=nav_timeout_ms,
+            wait_until=wait_until,
+        )
 
     def scrape(
-        self, url: str, max_holdings: int = 10, storage_config: dict | None = None
+        self,
+        url: str,
+        max_holdings: int = 10,
+        storage_config: StorageConfig | dict | None = None,
     ) -> dict[str, Any]:
         """
         Scrape fund data from a URL with configurable holdings limit and smart storage.
@@ -187,11 +197,7 @@ class ZerodhaCoinScraper(PlaywrightScraper):
         Args:
             url: Fund URL to scrape
             max_holdings: Maximum number of holdings to extract
-            storage_config: Optional storage configuration containing:
-                - should_save: bool - Whether to save to disk
-                - base_dir: str - Base directory for storage
-                - category: str - Fund category for organization
-                - filename_prefix: str - Prefix for generated filenames
+            storage_config: Optional StorageConfig (legacy dict form still accepted)
 
         Returns:
             dict: Scraped fund data document
@@ -206,7 +212,7 @@ class ZerodhaCoinScraper(PlaywrightScraper):
             self._log_extraction_results(fund_name, meta, holdings, max_holdings, url)
 
             document = self._build_and_optionally_save_document(
-                url, fund_name, meta, holdings, storage_config
+                url, fund_name, meta, holdings, coerce_storage_config(storage_config)
             )
             return document
 
@@ -218,8 +224,13 @@ class ZerodhaCoinScraper(PlaywrightScraper):
                 self._close_session()
 
     def _open_session_if_needed(self) -> bool:
-        """Open browser session if this scraper owns it. Returns True if opened."""
-        if self._own:
+        """
+        Open browser session if this scraper owns it and it is not already open.
+
+        Returns True only when this call opened it, so a session opened by
+        scrape_many() stays up for the remaining URLs.
+        """
+        if self._own and not self.session.is_open:
             self.session.open()
             return True
         return False
@@ -339,7 +350,7 @@ class ZerodhaCoinScraper(PlaywrightScraper):
         fund_name: str | None,
         meta: dict[str, Any],
         holdings: list[dict[str, Any]],
-        storage_config: dict | None,
+        storage_config: StorageConfig | None,
     ) -> dict[str, Any]:
         """
         Build the final document and optionally save using JSONStore.
@@ -351,7 +362,7 @@ class ZerodhaCoinScraper(PlaywrightScraper):
         document = _build_document(url, fund_name, meta, holdings)
 
         # Use PathGenerator and JSONStore for smart storage if requested
-        if storage_config and storage_config.get("should_save", False):
+        if storage_config is not None and storage_config.should_save:
             from mfa.config.settings import ConfigProvider
             from mfa.storage.json_store import JsonStore
             from mfa.storage.path_generator import PathGenerator
@@ -360,14 +371,10 @@ class ZerodhaCoinScraper(PlaywrightScraper):
             config_provider = ConfigProvider()  # Could be injected if needed
             path_gen = PathGenerator(config_provider)
 
-            # Create analysis config dict for path generation
-            analysis_config = {
-                "type": storage_config.get("analysis_type", "default"),
-                "path_template": storage_config.get("path_template"),
-            }
-
             file_path = path_gen.generate_scraped_data_path(
-                url=url, category=storage_config["category"], analysis_config=analysis_config
+                url=url,
+                category=storage_config.category,
+                analysis_config=storage_config.to_analysis_config(),
             )
 
             JsonStore.save_with_path(data=document, file_path=file_path)
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import contextlib
+import mmap
+import os
+import shutil
+import uuid
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +22,13 @@ class JsonStore:
     for JSON data persistence across the application.
     """
 
+    # Files at least this large are parsed straight from a read-only memory map
+    MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+    # Parent directories already created by this process, so repeated saves into
+    # the same category directory skip the mkdir syscalls
+    _created_directories: set[str] = set()
+
     @staticmethod
     def save(data: dict[str, Any], file_path: Path) -> None:
         """
@@ -31,7 +43,12 @@ class JsonStore:
         """
         try:
             JsonStore._ensure_parent_directory(file_path)
-            JsonStore._write_json_file(data, file_path)
+            try:
+                JsonStore._write_json_file(data, file_path)
+            except FileNotFoundError:
+                # Directory removed since it was created; create it again and retry
+                JsonStore._ensure_parent_directory(file_path, refresh=True)
+                JsonStore._write_json_file(data, file_path)
             logger.debug("💾 Saved JSON data to: {}", file_path)
         except Exception as e:
             error_msg = f"Failed to save JSON file to {file_path}: {e}"
@@ -60,6 +77,42 @@ class JsonStore:
             logger.error("❌ {}", error_msg)
             raise create_storage_error(error_msg, str(file_path), "save") from e
 
+    @staticmethod
+    def link(source_path: Path, file_path: Path) -> None:
+        """
+        Make an existing JSON file also available at another path without rewriting it.
+
+        The file is hard-linked where the filesystem allows it and copied otherwise.
+        Saves replace files rather than writing into them, so later saving either
+        path never changes the other.
+
+        Args:
+            source_path: Existing JSON file
+            file_path: Path where the same document should appear
+
+        Raises:
+            StorageError: When the file cannot be linked or copied
+        """
+        try:
+            JsonStore._ensure_parent_directory(file_path)
+            temp_name = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                try:
+                    os.link(source_path, temp_name)
+                except OSError:
+                    # Cross-device or no hard-link support
+                    shutil.copyfile(source_path, temp_name)
+                os.replace(temp_name, file_path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_name)
+                raise
+            logger.debug("🔗 Linked JSON data from {} to: {}", source_path, file_path)
+        except Exception as e:
+            error_msg = f"Failed to link JSON file {source_path} to {file_path}: {e}"
+            logger.error("❌ {}", error_msg)
+            raise create_storage_error(error_msg, str(file_path), "save") from e
+
     @staticmethod
     def load(file_path: Path) -> dict[str, Any]:
         """
@@ -75,7 +128,8 @@ class JsonStore:
             StorageError: When load operation fails
         """
         try:
-            JsonStore._validate_file_exists(file_path)
+            # open() reports missing, non-file and unreadable paths itself, so no
+            # separate exists/is_file/access checks are made before reading
             data = JsonStore._read_json_file(file_path)
             logger.debug("📖 Loaded JSON data from: {}", file_path)
             return data
@@ -140,36 +194,61 @@ class JsonStore:
             )
 
     @staticmethod
-    def _ensure_parent_directory(file_path: Path) -> None:
-        """Ensure parent directory exists."""
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+    def _ensure_parent_directory(file_path: Path, refresh: bool = False) -> None:
+        """
+        Ensure parent directory exists, creating each directory once per process.
 
-    @staticmethod
-    def _write_json_file(data: dict[str, Any], file_path: Path) -> None:
-        """Write data to JSON file."""
-        with open(file_path, "wb") as file_handle:
-            file_handle.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        Args:
+            file_path: File whose parent directory is needed
+            refresh: Create the directory even if it was created before
+        """
+        parent = file_path.parent
+        key = str(parent)
+        if not refresh and key in JsonStore._created_directories:
+            return
+        parent.mkdir(parents=True, exist_ok=True)
+        JsonStore._created_directories.add(key)
 
     @staticmethod
-    def _validate_file_exists(file_path: Path) -> None:
-        """Validate that file exists and is readable."""
-        if not file_path.exists():
-            raise FileNotFoundError(f"JSON file not found: {file_path}")
-
-        if not file_path.is_file():
-            raise FileNotFoundError(f"Path is not a file: {file_path}")
+    def _write_json_file(data: dict[str, Any], file_path: Path) -> None:
+        """
+        Write data to JSON file as compact JSON.
 
-        if not JsonStore._is_readable(file_path):
-            raise PermissionError(f"Cannot read file: {file_path}")
+        The document is encoded before anything is written, so data orjson rejects
+        (such as non-str keys) raises without touching the disk. It is then written
+        to a hidden temporary file in the same directory and renamed into place, so
+        the target path only ever holds a complete document.
+        """
+        encoded = orjson.dumps(data)
+        # Unique per writer; "x" mode creates it with the usual umask-based permissions
+        temp_name = file_path.with_name(f".{file_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temp_name, "xb") as file_handle:
+                file_handle.write(encoded)
+            os.replace(temp_name, file_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            raise
 
     @staticmethod
     def _read_json_file(file_path: Path) -> dict[str, Any]:
         """Read and parse JSON file."""
         with open(file_path, "rb") as file_handle:
-            data = orjson.loads(file_handle.read())
-            if not isinstance(data, dict):
-                raise ValueError(f"Expected JSON object, got {type(data)}")
-            return data
+            size = os.fstat(file_handle.fileno()).st_size
+            if size >= JsonStore.MMAP_THRESHOLD_BYTES:
+                # Parse from the page cache without copying the file into a bytes object
+                with (
+                    mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                    memoryview(mapped) as view,
+                ):
+                    data = orjson.loads(view)
+            else:
+                data = orjson.loads(file_handle.read())
+
+        if not isinstance(data, dict):
+            raise ValueError(f"Expected JSON object, got {type(data)}")
+        return data
 
     @staticmethod
     def _is_readable(file_path: Path) -> bool:
@@ -8,12 +8,16 @@ and custom path templates for different analysis types.
 
 from __future__ import annotations
 
+import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from mfa.config.settings import ConfigProvider
 
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 class PathGenerator:
     """
@@ -51,6 +55,67 @@ class PathGenerator:
         Returns:
             Complete path for the scraped data file
         """
+        directory_path = self.generate_scraped_data_dir(category, analysis_config, date_str)
+
+        # Generate filename from URL
+        filename = self._generate_filename_from_url(url)
+
+        return Path(directory_path) / filename
+
+    def generate_scraped_data_filename(self, url: str) -> str:
+        """
+        Generate the filename of a URL's scraped data file within its directory.
+
+        Args:
+            url: Source URL for data
+
+        Returns:
+            Filename (without directory) for the scraped data file
+        """
+        return self._generate_filename_from_url(url)
+
+    def generate_scraped_data_paths(
+        self,
+        urls: list[str],
+        category: str = "",
+        analysis_config: dict | None = None,
+        date_str: str | None = None,
+    ) -> list[str]:
+        """
+        Generate paths for many scraped data files in the same directory.
+
+        The directory is resolved once and paths are built as plain strings,
+        avoiding a Path object per URL.
+
+        Args:
+            urls: Source URLs for data
+            category: Fund category (e.g., "largeCap", "midCap")
+            analysis_config: Analysis configuration with optional path_template
+            date_str: Optional date string (defaults to today)
+
+        Returns:
+            File path strings, in the same order as urls
+        """
+        directory_path = self.generate_scraped_data_dir(category, analysis_config, date_str)
+        return [os.path.join(directory_path, self._generate_filename_from_url(url)) for url in urls]
+
+    def generate_scraped_data_dir(
+        self,
+        category: str = "",
+        analysis_config: dict | None = None,
+        date_str: str | None = None,
+    ) -> str:
+        """
+        Generate the directory for scraped data files.
+
+        Args:
+            category: Fund category (e.g., "largeCap", "midCap")
+            analysis_config: Analysis configuration with optional path_template
+            date_str: Optional date string (defaults to today)
+
+        Returns:
+            Directory path string for the scraped data files
+        """
         if date_str is None:
             date_str = datetime.now().strftime("%Y%m%d")
 
@@ -62,14 +127,7 @@ class PathGenerator:
         analysis_type = (
             analysis_config.get("type", "").split("-")[-1] if analysis_config else "default"
         )
-        directory_path = self._generate_smart_default_path(
-            base_dir, date_str, analysis_type, category
-        )
-
-        # Generate filename from URL
-        filename = self._generate_filename_from_url(url)
-
-        return Path(directory_path) / filename
+        return self._generate_smart_default_path(base_dir, date_str, analysis_type, category)
 
     def generate_analysis_output_path(
         self, category: str, analysis_config: dict | None = None, date_str: str | None = None
@@ -122,23 +180,28 @@ class PathGenerator:
             # Non-categorized analysis (e.g., portfolio): base_dir/date/analysis_type/
             return f"{base_dir}/{date_str}/{analysis_type}"
 
-    def _generate_filename_from_url(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _generate_filename_from_url(url: str) -> str:
         """
         Generate filename from URL.
 
+        The same URLs are resolved several times per run (reuse checks, saving,
+        expected paths), so results are cached.
+
         Args:
             url: Source URL
 
         Returns:
             Safe filename for the scraped data
         """
-        # Extract the last part of URL which contains the fund identifier
-        url_parts = url.strip("/").split("/")
+        # Only the last two segments carry the fund identifier; don't split the rest
+        url_parts = url.strip("/").rsplit("/", 2)
 
         if len(url_parts) >= 2:
             # Get the fund code and name parts
-            fund_code = url_parts[-2] if len(url_parts) >= 2 else ""
-            fund_name = url_parts[-1] if len(url_parts) >= 1 else ""
+            fund_code = url_parts[-2]
+            fund_name = url_parts[-1]
 
             # Combine them with underscore
             if fund_code and fund_name:
@@ -147,8 +210,8 @@ class PathGenerator:
                 fund_identifier = fund_name or fund_code
         else:
             # Fallback: sanitize the entire URL
-            fund_identifier = re.sub(
-                r"[^a-zA-Z0-9_-]", "_", url.split("/")[-1] if "/" in url else url
+            fund_identifier = _UNSAFE_FILENAME_CHARS.sub(
+                "_", url.rpartition("/")[2] if "/" in url else url
             )
 
         # Use hardcoded filename prefix for Zerodha Coin files
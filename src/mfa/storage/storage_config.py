@@ -0,0 +1,69 @@
+"""
+Storage configuration for scraped fund documents.
+
+This module defines the immutable settings object that coordinators hand to
+scrapers, describing whether and where extracted documents should be persisted.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True, frozen=True)
+class StorageConfig:
+    """Describes where and how a scraper should persist extracted documents."""
+
+    should_save: bool
+    base_dir: str
+    category: str
+    filename_prefix: str
+    analysis_type: str
+    path_template: str | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> StorageConfig:
+        """
+        Build a StorageConfig from the legacy dictionary form.
+
+        Older callers used a ``type`` key for the analysis type; both ``type``
+        and ``analysis_type`` are accepted.
+
+        Args:
+            data: Dictionary with storage settings
+
+        Returns:
+            Equivalent StorageConfig instance
+        """
+        return cls(
+            should_save=bool(data.get("should_save", False)),
+            base_dir=data.get("base_dir", ""),
+            category=data.get("category", ""),
+            filename_prefix=data.get("filename_prefix", "coin_"),
+            analysis_type=data.get("analysis_type") or data.get("type") or "default",
+            path_template=data.get("path_template"),
+        )
+
+    def to_analysis_config(self) -> dict[str, Any]:
+        """Return the analysis config mapping expected by PathGenerator."""
+        return {"type": self.analysis_type, "path_template": self.path_template}
+
+
+def coerce_storage_config(
+    storage_config: StorageConfig | dict[str, Any] | None,
+) -> StorageConfig | None:
+    """
+    Normalize a storage configuration to a StorageConfig instance.
+
+    Dictionaries are still accepted at the scraper boundary while callers migrate.
+
+    Args:
+        storage_config: StorageConfig, legacy dictionary, or None
+
+    Returns:
+        StorageConfig instance, or None when no configuration was given
+    """
+    if storage_config is None or isinstance(storage_config, StorageConfig):
+        return storage_config
+    return StorageConfig.from_dict(storage_config)
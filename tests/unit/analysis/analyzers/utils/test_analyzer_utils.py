@@ -0,0 +1,41 @@
+"""Unit tests for AnalyzerUtils."""
+
+from pathlib import Path
+
+from mfa.analysis.analyzers.utils.analyzer_utils import AnalyzerUtils
+from mfa.storage.json_store import JsonStore
+
+
+class TestLoadFilesFromDataSource:
+    """Test concurrent loading of scraped files into per-category lists."""
+
+    def test_keeps_category_grouping_and_file_order(self, temp_directory: Path):
+        """Test files load into their own category in the order they were listed."""
+        file_paths: dict[str, list[str]] = {"largeCap": [], "midCap": []}
+        for category, count in (("largeCap", 5), ("midCap", 3)):
+            for i in range(count):
+                path = temp_directory / category / f"fund_{i}.json"
+                JsonStore.save({"index": i, "category": category}, path)
+                file_paths[category].append(str(path))
+
+        loaded = AnalyzerUtils.load_files_from_data_source({"file_paths": file_paths})
+
+        assert [d["index"] for d in loaded["largeCap"]] == [0, 1, 2, 3, 4]
+        assert [d["index"] for d in loaded["midCap"]] == [0, 1, 2]
+        assert {d["category"] for d in loaded["midCap"]} == {"midCap"}
+
+    def test_skips_unreadable_files(self, temp_directory: Path):
+        """Test a missing file is skipped without affecting the rest of its category."""
+        present = temp_directory / "present.json"
+        JsonStore.save({"ok": True}, present)
+        data_source = {
+            "file_paths": {"smallCap": [str(temp_directory / "missing.json"), str(present)]}
+        }
+
+        loaded = AnalyzerUtils.load_files_from_data_source(data_source)
+
+        assert loaded == {"smallCap": [{"ok": True}]}
+
+    def test_empty_data_source(self):
+        """Test an empty data source loads nothing."""
+        assert AnalyzerUtils.load_files_from_data_source({}) == {}
@@ -28,6 +28,43 @@ class TestDataProcessorUtils:
             assert DataProcessorUtils.normalize_company_name("TCS") == "TCS"
             assert DataProcessorUtils.normalize_company_name("HDFC Bank") == "HDFC Bank"
 
+        def test_normalize_company_name_stacked_suffixes(self):
+            """Test multi-word and stacked suffixes are stripped in sequence."""
+            assert DataProcessorUtils.normalize_company_name("Infosys Pvt. Ltd.") == "Infosys"
+            assert DataProcessorUtils.normalize_company_name("Larsen Co. Ltd") == "Larsen"
+            assert DataProcessorUtils.normalize_company_name("  Coal India Ltd.  ") == "Coal India"
+            assert DataProcessorUtils.normalize_company_name("Limited") == "Limited"
+
+        def test_normalize_company_name_is_memoized(self):
+            """Test repeated names are served from the cache."""
+            DataProcessorUtils.normalize_company_name.cache_clear()
+
+            for _ in range(3):
+                DataProcessorUtils.normalize_company_name("HDFC Bank Ltd")
+
+            info = DataProcessorUtils.normalize_company_name.cache_info()
+            assert (info.hits, info.misses) == (2, 1)
+
+    class TestParsePercentage:
+        """Test percentage parsing to float values."""
+
+        def test_parse_percentage_common_shapes(self):
+            """Test the common percentage string shapes."""
+            assert DataProcessorUtils.parse_percentage("5.25%") == 5.25
+            assert DataProcessorUtils.parse_percentage("5.25") == 5.25
+            assert DataProcessorUtils.parse_percentage(" 7.1 %") == 7.1
+            assert DataProcessorUtils.parse_percentage(3) == 3.0
+            assert DataProcessorUtils.parse_percentage(5.25) == 5.25
+            assert DataProcessorUtils.parse_percentage(0.0) == 0.0
+
+        def test_parse_percentage_fallback_cases(self):
+            """Test inputs the fast path rejects still parse as before."""
+            assert DataProcessorUtils.parse_percentage("%5.5") == 5.5
+            assert DataProcessorUtils.parse_percentage("5.5%\n") == 5.5
+            assert DataProcessorUtils.parse_percentage("") == 0.0
+            assert DataProcessorUtils.parse_percentage(None) == 0.0
+            assert DataProcessorUtils.parse_percentage("N/A") == 0.0
+
     class TestParsePercentageAsDecimal:
         """Test percentage parsing functionality."""
 
@@ -36,6 +73,7 @@ class TestDataProcessorUtils:
             assert DataProcessorUtils.parse_percentage_as_decimal("10%") == 0.10
             assert DataProcessorUtils.parse_percentage_as_decimal("5.5%") == 0.055
             assert DataProcessorUtils.parse_percentage_as_decimal("100%") == 1.0
+            assert DataProcessorUtils.parse_percentage_as_decimal(5.5) == 0.055
 
         def test_parse_percentage_edge_cases(self):
             """Test percentage parsing edge cases."""
@@ -57,3 +95,22 @@ class TestDataProcessorUtils:
             assert DataProcessorUtils.parse_currency("₹0") == 0.0
             assert DataProcessorUtils.parse_currency("") == 0.0
             assert DataProcessorUtils.parse_currency("invalid") == 0.0
+
+    class TestExcludedHoldings:
+        """Test exclusion of cash-like holdings."""
+
+        def test_contains_excluded_keyword(self):
+            """Test prebuilt keywords match case-insensitively as substrings."""
+            keywords = DataProcessorUtils.build_excluded_keywords(["TREPS", "cash", ""])
+
+            assert keywords == frozenset({"TREPS", "CASH"})
+            assert DataProcessorUtils.contains_excluded_keyword("Treps 01-Jan", keywords)
+            assert DataProcessorUtils.contains_excluded_keyword("Net Cash & Equivalents", keywords)
+            assert not DataProcessorUtils.contains_excluded_keyword("HDFC Bank", keywords)
+            assert not DataProcessorUtils.contains_excluded_keyword("", keywords)
+
+        def test_is_excluded_holding_matches_keyword_check(self):
+            """Test the one-off helper agrees with the prebuilt keyword path."""
+            assert DataProcessorUtils.is_excluded_holding("Clearing TREPS", {"treps"})
+            assert not DataProcessorUtils.is_excluded_holding("Infosys", {"treps"})
+            assert not DataProcessorUtils.is_excluded_holding("Infosys", set())
@@ -0,0 +1,50 @@
+"""Unit tests for output builder utilities."""
+
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from mfa.analysis.analyzers.utils.output_builder_utils import OutputBuilderUtils
+
+
+def _companies(count: int) -> list[SimpleNamespace]:
+    rng = random.Random(7)
+    return [
+        SimpleNamespace(name=f"C{i}", fund_count=rng.randint(1, 5), total_weight=rng.randint(1, 9))
+        for i in range(count)
+    ]
+
+
+class TestSortCompaniesByCriteria:
+    """Test bounded and unbounded company ranking."""
+
+    @pytest.mark.parametrize("sort_type", ["fund_count", "total_weight", "weight_then_count"])
+    def test_limited_matches_sorted_prefix(self, sort_type: str):
+        """Test a bounded selection equals the prefix of the full sort, ties included."""
+        companies = _companies(200)
+
+        full = OutputBuilderUtils.sort_companies_by_criteria(companies, sort_type)
+        top = OutputBuilderUtils.sort_companies_by_criteria(companies, sort_type, limit=10)
+
+        assert [c.name for c in top] == [c.name for c in full[:10]]
+
+    def test_non_positive_limit_returns_all(self):
+        """Test a zero limit keeps every company, as configured limits of 0 did before."""
+        companies = _companies(20)
+
+        assert len(OutputBuilderUtils.sort_companies_by_criteria(companies, "fund_count", 0)) == 20
+
+    def test_unknown_sort_type_raises(self):
+        """Test an unknown sort type is rejected."""
+        with pytest.raises(ValueError, match="Unknown sort_type"):
+            OutputBuilderUtils.sort_companies_by_criteria([], "alphabetical")
+
+    def test_find_companies_in_all_funds_limited(self):
+        """Test companies held by every fund are ranked by weight and limited."""
+        companies = _companies(100)
+        in_all = [c for c in companies if c.fund_count == 5]
+
+        top = OutputBuilderUtils.find_companies_in_all_funds(companies, 5, limit=3)
+
+        assert top == sorted(in_all, key=lambda c: -c.total_weight)[:3]
@@ -1,6 +1,7 @@
 """Unit tests for HoldingsAnalyzer - business-critical analysis component."""
 
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
@@ -104,6 +105,50 @@ class TestHoldingsAnalyzer:
             assert "total_categories" in result.summary
             assert result.summary["total_categories"] == 2
 
+    def test_category_outputs_are_written_in_background_before_returning(
+        self, mock_config_provider: ConfigProvider, sample_file_data: dict[str, Any]
+    ):
+        """Test category outputs are saved off the analysis thread and complete before return."""
+        analyzer = HoldingsAnalyzer(mock_config_provider)
+        writer_threads: list[str] = []
+        save_with_path = JsonStore.save_with_path
+
+        def recording_save(data: dict[str, Any], file_path: Path) -> Path:
+            writer_threads.append(threading.current_thread().name)
+            return save_with_path(data=data, file_path=file_path)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            file1 = temp_path / "large_cap_fund.json"
+            file2 = temp_path / "mid_cap_fund.json"
+            JsonStore.save(sample_file_data, file1)
+            JsonStore.save(sample_file_data, file2)
+            data_source = {"file_paths": {"largeCap": [str(file1)], "midCap": [str(file2)]}}
+
+            with patch.object(JsonStore, "save_with_path", side_effect=recording_save):
+                result = analyzer.analyze(data_source, "20240903")
+
+        assert len(writer_threads) == 2
+        assert all(name.startswith("mfa-output") for name in writer_threads)
+        assert all(path.exists() for path in result.output_paths)
+
+    def test_background_write_errors_are_raised(
+        self, mock_config_provider: ConfigProvider, sample_file_data: dict[str, Any]
+    ):
+        """Test a failed category write surfaces from analyze instead of being dropped."""
+        analyzer = HoldingsAnalyzer(mock_config_provider)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file1 = Path(temp_dir) / "large_cap_fund.json"
+            JsonStore.save(sample_file_data, file1)
+            data_source = {"file_paths": {"largeCap": [str(file1)]}}
+
+            with (
+                patch.object(JsonStore, "save_with_path", side_effect=OSError("disk full")),
+                pytest.raises(OSError, match="disk full"),
+            ):
+                analyzer.analyze(data_source, "20240903")
+
     def test_analyze_handles_missing_files_gracefully(self, mock_config_provider: ConfigProvider):
         """Test analysis handles missing files without crashing."""
         analyzer = HoldingsAnalyzer(mock_config_provider)
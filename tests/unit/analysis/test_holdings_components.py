@@ -228,6 +228,41 @@ class TestHoldingsAggregator:
         company_x = result.companies["Company X"]
         assert len(company_x.sample_funds) <= 1  # Limited by config
 
+    def test_aggregate_holdings_repeated_company_in_one_fund(self, mock_config_provider: Mock):
+        """Test a company listed twice in one fund counts once but sums its weight."""
+        aggregator = HoldingsAggregator(mock_config_provider)
+        funds = [
+            ProcessedFund(
+                "Fund A",
+                "₹100 Cr",
+                [ProcessedHolding("Company X", 2.0, 1), ProcessedHolding("Company X", 1.5, 2)],
+            )
+        ]
+
+        result = aggregator.aggregate_holdings(funds)
+
+        company_x = result.companies["Company X"]
+        assert company_x.fund_count == 1
+        assert company_x.total_weight == 3.5
+        assert company_x.sample_funds == ["Fund A"]
+
+    def test_aggregate_holdings_repeated_fund_counts_once(self, mock_config_provider: Mock):
+        """Test the same fund appearing twice is one fund, even with another fund between."""
+        aggregator = HoldingsAggregator(mock_config_provider)
+        funds = [
+            ProcessedFund("Fund A", "₹100 Cr", [ProcessedHolding("Company X", 2.0, 1)]),
+            ProcessedFund("Fund B", "₹200 Cr", [ProcessedHolding("Company X", 1.0, 1)]),
+            ProcessedFund("Fund A", "₹100 Cr", [ProcessedHolding("Company X", 2.0, 1)]),
+        ]
+
+        result = aggregator.aggregate_holdings(funds)
+
+        company_x = result.companies["Company X"]
+        assert company_x.fund_count == 2
+        assert company_x.total_weight == 5.0
+        assert company_x.sample_funds == ["Fund A", "Fund B"]
+        assert list(result.funds_info) == ["Fund A", "Fund B"]
+
 
 class TestHoldingsOutputBuilder:
     """Test HoldingsOutputBuilder with dependency injection."""
@@ -325,3 +360,22 @@ class TestHoldingsOutputBuilder:
         assert result["unique_companies"] > 0
         assert result["total_funds"] == 3
         assert result["total_files"] == 3
+
+    def test_build_category_output_formats_each_company_once(
+        self, mock_config_provider: Mock, sample_aggregated_data: AggregatedData
+    ):
+        """Test companies listed in several sections are formatted a single time."""
+        builder = HoldingsOutputBuilder(mock_config_provider)
+        original_format = builder._format_company_for_output
+        formatted_names: list[str] = []
+
+        def tracking_format(company: CompanyData) -> dict[str, Any]:
+            formatted_names.append(company.name)
+            return original_format(company)
+
+        builder._format_company_for_output = tracking_format  # type: ignore[method-assign]
+        result = builder.build_category_output("largeCap", sample_aggregated_data)
+
+        assert sorted(formatted_names) == ["Company A", "Company B", "Company C"]
+        assert [c["name"] for c in result["common_in_all_funds"]] == ["Company A"]
+        assert result["common_in_all_funds"][0] == result["top_by_total_weight"][0]
@@ -0,0 +1,529 @@
+"""Unit tests for scraping coordinator behaviour."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mfa.analysis.scraping.category_coordinator import CategoryScrapingCoordinator
+from mfa.config.settings import ConfigProvider
+from mfa.storage.json_store import JsonStore
+from mfa.storage.storage_config import StorageConfig
+
+
+class TestBaseScrapingCoordinator:
+    """Test shared scraping loop in BaseScrapingCoordinator."""
+
+    @pytest.fixture
+    def config_provider(self, temp_directory: Path) -> Mock:
+        """Mock ConfigProvider writing into a temporary directory."""
+        config_provider = Mock(spec=ConfigProvider)
+        mock_config = Mock()
+        mock_config.paths.output_dir = str(temp_directory)
+        mock_config.paths.analysis_dir = str(temp_directory / "analysis")
+        mock_config.scraping.delay_between_requests = 0
+        mock_config.scraping.max_concurrent_requests = 2
+        mock_config.scraping.max_concurrent_browsers = 1
+        mock_config.scraping.force_refresh = False
+        config_provider.get_config.return_value = mock_config
+        return config_provider
+
+    @pytest.fixture
+    def storage_config(self, temp_directory: Path) -> StorageConfig:
+        """Storage configuration for a holdings category."""
+        return StorageConfig(
+            should_save=True,
+            base_dir=str(temp_directory),
+            category="largeCap",
+            filename_prefix="coin_",
+            analysis_type="holdings",
+        )
+
+    @staticmethod
+    def _fake_document(url: str) -> dict[str, Any]:
+        return {"source_url": url, "data": {"fund_info": {}, "top_holdings": []}}
+
+    def test_scraped_documents_are_written_by_coordinator(
+        self, config_provider: Mock, storage_config: StorageConfig
+    ):
+        """Test documents are saved to the expected paths after the loop completes."""
+        urls = [
+            "https://coin.zerodha.com/mf/fund/INF000A01AA1/fund-a",
+            "https://coin.zerodha.com/mf/fund/INF000B01BB2/fund-b",
+        ]
+        scraper = Mock()
+        scraper.scrape.side_effect = lambda url, **_: self._fake_document(url)
+
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        coordinator._scraper = scraper
+        try:
+            results = coordinator._scrape_urls_with_delay(urls, 10, "api", storage_config)
+            expected_paths = coordinator._generate_expected_file_paths(
+                urls, "largeCap", storage_config
+            )
+        finally:
+            coordinator.close_session()
+
+        assert len(results) == 2
+        # Scrapers must not save themselves; the coordinator owns the write
+        for call in scraper.scrape.call_args_list:
+            assert call.kwargs["storage_config"].should_save is False
+        for url, path in zip(urls, expected_paths, strict=True):
+            assert JsonStore.load(Path(path))["source_url"] == url
+
+    def test_save_directory_is_resolved_once_per_batch(
+        self, config_provider: Mock, storage_config: StorageConfig
+    ):
+        """Test the category directory is resolved per batch, not for every URL."""
+        urls = [f"https://coin.zerodha.com/mf/fund/INF00{i}/fund-{i}" for i in range(4)]
+        scraper = Mock()
+        scraper.scrape.side_effect = lambda url, **_: self._fake_document(url)
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        coordinator._scraper = scraper
+
+        with patch.object(
+            coordinator.path_generator,
+            "generate_scraped_data_dir",
+            wraps=coordinator.path_generator.generate_scraped_data_dir,
+        ) as mock_dir:
+            try:
+                coordinator._scrape_urls(urls, 10, "api", storage_config)
+            finally:
+                coordinator.close_session()
+
+        # Once for the saved-today check and once for the batch's writes
+        assert mock_dir.call_count == 2
+        expected = coordinator._generate_expected_file_paths(urls, "largeCap", storage_config)
+        assert all(Path(path).is_file() for path in expected)
+
+    def test_failed_scrape_does_not_stop_loop(
+        self, config_provider: Mock, storage_config: StorageConfig
+    ):
+        """Test a failing URL is skipped and remaining URLs are still scraped."""
+        urls = ["https://example.com/fund/A/bad", "https://example.com/fund/B/good"]
+        scraper = Mock()
+        scraper.scrape.side_effect = [RuntimeError("boom"), self._fake_document(urls[1])]
+
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        coordinator._scraper = scraper
+        try:
+            results = coordinator._scrape_urls_with_delay(urls, 10, "api", storage_config)
+        finally:
+            coordinator.close_session()
+
+        assert [r["source_url"] for r in results] == [urls[1]]
+
+    def test_results_are_file_stubs_when_not_kept_in_memory(
+        self, config_provider: Mock, storage_config: StorageConfig
+    ):
+        """Test saved documents are replaced by path stubs when keep_in_memory is False."""
+        url = "https://coin.zerodha.com/mf/fund/INF000A01AA1/fund-a"
+        scraper = Mock()
+        scraper.scrape.return_value = self._fake_document(url)
+
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        coordinator._scraper = scraper
+        try:
+            results = coordinator._scrape_urls_with_delay(
+                [url], 10, "api", storage_config, keep_in_memory=False
+            )
+        finally:
+            coordinator.close_session()
+
+        assert results == [{"url": url, "status": "ok", "path": results[0]["path"]}]
+        assert JsonStore.load(Path(results[0]["path"]))["source_url"] == url
+
+    @pytest.mark.parametrize(
+        "scrape_method", ["_scrape_urls_with_delay", "_scrape_urls_concurrently"]
+    )
+    def test_failed_write_is_not_reported_as_scraped(
+        self, config_provider: Mock, storage_config: StorageConfig, scrape_method: str
+    ):
+        """Test a URL whose document could not be saved is dropped from the results."""
+        urls = [f"https://coin.zerodha.com/mf/fund/INF00{i}/fund-{i}" for i in range(3)]
+        scraper = Mock()
+        scraper.scrape.side_effect = lambda url, **_: self._fake_document(url)
+        save = JsonStore.save
+
+        def failing_save(data: dict[str, Any], file_path: Path) -> None:
+            if data["source_url"] == urls[1]:
+                raise OSError("disk full")
+            save(data, file_path)
+
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        coordinator._scraper = scraper
+        with patch.object(JsonStore, "save", side_effect=failing_save):
+            try:
+                results = getattr(coordinator, scrape_method)(
+                    urls, 10, "api", storage_config, keep_in_memory=False
+                )
+            finally:
+                coordinator.close_session()
+
+        assert [r["url"] for r in results] == [urls[0], urls[2]]
+        assert all(Path(r["path"]).is_file() for r in results)
+
+    def test_concurrent_scrape_preserves_url_order(
+        self, config_provider: Mock, storage_config: StorageConfig
+    ):
+        """Test concurrent scraping returns results in URL order and skips failures."""
+        urls = [f"https://coin.zerodha.com/mf/fund/INF00{i}/fund-{i}" for i in range(4)]
+        scraper = Mock()
+
+        def fake_scrape(url: str, **_: Any) -> dict[str, Any]:
+            if url == urls[1]:
+                raise RuntimeError("boom")
+            return self._fake_document(url)
+
+        scraper.scrape.side_effect = fake_scrape
+
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        coordinator._scraper = scraper
+        try:
+            results = coordinator._scrape_urls_concurrently(urls, 10, "api", storage_config)
+        finally:
+            coordinator.close_session()
+
+        assert [r["source_url"] for r in results] == [urls[0], urls[2], urls[3]]
+
+    def test_close_session_is_idempotent(self, config_provider: Mock):
+        """Test closing twice (e.g. finally block plus context exit) closes the scraper once."""
+        scraper = Mock()
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        coordinator._scraper = scraper
+
+        with coordinator:
+            coordinator.close_session()
+
+        scraper.close.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("scraper_type", "expected"),
+        [
+            ("api", "_scrape_urls_concurrently"),
+            ("hybrid", "_scrape_urls_hybrid"),
+            ("playwright", "_scrape_urls_with_delay"),
+        ],
+    )
+    def test_scrape_urls_parallelizes_only_thread_safe_scrapers(
+        self, config_provider: Mock, scraper_type: str, expected: str
+    ):
+        """Test API scraping runs in parallel while Playwright stays on one thread."""
+        coordinator = CategoryScrapingCoordinator(config_provider)
+
+        with patch.object(coordinator, expected, return_value=[]) as mock_scrape:
+            coordinator._scrape_urls(["https://a"], 10, scraper_type)
+
+        mock_scrape.assert_called_once_with(["https://a"], 10, scraper_type, None, True)
+
+    def test_playwright_urls_spread_over_browsers_when_allowed(self, config_provider: Mock):
+        """Test Playwright scraping uses browser workers when more than one is allowed."""
+        config_provider.get_config.return_value.scraping.max_concurrent_browsers = 2
+        coordinator = CategoryScrapingCoordinator(config_provider)
+
+        with patch.object(coordinator, "_scrape_urls_in_browsers", return_value=[]) as mock_scrape:
+            coordinator._scrape_urls(["https://a", "https://b"], 10, "playwright")
+
+        mock_scrape.assert_called_once_with(
+            ["https://a", "https://b"], 10, "playwright", None, True
+        )
+
+    def test_browser_workers_own_and_reuse_their_scrapers(
+        self, config_provider: Mock, storage_config: StorageConfig
+    ):
+        """Test each worker thread creates one scraper, keeps it across calls and closes it."""
+        config_provider.get_config.return_value.scraping.max_concurrent_browsers = 2
+        urls = [f"https://coin.zerodha.com/mf/fund/INF00{i}/fund-{i}" for i in range(4)]
+        created: dict[int, Mock] = {}
+        closed_on: list[int] = []
+        both_started = threading.Barrier(2, timeout=5)
+
+        def create_scraper(scraper_type: str, provider: Any) -> Mock:
+            thread_id = threading.get_ident()
+            scraper = Mock()
+
+            def fake_scrape(url: str, **_: Any) -> dict[str, Any]:
+                assert threading.get_ident() == thread_id
+                if url == urls[0] or url == urls[1]:
+                    both_started.wait()  # first two URLs must be in flight together
+                if url == urls[2]:
+                    raise RuntimeError("boom")
+                return self._fake_document(url)
+
+            scraper.scrape.side_effect = fake_scrape
+            scraper.close.side_effect = lambda: closed_on.append(threading.get_ident())
+            created[thread_id] = scraper
+            return scraper
+
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        with patch(
+            "mfa.analysis.scraping.base_coordinator.ScraperFactory.create_scraper",
+            side_effect=create_scraper,
+        ):
+            try:
+                first = coordinator._scrape_urls(urls, 10, "playwright", storage_config)
+                second = coordinator._scrape_urls(urls[3:], 10, "playwright")
+            finally:
+                coordinator.close_session()
+
+        assert [r["source_url"] for r in first] == [urls[0], urls[1], urls[3]]
+        assert [r["source_url"] for r in second] == [urls[3]]
+        assert len(created) == 2
+        assert sorted(closed_on) == sorted(created)
+
+    def test_hybrid_retries_only_api_failures_in_browsers(self, config_provider: Mock):
+        """Test hybrid scraping shares one API scraper and sends only its failures to browsers."""
+        urls = [f"https://coin.zerodha.com/mf/fund/INF00{i}/fund-{i}" for i in range(3)]
+        scrapers: dict[str, list[Mock]] = {"api": [], "playwright": []}
+
+        def create_scraper(scraper_type: str, provider: Any) -> Mock:
+            scraper = Mock()
+
+            def fake_scrape(url: str, **_: Any) -> dict[str, Any]:
+                if scraper_type == "api" and url == urls[1]:
+                    raise RuntimeError("API has no holdings for this fund")
+                return self._fake_document(url)
+
+            scraper.scrape.side_effect = fake_scrape
+            scrapers[scraper_type].append(scraper)
+            return scraper
+
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        with patch(
+            "mfa.analysis.scraping.base_coordinator.ScraperFactory.create_scraper",
+            side_effect=create_scraper,
+        ):
+            try:
+                results = coordinator._scrape_urls(urls, 10, "hybrid")
+            finally:
+                coordinator.close_session()
+
+        assert [r["source_url"] for r in results] == [urls[0], urls[2], urls[1]]
+        assert len(scrapers["api"]) == 1
+        assert [c.kwargs["url"] for c in scrapers["playwright"][0].scrape.call_args_list] == [
+            urls[1]
+        ]
+        assert all(s.close.called for s in scrapers["api"] + scrapers["playwright"])
+
+    @pytest.mark.parametrize("max_browsers", [1, 2])
+    def test_categories_share_browsers_for_the_whole_requirement(
+        self, config_provider: Mock, max_browsers: int
+    ):
+        """Test Playwright browsers are launched once per run, not once per category."""
+        config = config_provider.get_config.return_value
+        config.scraping.max_concurrent_browsers = max_browsers
+        config.analyses = {
+            "holdings": Mock(
+                path_template=None,
+                params=Mock(max_holdings=10, keep_in_memory=True),
+                data_requirements=Mock(scraper_type="playwright"),
+            )
+        }
+        requirement = Mock(
+            metadata={
+                "analysis_id": "holdings",
+                "categories": {
+                    "largeCap": ["https://coin.zerodha.com/mf/fund/INF001/a"],
+                    "midCap": ["https://coin.zerodha.com/mf/fund/INF002/b"],
+                    "smallCap": ["https://coin.zerodha.com/mf/fund/INF003/c"],
+                },
+            }
+        )
+        scraper = Mock()
+        scraper.scrape.side_effect = lambda url, **_: self._fake_document(url)
+
+        with patch(
+            "mfa.analysis.scraping.base_coordinator.ScraperFactory.create_scraper",
+            return_value=scraper,
+        ) as mock_create:
+            result = CategoryScrapingCoordinator(config_provider).scrape_for_requirement(
+                requirement
+            )
+
+        # Three categories, but never more browsers than allowed, each closed once
+        assert 1 <= mock_create.call_count <= max_browsers
+        assert scraper.close.call_count == mock_create.call_count
+        assert set(result["file_paths"]) == {"largeCap", "midCap", "smallCap"}
+
+    @pytest.mark.parametrize(
+        ("scraper_type", "max_browsers", "parallel"),
+        [("api", 1, True), ("playwright", 2, True), ("playwright", 1, False)],
+    )
+    def test_categories_run_in_parallel_when_scraper_is_shareable(
+        self, config_provider: Mock, scraper_type: str, max_browsers: int, parallel: bool
+    ):
+        """Test categories fan out unless a single browser pins scraping to one thread."""
+        config = config_provider.get_config.return_value
+        config.scraping.max_concurrent_browsers = max_browsers
+        config.analyses = {
+            "holdings": Mock(
+                path_template=None,
+                params=Mock(max_holdings=10, keep_in_memory=True),
+                data_requirements=Mock(scraper_type=scraper_type),
+            )
+        }
+        categories = {
+            "largeCap": ["https://coin.zerodha.com/mf/fund/INF001/a"],
+            "midCap": ["https://coin.zerodha.com/mf/fund/INF002/b"],
+            "smallCap": ["https://coin.zerodha.com/mf/fund/INF003/c"],
+        }
+        requirement = Mock(metadata={"analysis_id": "holdings", "categories": categories})
+        threads_by_category: dict[str, str] = {}
+
+        def fake_scrape_and_save(urls: list[str], category: str, *_: Any) -> tuple[list, list]:
+            threads_by_category[category] = threading.current_thread().name
+            return [self._fake_document(url) for url in urls], urls
+
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        with patch.object(
+            coordinator, "_scrape_and_save_category", side_effect=fake_scrape_and_save
+        ):
+            result = coordinator.scrape_for_requirement(requirement)
+
+        assert list(result["file_paths"]) == list(categories)
+        on_workers = [name.startswith("mfa-category") for name in threads_by_category.values()]
+        assert all(on_workers) if parallel else not any(on_workers)
+
+    def test_parallel_categories_share_the_request_limit(self, config_provider: Mock):
+        """Test categories scraped together never exceed max_concurrent_requests."""
+        config_provider.get_config.return_value.analyses = {
+            "holdings": Mock(
+                path_template=None,
+                params=Mock(max_holdings=10, keep_in_memory=True),
+                data_requirements=Mock(scraper_type="api"),
+            )
+        }
+        categories = {
+            category: [f"https://coin.zerodha.com/mf/fund/INF{category}{i}/fund" for i in range(3)]
+            for category in ("largeCap", "midCap", "smallCap")
+        }
+        requirement = Mock(metadata={"analysis_id": "holdings", "categories": categories})
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def fake_scrape(url: str, **_: Any) -> dict[str, Any]:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return self._fake_document(url)
+
+        scraper = Mock()
+        scraper.scrape.side_effect = fake_scrape
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        coordinator._scraper = scraper
+
+        result = coordinator.scrape_for_requirement(requirement)
+
+        assert scraper.scrape.call_count == 9
+        assert all(len(result["data"][category]) == 3 for category in categories)
+        # The fixture allows two concurrent requests across all categories
+        assert peak <= 2
+        assert coordinator._request_pool is None
+
+    @pytest.mark.parametrize("keep_in_memory", [True, False])
+    def test_url_in_several_categories_is_scraped_once(
+        self, config_provider: Mock, keep_in_memory: bool
+    ):
+        """Test a fund listed in two categories is fetched once and linked into both."""
+        config_provider.get_config.return_value.analyses = {
+            "holdings": Mock(
+                path_template=None,
+                params=Mock(max_holdings=10, keep_in_memory=keep_in_memory),
+                data_requirements=Mock(scraper_type="api"),
+            )
+        }
+        shared = "https://coin.zerodha.com/mf/fund/INF001/flexi"
+        only_mid = "https://coin.zerodha.com/mf/fund/INF002/mid"
+        requirement = Mock(
+            metadata={
+                "analysis_id": "holdings",
+                "categories": {"largeCap": [shared], "midCap": [shared, only_mid]},
+            }
+        )
+        scraper = Mock()
+        scraper.scrape.side_effect = lambda url, **_: self._fake_document(url)
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        coordinator._scraper = scraper
+
+        result = coordinator.scrape_for_requirement(requirement)
+
+        assert sorted(c.kwargs["url"] for c in scraper.scrape.call_args_list) == [
+            shared,
+            only_mid,
+        ]
+        large_path = Path(result["file_paths"]["largeCap"][0])
+        mid_paths = [Path(p) for p in result["file_paths"]["midCap"]]
+        assert len(mid_paths) == 2
+        assert all(p.is_file() for p in mid_paths)
+        shared_mid = next(p for p in mid_paths if p.name == large_path.name)
+        assert shared_mid.parent != large_path.parent
+        assert JsonStore.load(shared_mid) == JsonStore.load(large_path)
+        assert len(result["data"]["midCap"]) == 2
+        if keep_in_memory:
+            assert {r["source_url"] for r in result["data"]["midCap"]} == {shared, only_mid}
+        else:
+            assert {"url": shared, "status": "ok", "path": str(shared_mid)} in result["data"][
+                "midCap"
+            ]
+
+    @pytest.mark.parametrize("keep_in_memory", [True, False])
+    def test_documents_saved_today_are_not_scraped_again(
+        self, config_provider: Mock, storage_config: StorageConfig, keep_in_memory: bool
+    ):
+        """Test a second run on the same day reuses saved files instead of fetching."""
+        urls = [
+            "https://coin.zerodha.com/mf/fund/INF000A01AA1/fund-a",
+            "https://coin.zerodha.com/mf/fund/INF000B01BB2/fund-b",
+        ]
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        saved_path = coordinator._generate_expected_file_paths(urls, "largeCap", storage_config)[0]
+        JsonStore.save(self._fake_document(urls[0]), Path(saved_path))
+
+        scraper = Mock()
+        scraper.scrape.side_effect = lambda url, **_: self._fake_document(url)
+        coordinator._scraper = scraper
+        try:
+            results = coordinator._scrape_urls(
+                urls, 10, "api", storage_config, keep_in_memory=keep_in_memory
+            )
+        finally:
+            coordinator.close_session()
+
+        assert [c.kwargs["url"] for c in scraper.scrape.call_args_list] == [urls[1]]
+        if keep_in_memory:
+            assert [r["source_url"] for r in results] == urls
+        else:
+            assert results[0] == {"url": urls[0], "status": "ok", "path": saved_path}
+
+    def test_force_refresh_scrapes_saved_documents_again(
+        self, config_provider: Mock, storage_config: StorageConfig
+    ):
+        """Test force_refresh ignores files already saved for today."""
+        config_provider.get_config.return_value.scraping.force_refresh = True
+        url = "https://coin.zerodha.com/mf/fund/INF000A01AA1/fund-a"
+        coordinator = CategoryScrapingCoordinator(config_provider)
+        saved_path = coordinator._generate_expected_file_paths([url], "largeCap", storage_config)
+        JsonStore.save(self._fake_document(url), Path(saved_path[0]))
+
+        scraper = Mock()
+        scraper.scrape.side_effect = lambda url, **_: self._fake_document(url)
+        coordinator._scraper = scraper
+        try:
+            coordinator._scrape_urls([url], 10, "api", storage_config)
+        finally:
+            coordinator.close_session()
+
+        scraper.scrape.assert_called_once()
+
+    def test_unique_urls_preserves_first_seen_order(self):
+        """Test repeated and blank URLs are dropped before scraping."""
+        urls = ["https://b", " https://a ", "", "https://b", "https://a", "  "]
+
+        assert CategoryScrapingCoordinator._unique_urls(urls) == ["https://b", "https://a"]
@@ -1,5 +1,7 @@
 """Unit tests for CLI command handling."""
 
+import subprocess
+import sys
 from unittest.mock import Mock, patch
 
 import pytest
@@ -64,8 +66,8 @@ class TestCLIAnalyze:
         assert args.analysis_type is None
 
     @patch("sys.argv", ["analyze", "--list"])
-    @patch("mfa.cli.analyze.create_config_provider")
-    @patch("mfa.cli.analyze.AnalysisOrchestrator")
+    @patch("mfa.config.settings.create_config_provider")
+    @patch("mfa.orchestration.analysis_orchestrator.AnalysisOrchestrator")
     def test_main_list_analyses(self, mock_orchestrator_class, mock_create_config):
         """Test main function with list flag."""
         mock_config_provider = Mock()
@@ -86,9 +88,12 @@ class TestCLIAnalyze:
             mock_print.assert_any_call("  • fund-holdings")
             mock_print.assert_any_call("  • portfolio")
 
+        # Informational commands do not create output directories
+        mock_config_provider.get_config.return_value.ensure_directories.assert_not_called()
+
     @patch("sys.argv", ["analyze", "--status"])
-    @patch("mfa.cli.analyze.create_config_provider")
-    @patch("mfa.cli.analyze.AnalysisOrchestrator")
+    @patch("mfa.config.settings.create_config_provider")
+    @patch("mfa.orchestration.analysis_orchestrator.AnalysisOrchestrator")
     def test_main_show_status(self, mock_orchestrator_class, mock_create_config):
         """Test main function with status flag."""
         mock_config_provider = Mock()
@@ -107,8 +112,8 @@ class TestCLIAnalyze:
             mock_orchestrator.get_analysis_status.assert_called_once()
 
     @patch("sys.argv", ["analyze", "holdings"])
-    @patch("mfa.cli.analyze.create_config_provider")
-    @patch("mfa.cli.analyze.AnalysisOrchestrator")
+    @patch("mfa.config.settings.create_config_provider")
+    @patch("mfa.orchestration.analysis_orchestrator.AnalysisOrchestrator")
     def test_main_run_specific_analysis(self, mock_orchestrator_class, mock_create_config):
         """Test main function running specific analysis."""
         mock_config_provider = Mock()
@@ -121,9 +126,33 @@ class TestCLIAnalyze:
 
         # Should have called run_analysis with specific type
         mock_orchestrator.run_analysis.assert_called_once_with("holdings", None, False)
+        mock_config_provider.get_config.return_value.ensure_directories.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("argv", "forced"), [(["holdings"], False), (["holdings", "--force"], True)]
+    )
+    @patch("mfa.config.settings.create_config_provider")
+    @patch("mfa.orchestration.analysis_orchestrator.AnalysisOrchestrator")
+    def test_main_force_overrides_saved_document_reuse(
+        self, mock_orchestrator_class, mock_create_config, argv, forced
+    ):
+        """Test --force makes this run re-scrape funds already saved today."""
+        mock_config_provider = Mock()
+        mock_create_config.return_value = mock_config_provider
+
+        with patch("sys.argv", ["analyze", *argv]), patch("builtins.print"):
+            main()
+
+        if forced:
+            mock_config_provider.override_scraping.assert_called_once_with(force_refresh=True)
+        else:
+            mock_config_provider.override_scraping.assert_not_called()
+        mock_orchestrator_class.return_value.run_analysis.assert_called_once_with(
+            "holdings", None, False
+        )
 
     @patch("sys.argv", ["analyze", "--date", "20240903"])
-    @patch("mfa.cli.analyze.create_config_provider")
+    @patch("mfa.config.settings.create_config_provider")
     def test_main_missing_analysis_type(self, mock_create_config):
         """Test main function with missing analysis_type."""
         mock_config_provider = Mock()
@@ -134,8 +163,8 @@ class TestCLIAnalyze:
             main()
 
     @patch("sys.argv", ["analyze", "holdings"])
-    @patch("mfa.cli.analyze.create_config_provider")
-    @patch("mfa.cli.analyze.AnalysisOrchestrator")
+    @patch("mfa.config.settings.create_config_provider")
+    @patch("mfa.orchestration.analysis_orchestrator.AnalysisOrchestrator")
     def test_main_handles_orchestration_errors(self, mock_orchestrator_class, mock_create_config):
         """Test main function handles orchestration errors gracefully."""
         mock_config_provider = Mock()
@@ -150,7 +179,7 @@ class TestCLIAnalyze:
             main()
 
     @patch("sys.argv", ["analyze", "holdings"])
-    @patch("mfa.cli.analyze.create_config_provider")
+    @patch("mfa.config.settings.create_config_provider")
     def test_main_config_creation_failure(self, mock_create_config):
         """Test main function handles config creation failures."""
         mock_create_config.side_effect = Exception("Config creation failed")
@@ -159,8 +188,8 @@ class TestCLIAnalyze:
             main()
 
     @patch("sys.argv", ["analyze", "holdings"])
-    @patch("mfa.cli.analyze.create_config_provider")
-    @patch("mfa.cli.analyze.AnalysisOrchestrator")
+    @patch("mfa.config.settings.create_config_provider")
+    @patch("mfa.orchestration.analysis_orchestrator.AnalysisOrchestrator")
     def test_main_orchestrator_creation_failure(self, mock_orchestrator_class, mock_create_config):
         """Test main function handles orchestrator creation failures."""
         mock_config_provider = Mock()
@@ -172,8 +201,8 @@ class TestCLIAnalyze:
             main()
 
     @patch("sys.argv", ["analyze"])
-    @patch("mfa.cli.analyze.create_config_provider")
-    @patch("mfa.cli.analyze.AnalysisOrchestrator")
+    @patch("mfa.config.settings.create_config_provider")
+    @patch("mfa.orchestration.analysis_orchestrator.AnalysisOrchestrator")
     def test_main_no_analysis_type_no_flags(self, mock_orchestrator_class, mock_create_config):
         """Test main function when no analysis_type and no informational flags are provided."""
         mock_config_provider = Mock()
@@ -185,3 +214,67 @@ class TestCLIAnalyze:
         # Should exit when no analysis_type is provided and no informational flags
         with pytest.raises(SystemExit):
             main()
+
+    @pytest.mark.parametrize("help_flag", ["--help", "-h"])
+    @patch("mfa.cli.analyze.setup_logging")
+    @patch("mfa.config.settings.create_config_provider")
+    def test_main_help_skips_initialization(
+        self, mock_create_config, mock_setup_logging, help_flag
+    ):
+        """Test help exits before logging, configuration, or directory setup."""
+        with patch("sys.argv", ["analyze", "holdings", help_flag]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
+        mock_setup_logging.assert_not_called()
+        mock_create_config.assert_not_called()
+
+
+class TestCLIModeSniffing:
+    """Test the cheap informational-mode detection in the CLI."""
+
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (["--list"], "list"),
+            (["-l", "--verbose"], "list"),
+            (["--status"], "status"),
+            (["-s"], "status"),
+            (["holdings"], "full"),
+            (["--list", "--help"], "full"),
+            ([], "full"),
+        ],
+    )
+    def test_sniff_mode(self, argv, expected):
+        """Test informational flags are detected and help always uses the full parser."""
+        from mfa.cli.analyze import _sniff_mode
+
+        assert _sniff_mode(argv) == expected
+
+    def test_parse_info_args_fills_execution_defaults(self):
+        """Test the minimal parser provides every attribute main() reads."""
+        from mfa.cli.analyze import _parse_info_args
+
+        args = _parse_info_args(["--status", "--category", "midCap"])
+
+        assert args.status is True
+        assert args.list is False
+        assert args.analysis_type is None
+        assert args.analysis_only is False
+
+
+class TestCLIImportCost:
+    """Test the CLI module stays cheap to import."""
+
+    def test_import_defers_heavy_dependencies(self):
+        """Test importing the CLI loads no serialization, config or browser libraries."""
+        code = (
+            "import sys, mfa.cli.analyze; "
+            "print(','.join(m for m in ('orjson', 'pydantic', 'playwright') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
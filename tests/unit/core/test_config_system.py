@@ -1,11 +1,14 @@
 """Unit tests for configuration system with dependency injection."""
 
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import yaml
+from pydantic import ValidationError
 
 from mfa.config.settings import ConfigProvider, create_config_provider
 from mfa.core.exceptions import ConfigurationError
@@ -91,6 +94,7 @@ class TestConfigProvider:
             assert config.scraping.headless is True
             assert config.scraping.timeout_seconds == 30
             assert config.scraping.save_extracted_json is True
+            assert config.scraping.page_wait_until == "domcontentloaded"
 
             # Verify analyses
             assert "holdings" in config.analyses
@@ -98,6 +102,9 @@ class TestConfigProvider:
             assert holdings_config.enabled is True
             assert holdings_config.params.max_holdings == 10
 
+            # Orchestration section is optional and runs analyses in parallel by default
+            assert config.orchestration.parallel_analyses is True
+
     def test_config_provider_handles_missing_file(self):
         """Test ConfigProvider handles missing configuration file."""
         nonexistent_path = Path("/nonexistent/config.yaml")
@@ -144,6 +151,36 @@ class TestConfigProvider:
             assert "holdings" in enabled_analyses
             assert "disabled_analysis" not in enabled_analyses
 
+    def test_get_enabled_analyses_is_cached(self, sample_config_data: dict):
+        """Test get_enabled_analyses computes the enabled mapping only once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "test_config.yaml"
+
+            with open(config_path, "w") as f:
+                yaml.dump(sample_config_data, f)
+
+            config = ConfigProvider(config_path).get_config()
+
+            assert config.get_enabled_analyses() is config.get_enabled_analyses()
+            assert "_enabled_analyses" not in config.model_dump()
+
+    def test_provider_enabled_analyses_cache_follows_reload(self, sample_config_data: dict):
+        """Test provider lookups are memoized per loaded config and reset on reload."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "test_config.yaml"
+            config_path.write_text(yaml.dump(sample_config_data))
+            provider = ConfigProvider(config_path)
+
+            first = provider.get_enabled_analyses()
+            assert provider.get_enabled_analyses() is first
+
+            sample_config_data["analyses"]["holdings"]["enabled"] = False
+            config_path.write_text(yaml.dump(sample_config_data))
+            provider._load_config()
+
+            assert provider.get_enabled_analyses() == {}
+            assert "holdings" in first
+
     def test_get_analysis_config_returns_correct_config(self, sample_config_data: dict):
         """Test get_analysis_config returns specific analysis configuration."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -213,3 +250,257 @@ class TestConfigProvider:
 
             # Should keep the unresolved variable
             assert config.paths.output_dir == "${MISSING_VAR}"
+
+    def test_config_provider_reuses_parsed_yaml_until_file_changes(
+        self, sample_config_data: dict, temp_directory: Path
+    ):
+        """Test unchanged config files are parsed once, and edits are picked up."""
+        config_path = temp_directory / "cached_config.yaml"
+        config_path.write_text(yaml.dump(sample_config_data))
+
+        with patch("mfa.config.settings.yaml.load", wraps=yaml.load) as mock_load:
+            ConfigProvider(config_path)
+            ConfigProvider(config_path)
+            assert mock_load.call_count == 1
+
+            sample_config_data["scraping"]["timeout_seconds"] = 120
+            config_path.write_text(yaml.dump(sample_config_data))
+            provider = ConfigProvider(config_path)
+
+        assert mock_load.call_count == 2
+        assert provider.get_config().scraping.timeout_seconds == 120
+
+    def test_config_provider_reuses_validated_model(
+        self, sample_config_data: dict, temp_directory: Path
+    ):
+        """Test providers for an unchanged file share one validated MFAConfig."""
+        sample_config_data["paths"]["output_dir"] = "${SHARED_OUTPUT_DIR}"
+        config_path = temp_directory / "shared_config.yaml"
+        config_path.write_text(yaml.dump(sample_config_data))
+
+        with patch.dict("os.environ", {"SHARED_OUTPUT_DIR": "/same"}):
+            first = ConfigProvider(config_path).get_config()
+            second = ConfigProvider(config_path).get_config()
+        with patch.dict("os.environ", {"SHARED_OUTPUT_DIR": "/other"}):
+            third = ConfigProvider(config_path).get_config()
+
+        assert second is first
+        assert third is not first
+        assert third.paths.output_dir == "/other"
+
+    def test_shared_config_cannot_be_changed_through_one_provider(
+        self, sample_config_data: dict, temp_directory: Path
+    ):
+        """Test a change made through one provider is not visible through another."""
+        config_path = temp_directory / "frozen_config.yaml"
+        config_path.write_text(yaml.dump(sample_config_data))
+        first = ConfigProvider(config_path)
+        second = ConfigProvider(config_path)
+        timeout = second.get_config().scraping.timeout_seconds
+
+        with pytest.raises(ValidationError):
+            first.get_config().scraping.timeout_seconds = timeout + 1
+        first.override_scraping(timeout_seconds=timeout + 1)
+
+        assert first.get_config().scraping.timeout_seconds == timeout + 1
+        assert second.get_config().scraping.timeout_seconds == timeout
+        assert ConfigProvider(config_path).get_config().scraping.timeout_seconds == timeout
+
+    def test_config_provider_loads_dotenv_once(
+        self, sample_config_data: dict, temp_directory: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test the working directory's .env is read once, not per provider."""
+        from mfa.config import settings
+
+        config_path = temp_directory / "dotenv_config.yaml"
+        config_path.write_text(yaml.dump(sample_config_data))
+        (temp_directory / ".env").write_text("MFA_DOTENV_TEST=1\n")
+        monkeypatch.chdir(temp_directory)
+
+        with (
+            patch.object(settings, "_LOADED_DOTENV_PATHS", set()),
+            patch("mfa.config.settings.load_dotenv") as mock_load_dotenv,
+        ):
+            ConfigProvider(config_path)
+            ConfigProvider(config_path)
+
+        mock_load_dotenv.assert_called_once_with(temp_directory / ".env")
+
+    def test_config_provider_resolves_env_vars_on_cached_yaml(
+        self, sample_config_data: dict, temp_directory: Path
+    ):
+        """Test environment variables are resolved per load, not cached with the YAML."""
+        sample_config_data["paths"]["output_dir"] = "${CACHED_OUTPUT_DIR}"
+        config_path = temp_directory / "env_config.yaml"
+        config_path.write_text(yaml.dump(sample_config_data))
+
+        with patch.dict("os.environ", {"CACHED_OUTPUT_DIR": "/first"}):
+            first = ConfigProvider(config_path).get_config()
+        with patch.dict("os.environ", {"CACHED_OUTPUT_DIR": "/second"}):
+            second = ConfigProvider(config_path).get_config()
+
+        assert first.paths.output_dir == "/first"
+        assert second.paths.output_dir == "/second"
+
+    def test_resolve_env_vars_substitutes_every_occurrence(self, sample_config_data: dict):
+        """Test set, repeated, empty, and unset variables within one string."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "test_config.yaml"
+            config_path.write_text(yaml.dump(sample_config_data))
+            provider = ConfigProvider(config_path)
+
+        with patch.dict("os.environ", {"MFA_ROOT": "/data", "MFA_EMPTY": ""}):
+            resolved = provider._resolve_env_vars(
+                {"paths": ["${MFA_ROOT}/a:${MFA_ROOT}/b", "x${MFA_EMPTY}y", "${MFA_UNSET}"]}
+            )
+
+        assert resolved == {"paths": ["/data/a:/data/b", "xy", "${MFA_UNSET}"]}
+
+    def test_resolve_env_vars_does_not_expand_substituted_values(self, sample_config_data: dict):
+        """Test substituted values are inserted literally, never re-scanned."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "test_config.yaml"
+            config_path.write_text(yaml.dump(sample_config_data))
+            provider = ConfigProvider(config_path)
+
+        with patch.dict("os.environ", {"MFA_OUTER": "${MFA_INNER}", "MFA_INNER": "inner"}):
+            resolved = provider._resolve_env_vars({"path": "${MFA_OUTER}|${MFA_INNER}"})
+
+        assert resolved == {"path": "${MFA_INNER}|inner"}
+
+    def test_resolve_env_vars_skips_regex_for_plain_strings(self, sample_config_data: dict):
+        """Test strings without a ${ token never reach the regex engine."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "test_config.yaml"
+            config_path.write_text(yaml.dump(sample_config_data))
+            provider = ConfigProvider(config_path)
+
+        with patch("mfa.config.settings._ENV_VAR_PATTERN") as mock_pattern:
+            resolved = provider._resolve_env_vars({"a": "plain", "b": ["$HOME", "{x}"]})
+
+        mock_pattern.sub.assert_not_called()
+        assert resolved == {"a": "plain", "b": ["$HOME", "{x}"]}
+
+    def test_resolve_env_vars_copies_only_changed_paths(self, sample_config_data: dict):
+        """Test containers without substitutions are returned unchanged, not copied."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "test_config.yaml"
+            config_path.write_text(yaml.dump(sample_config_data))
+            provider = ConfigProvider(config_path)
+
+        raw = {
+            "paths": {"output_dir": "${MFA_OUT}", "analysis_dir": "outputs/analysis"},
+            "scraping": {"headless": True, "urls": ["https://a", "${MFA_UNSET}"]},
+        }
+        with patch.dict("os.environ", {"MFA_OUT": "/out"}):
+            resolved = provider._resolve_env_vars(raw)
+
+        assert resolved is not raw
+        assert resolved["paths"] == {"output_dir": "/out", "analysis_dir": "outputs/analysis"}
+        assert raw["paths"]["output_dir"] == "${MFA_OUT}"
+        assert resolved["scraping"] is raw["scraping"]
+        assert provider._resolve_env_vars(raw["scraping"]) is raw["scraping"]
+
+    def test_resolve_env_vars_handles_deeply_nested_documents(self, sample_config_data: dict):
+        """Test resolution walks arbitrarily deep trees without recursing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_path = Path(temp_dir) / "test_config.yaml"
+            config_path.write_text(yaml.dump(sample_config_data))
+            provider = ConfigProvider(config_path)
+
+        depth = sys.getrecursionlimit() + 100
+        raw: dict = {"leaf": "${MFA_DEEP}"}
+        for _ in range(depth):
+            raw = {"child": [raw]}
+
+        with patch.dict("os.environ", {"MFA_DEEP": "found"}):
+            resolved = provider._resolve_env_vars(raw)
+
+        for _ in range(depth):
+            resolved = resolved["child"][0]
+            raw = raw["child"][0]
+        assert resolved == {"leaf": "found"}
+        assert raw == {"leaf": "${MFA_DEEP}"}
+
+    def test_config_provider_uses_libyaml_loader_when_available(self):
+        """Test the C-accelerated safe loader is picked when PyYAML provides it."""
+        from mfa.config import settings
+
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert settings._YamlLoader is expected
+
+    def test_default_config_provider_is_created_once_on_first_use(self):
+        """Test the back-compat default provider is lazy and shared."""
+        from mfa.config import settings
+
+        settings.get_default_config_provider.cache_clear()
+        try:
+            with patch.object(settings, "ConfigProvider") as mock_provider_class:
+                mock_provider_class.assert_not_called()
+
+                first = settings.get_default_config_provider()
+                second = settings.get_default_config_provider()
+        finally:
+            settings.get_default_config_provider.cache_clear()
+
+        mock_provider_class.assert_called_once_with()
+        assert first is second
+
+    def test_importing_settings_reads_no_config(self, temp_directory: Path):
+        """Test importing the settings module performs no config file I/O."""
+        code = (
+            "import mfa.config.settings as s; "
+            "print(len(s._CONFIG_CACHE), s.get_default_config_provider.cache_info().currsize)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=temp_directory,
+        )
+
+        assert result.stdout.split() == ["0", "0"]
+
+    def test_config_provider_reads_working_directory_once(
+        self, sample_config_data: dict, temp_directory: Path
+    ):
+        """Test the working directory is looked up once per provider construction."""
+        config_path = temp_directory / "cwd_config.yaml"
+        config_path.write_text(yaml.dump(sample_config_data))
+
+        with patch("mfa.config.settings.Path.cwd", return_value=temp_directory) as mock_cwd:
+            provider = ConfigProvider(config_path)
+            provider._load_config()
+
+        mock_cwd.assert_called_once_with()
+
+    def test_get_config_returns_the_loaded_model(
+        self, sample_config_data: dict, temp_directory: Path
+    ):
+        """Test get_config hands out the model built at load time without rebuilding it."""
+        config_path = temp_directory / "memo_config.yaml"
+        config_path.write_text(yaml.dump(sample_config_data))
+        provider = ConfigProvider(config_path)
+
+        with patch("mfa.config.settings.MFAConfig") as mock_model:
+            configs = {id(provider.get_config()) for _ in range(3)}
+
+        mock_model.assert_not_called()
+        assert len(configs) == 1
+
+    def test_override_scraping_applies_to_one_provider(
+        self, sample_config_data: dict, temp_directory: Path
+    ):
+        """Test overrides replace settings for one provider without touching the shared model."""
+        config_path = temp_directory / "override_config.yaml"
+        config_path.write_text(yaml.dump(sample_config_data))
+        overridden = ConfigProvider(config_path)
+        untouched = ConfigProvider(config_path)
+
+        overridden.override_scraping(force_refresh=True)
+
+        assert overridden.get_config().scraping.force_refresh is True
+        assert overridden.get_config().paths == untouched.get_config().paths
+        assert untouched.get_config().scraping.force_refresh is False
+        assert ConfigProvider(config_path).get_config().scraping.force_refresh is False
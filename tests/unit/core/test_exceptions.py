@@ -56,6 +56,16 @@ class TestBaseException:
         assert error.context == {}
         assert str(error) == "Test error"
 
+    def test_mfa_error_shows_current_context_values(self):
+        """Test context values changed in place after creation are shown as they are now."""
+        files = ["a"]
+        error = MFAError("Test error", {"files": files})
+        assert str(error) == "Test error [files=['a']]"
+
+        files.append("b")
+
+        assert str(error) == "Test error [files=['a', 'b']]"
+
 
 class TestSpecificExceptions:
     """Test specific exception types."""
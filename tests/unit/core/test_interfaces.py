@@ -228,6 +228,18 @@ class TestBaseAnalyzer:
         assert hasattr(analyzer, "analysis_type")
         assert isinstance(analyzer.analysis_type, str)
 
+    def test_subclass_must_define_data_requirements(self, mock_config_provider):
+        """Test an analyzer that does not override get_data_requirements cannot be instantiated."""
+
+        class IncompleteAnalyzer(BaseAnalyzer):
+            def analyze(self, data_source: dict[str, Any], date: str) -> AnalysisResult:
+                return AnalysisResult(
+                    analysis_type=self.analysis_type, date=date, output_paths=[], summary={}
+                )
+
+        with pytest.raises(TypeError, match="get_data_requirements"):
+            IncompleteAnalyzer(mock_config_provider, "incomplete")  # type: ignore[abstract]
+
 
 class TestIAnalyzerInterface:
     """Test IAnalyzer interface contract."""
@@ -0,0 +1,69 @@
+"""Unit tests for extraction and analysis schema models."""
+
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from mfa.core.schemas import CompanyStat, ExtractedFundDocument, FundData, FundInfo, TopHolding
+
+
+class TestSchemaModels:
+    """Test schema records are immutable value objects."""
+
+    def test_records_reject_assignment(self):
+        """Test fields cannot be reassigned after construction."""
+        holding = TopHolding(rank=1, company_name="HDFC Bank", allocation_percentage="9.5%")
+        stat = CompanyStat(company="HDFC Bank", fund_count=3, total_weight=21.0, avg_weight=7.0)
+
+        with pytest.raises(ValidationError):
+            holding.rank = 2
+        with pytest.raises(ValidationError):
+            stat.fund_count = 4
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [("9.5%", 9.5), (" 12.34 % ", 12.34), ("7", 7.0), (3.25, 3.25), (4, 4.0), (None, 0.0)],
+    )
+    def test_top_holding_stores_allocation_numerically(self, raw, expected):
+        """Test scraped percentage text and numbers are both stored as floats."""
+        holding = TopHolding(rank=1, company_name="ITC", allocation_percentage=raw)
+
+        assert holding.allocation_percentage == expected
+        assert holding.model_dump()["allocation_percentage"] == expected
+
+    @pytest.mark.parametrize("raw", ["", "  ", "-", "N/A", "n/a%"])
+    def test_top_holding_treats_unparseable_allocation_as_zero(self, raw):
+        """Test placeholder allocation text is stored as 0.0 instead of failing the fund."""
+        holding = TopHolding(rank=1, company_name="ITC", allocation_percentage=raw)
+
+        assert holding.allocation_percentage == 0.0
+
+    def test_records_are_hashable_and_shareable(self):
+        """Test equal scalar records hash equally and can be shared between documents."""
+        first = TopHolding(rank=1, company_name="TCS", allocation_percentage="5%")
+        second = TopHolding(rank=1, company_name="TCS", allocation_percentage="5%")
+
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+        data = FundData(fund_info=FundInfo(fund_name="Fund A"), top_holdings=[first])
+        assert data.model_dump()["top_holdings"][0]["company_name"] == "TCS"
+
+    def test_document_json_dump_is_computed_once(self):
+        """Test saving and returning a document share a single JSON-mode dump."""
+        document = ExtractedFundDocument(
+            extraction_timestamp=datetime(2024, 9, 3, 10, 30),
+            source_url="https://coin.zerodha.com/mf/fund/INF000000001",
+            provider="zerodha_coin_api",
+            data=FundData(
+                fund_info=FundInfo(fund_name="Fund A"),
+                top_holdings=[TopHolding(rank=1, company_name="TCS", allocation_percentage=5)],
+            ),
+        )
+
+        dumped = document.to_json_dict()
+
+        assert document.to_json_dict() is dumped
+        assert dumped == document.model_dump(mode="json")
+        assert dumped["extraction_timestamp"] == "2024-09-03T10:30:00"
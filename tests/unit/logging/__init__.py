@@ -0,0 +1 @@
+"""Logging setup tests."""
@@ -0,0 +1,43 @@
+"""Unit tests for logging setup."""
+
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from mfa.logging.logger import logger, setup_logging
+
+
+class TestSetupLogging:
+    """Test the console and file sinks installed by setup_logging."""
+
+    @pytest.fixture(autouse=True)
+    def restore_default_sink(self) -> Iterator[None]:
+        """Drop the configured sinks after each test and restore loguru's default."""
+        yield
+        logger.remove()
+        logger.add(sys.stderr)
+
+    def test_console_sink_writes_to_stdout(
+        self, temp_directory: Path, capsys: pytest.CaptureFixture[str]
+    ):
+        """Test records reach stdout through the stream sink."""
+        setup_logging(temp_directory)
+
+        logger.info("console message")
+
+        captured = capsys.readouterr()
+        assert "console message" in captured.out
+        assert captured.out.endswith("\n")
+        assert "console message" not in captured.err
+
+    def test_file_sink_writes_log_file(self, temp_directory: Path):
+        """Test records are also written to the rotating log file."""
+        setup_logging(temp_directory)
+
+        logger.info("file message")
+        logger.complete()
+        logger.remove()
+
+        assert "file message" in (temp_directory / "mfa.log").read_text()
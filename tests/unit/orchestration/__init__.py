@@ -0,0 +1 @@
+"""Orchestration layer tests."""
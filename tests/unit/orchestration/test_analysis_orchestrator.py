@@ -0,0 +1,390 @@
+"""Unit tests for AnalysisOrchestrator."""
+
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mfa.core.exceptions import AnalysisError, OrchestrationError, ScrapingError
+from mfa.logging.logger import logger
+from mfa.orchestration.analysis_orchestrator import AnalysisOrchestrator
+
+
+class TestListJsonFiles:
+    """Test discovery of existing scraped files for analysis-only runs."""
+
+    def test_lists_only_visible_json_files(self, temp_directory: Path):
+        """Test only regular, non-hidden .json files are returned."""
+        (temp_directory / "fund_a.json").write_text("{}")
+        (temp_directory / "fund_b.json").write_text("{}")
+        (temp_directory / ".partial.json").write_text("{}")
+        (temp_directory / "notes.txt").write_text("")
+        (temp_directory / "nested.json").mkdir()
+
+        files = AnalysisOrchestrator._list_json_files(temp_directory)
+
+        assert files is not None
+        assert sorted(Path(f).name for f in files) == ["fund_a.json", "fund_b.json"]
+
+    def test_missing_directory_returns_none(self, temp_directory: Path):
+        """Test a missing directory is distinguished from an empty one."""
+        assert AnalysisOrchestrator._list_json_files(temp_directory / "missing") is None
+        assert AnalysisOrchestrator._list_json_files(temp_directory) == []
+
+    def test_discovers_category_and_targeted_files(self, temp_directory: Path):
+        """Test analysis-only discovery maps each category directory to its JSON files."""
+        analysis_dir = temp_directory / "20240903" / "holdings"
+        (analysis_dir / "largeCap").mkdir(parents=True)
+        (analysis_dir / "largeCap" / "fund_a.json").write_text("{}")
+        (analysis_dir / "fund_t.json").write_text("{}")
+
+        config_provider = Mock()
+        config_provider.get_config.return_value.paths.output_dir = str(temp_directory)
+        orchestrator = AnalysisOrchestrator(config_provider)
+
+        categories = Mock(
+            strategy=Mock(value="categories"),
+            metadata={"analysis_id": "holdings", "categories": {"largeCap": [], "midCap": []}},
+        )
+        targeted = Mock(strategy=Mock(value="targeted_funds"), metadata={"analysis_id": "holdings"})
+
+        category_info = orchestrator._discover_existing_data_files(categories, "20240903")
+        targeted_info = orchestrator._discover_existing_data_files(targeted, "20240903")
+
+        assert category_info["file_paths"] == {
+            "largeCap": [str(analysis_dir / "largeCap" / "fund_a.json")],
+            "midCap": [],
+        }
+        assert targeted_info["file_paths"] == {"targeted": [str(analysis_dir / "fund_t.json")]}
+
+    def test_missing_categories_are_not_listed(self, temp_directory: Path):
+        """Test only category directories present in the analysis folder are scanned."""
+        (temp_directory / "20240903" / "holdings" / "largeCap").mkdir(parents=True)
+
+        config_provider = Mock()
+        config_provider.get_config.return_value.paths.output_dir = str(temp_directory)
+        orchestrator = AnalysisOrchestrator(config_provider)
+        requirements = Mock(
+            strategy=Mock(value="categories"),
+            metadata={"analysis_id": "holdings", "categories": {"largeCap": [], "midCap": []}},
+        )
+
+        with patch.object(AnalysisOrchestrator, "_list_json_files", return_value=[]) as mock_list:
+            info = orchestrator._discover_existing_data_files(requirements, "20240903")
+            missing = orchestrator._discover_existing_data_files(requirements, "20990101")
+
+        assert mock_list.call_count == 1
+        assert mock_list.call_args.args[0].endswith("largeCap")
+        assert info["file_paths"] == {"largeCap": [], "midCap": []}
+        assert missing["file_paths"] == {"largeCap": [], "midCap": []}
+
+    def test_discovery_messages_are_formatted_lazily(self, temp_directory: Path):
+        """Test lazily formatted discovery messages render the category and path."""
+        (temp_directory / "20240903" / "holdings" / "largeCap").mkdir(parents=True)
+
+        config_provider = Mock()
+        config_provider.get_config.return_value.paths.output_dir = str(temp_directory)
+        orchestrator = AnalysisOrchestrator(config_provider)
+        requirements = Mock(
+            strategy=Mock(value="categories"),
+            metadata={"analysis_id": "holdings", "categories": {"largeCap": [], "midCap": []}},
+        )
+
+        messages: list[str] = []
+        sink_id = logger.add(lambda m: messages.append(m.record["message"]), level="DEBUG")
+        try:
+            orchestrator._discover_existing_data_files(requirements, "20240903")
+        finally:
+            logger.remove(sink_id)
+
+        missing_dir = temp_directory / "20240903" / "holdings" / "midCap"
+        assert "📁 Found 0 files for category 'largeCap'" in messages
+        assert f"📁 No data directory found for category 'midCap': {missing_dir}" in messages
+
+    def test_current_date_matches_datetime_format(self):
+        """Test the current date string matches the YYYYMMDD format used for folders."""
+        orchestrator = AnalysisOrchestrator(Mock())
+        fixed = time.struct_time((2024, 9, 3, 23, 59, 59, 1, 247, 0))
+
+        with patch("mfa.orchestration.analysis_orchestrator.time.localtime", return_value=fixed):
+            assert orchestrator._get_current_date() == "20240903"
+
+        before = datetime.now().strftime("%Y%m%d")
+        current = orchestrator._get_current_date()
+        after = datetime.now().strftime("%Y%m%d")
+        assert current in {before, after}
+
+
+class TestRunAnalysisPipelining:
+    """Test that analyses overlap analysis of one with preparation of the next."""
+
+    @pytest.fixture
+    def orchestrator(self) -> AnalysisOrchestrator:
+        """Orchestrator with two enabled analyses, run one after the other."""
+        config_provider = Mock()
+        config = config_provider.get_config.return_value
+        config.get_enabled_analyses.return_value = {"holdings": Mock(), "portfolio": Mock()}
+        config.orchestration.parallel_analyses = False
+        return AnalysisOrchestrator(config_provider)
+
+    def test_next_analysis_prepares_while_previous_analyzes(
+        self, orchestrator: AnalysisOrchestrator
+    ):
+        """Test portfolio scraping runs while holdings analysis is still in progress."""
+        portfolio_prepared = threading.Event()
+        overlapped: list[bool] = []
+
+        def prepare(analysis_id, date, analysis_only):
+            if analysis_id == "portfolio":
+                portfolio_prepared.set()
+            return Mock(), {"analysis": analysis_id}
+
+        def complete(analysis_id, analyzer, scraped_data_info, date):
+            if analysis_id == "holdings":
+                overlapped.append(portfolio_prepared.wait(timeout=5))
+
+        with (
+            patch.object(AnalysisOrchestrator, "_prepare_analysis", side_effect=prepare),
+            patch.object(
+                AnalysisOrchestrator, "_complete_analysis", side_effect=complete
+            ) as mock_complete,
+        ):
+            orchestrator.run_analysis()
+
+        assert overlapped == [True]
+        assert [c.args[0] for c in mock_complete.call_args_list] == ["holdings", "portfolio"]
+
+    def test_run_date_is_resolved_once(self, orchestrator: AnalysisOrchestrator):
+        """Test every analysis and phase of one run receives the same date."""
+        with (
+            patch.object(
+                AnalysisOrchestrator, "_get_current_date", return_value="20240903"
+            ) as mock_date,
+            patch.object(
+                AnalysisOrchestrator, "_prepare_analysis", return_value=(Mock(), {})
+            ) as mock_prepare,
+            patch.object(AnalysisOrchestrator, "_complete_analysis") as mock_complete,
+        ):
+            orchestrator.run_analysis()
+
+        mock_date.assert_called_once_with()
+        assert [c.args[1] for c in mock_prepare.call_args_list] == ["20240903", "20240903"]
+        assert [c.args[3] for c in mock_complete.call_args_list] == ["20240903", "20240903"]
+
+    def test_analysis_failure_propagates(self, orchestrator: AnalysisOrchestrator):
+        """Test a failure in a background analysis is raised to the caller."""
+        with (
+            patch.object(AnalysisOrchestrator, "_prepare_analysis", return_value=(Mock(), {})),
+            patch.object(
+                AnalysisOrchestrator, "_complete_analysis", side_effect=OrchestrationError("boom")
+            ),
+            pytest.raises(OrchestrationError, match="boom"),
+        ):
+            orchestrator.run_analysis()
+
+    def test_completion_is_logged_as_one_record(self, orchestrator: AnalysisOrchestrator):
+        """Test the success summary of an analysis is emitted as a single log record."""
+        analyzer = Mock()
+        analyzer.analyze.return_value = Mock(output_paths=[Path("a.json")], summary={"funds": 3})
+
+        messages: list[str] = []
+        sink_id = logger.add(lambda m: messages.append(m.record["message"]), level="INFO")
+        try:
+            orchestrator._complete_analysis("holdings", analyzer, {}, "20240903")
+        finally:
+            logger.remove(sink_id)
+
+        assert messages == [
+            "✅ Analysis 'holdings' completed successfully\n"
+            "   📁 Output files: 1\n"
+            "   📈 Summary: {'funds': 3}"
+        ]
+
+    def test_requested_analysis_must_be_enabled(self, orchestrator: AnalysisOrchestrator):
+        """Test an unknown analysis type fails before any analysis is prepared."""
+        with (
+            patch.object(AnalysisOrchestrator, "_prepare_analysis") as mock_prepare,
+            pytest.raises(OrchestrationError, match="not found or not enabled"),
+        ):
+            orchestrator.run_analysis("sectors")
+
+        mock_prepare.assert_not_called()
+
+    def test_only_analysis_errors_pass_through(self, orchestrator: AnalysisOrchestrator):
+        """Test analysis errors are re-raised as-is while other errors are wrapped."""
+        error = AnalysisError("bad data")
+        with pytest.raises(AnalysisError) as passed:
+            orchestrator._raise_analysis_failure("holdings", error)
+        with pytest.raises(OrchestrationError, match="Unexpected error") as wrapped:
+            orchestrator._raise_analysis_failure("holdings", ScrapingError("timeout"))
+
+        assert passed.value is error
+        assert isinstance(wrapped.value.__cause__, ScrapingError)
+
+
+class TestRunAnalysisParallel:
+    """Test that independent analyses run concurrently when enabled."""
+
+    @pytest.fixture
+    def orchestrator(self) -> AnalysisOrchestrator:
+        """Orchestrator with two enabled analyses and parallel runs enabled."""
+        config_provider = Mock()
+        config = config_provider.get_config.return_value
+        config.get_enabled_analyses.return_value = {"holdings": Mock(), "portfolio": Mock()}
+        config.orchestration.parallel_analyses = True
+        return AnalysisOrchestrator(config_provider)
+
+    def test_analyses_prepare_concurrently(self, orchestrator: AnalysisOrchestrator):
+        """Test both analyses are in their preparation phase at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def prepare(analysis_id, date, analysis_only):
+            barrier.wait()
+            return Mock(), {"analysis": analysis_id}
+
+        with (
+            patch.object(AnalysisOrchestrator, "_prepare_analysis", side_effect=prepare),
+            patch.object(AnalysisOrchestrator, "_complete_analysis") as mock_complete,
+        ):
+            orchestrator.run_analysis()
+
+        assert sorted(c.args[0] for c in mock_complete.call_args_list) == [
+            "holdings",
+            "portfolio",
+        ]
+
+    def test_failure_keeps_its_type(self, orchestrator: AnalysisOrchestrator):
+        """Test an analysis error raised in a worker reaches the caller unchanged."""
+
+        def prepare(analysis_id, date, analysis_only):
+            if analysis_id == "portfolio":
+                raise AnalysisError("portfolio broke")
+            return Mock(), {}
+
+        with (
+            patch.object(AnalysisOrchestrator, "_prepare_analysis", side_effect=prepare),
+            patch.object(AnalysisOrchestrator, "_complete_analysis") as mock_complete,
+            pytest.raises(AnalysisError, match="portfolio broke"),
+        ):
+            orchestrator.run_analysis()
+
+        mock_complete.assert_called_once()
+        assert mock_complete.call_args.args[0] == "holdings"
+
+    def test_scraping_is_serialized_across_analyses(self, orchestrator: AnalysisOrchestrator):
+        """Test concurrent analyses never run two scraping coordinators at once."""
+        active = 0
+        peak = 0
+        counter_lock = threading.Lock()
+
+        def scrape(requirements):
+            nonlocal active, peak
+            with counter_lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with counter_lock:
+                active -= 1
+            return {"file_paths": {}}
+
+        coordinator = Mock()
+        coordinator.scrape_for_requirement.side_effect = scrape
+        requirements = Mock(strategy=Mock(value="categories"))
+
+        with patch(
+            "mfa.orchestration.analysis_orchestrator.ScrapingCoordinatorFactory.create_coordinator",
+            return_value=coordinator,
+        ):
+            threads = [
+                threading.Thread(
+                    target=orchestrator._scrape_and_save_data, args=(requirements, "20240903")
+                )
+                for _ in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert coordinator.scrape_for_requirement.call_count == 3
+        assert peak == 1
+
+    def test_single_analysis_runs_inline(self, orchestrator: AnalysisOrchestrator):
+        """Test a single requested analysis does not start a parallel pool."""
+        with (
+            patch.object(AnalysisOrchestrator, "_run_analyses_in_parallel") as mock_parallel,
+            patch.object(AnalysisOrchestrator, "_prepare_analysis", return_value=(Mock(), {})),
+            patch.object(AnalysisOrchestrator, "_complete_analysis") as mock_complete,
+        ):
+            orchestrator.run_analysis("holdings")
+
+        mock_parallel.assert_not_called()
+        mock_complete.assert_called_once()
+
+
+class TestOrchestratorConfigAccess:
+    """Test the orchestrator reads the loaded configuration once."""
+
+    def test_instances_have_no_attribute_dict(self):
+        """Test the orchestrator keeps its state in slots only."""
+        orchestrator = AnalysisOrchestrator(Mock())
+
+        assert not hasattr(orchestrator, "__dict__")
+        with pytest.raises(AttributeError):
+            orchestrator.extra = "value"  # type: ignore[attr-defined]
+
+    def test_config_is_fetched_once(self):
+        """Test repeated status queries reuse the configuration fetched at construction."""
+        config_provider = Mock()
+        config_provider.get_config.return_value.analyses = {
+            "holdings": Mock(enabled=True, data_requirements=Mock(scraping_strategy="categories"))
+        }
+        orchestrator = AnalysisOrchestrator(config_provider)
+
+        for _ in range(3):
+            status = orchestrator.get_analysis_status()
+
+        config_provider.get_config.assert_called_once_with()
+        assert status == {
+            "holdings": {"enabled": True, "type": "holdings", "strategy": "categories"}
+        }
+
+
+class TestOrchestratorImportCost:
+    """Test informational and analysis-only runs do not load scraper backends."""
+
+    def test_import_defers_scraper_backends(self):
+        """Test importing the orchestrator loads neither Playwright nor requests."""
+        code = (
+            "import sys, mfa.orchestration.analysis_orchestrator; "
+            "print(','.join(m for m in ('playwright', 'requests') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == ""
+
+    def test_plugins_are_imported_on_first_use(self):
+        """Test listing types loads no analyzer, and creating one imports only that one."""
+        code = (
+            "import sys; from unittest.mock import Mock; "
+            "from mfa.orchestration.analysis_orchestrator import AnalysisOrchestrator; "
+            "from mfa.analysis.factories import AnalyzerFactory; "
+            "loaded = lambda: [m.rsplit('.', 1)[1] for m in ("
+            "'mfa.analysis.analyzers.holdings', 'mfa.analysis.analyzers.portfolio', "
+            "'mfa.analysis.scraping.category_coordinator') if m in sys.modules]; "
+            "print(AnalysisOrchestrator(Mock()).list_available_analyses(), loaded()); "
+            "AnalyzerFactory.create_analyzer('portfolio', Mock()); "
+            "print(loaded())"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.splitlines() == ["['holdings', 'portfolio'] []", "['portfolio']"]
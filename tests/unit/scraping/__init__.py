@@ -0,0 +1 @@
+"""Scraper tests."""
@@ -0,0 +1,122 @@
+"""Unit tests for HTTPClient request pacing, retries, connection pooling and JSON decoding."""
+
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mfa.scraping.core.http_client import HTTPClient, HTTPClientError
+from mfa.scraping.zerodha_api import ZerodhaAPIFundScraper
+
+
+class TestHTTPClientRateLimit:
+    """Test request start times are spaced by the configured delay."""
+
+    def test_reserved_slots_are_spaced_by_delay(self):
+        """Test back-to-back reservations wait progressively longer."""
+        client = HTTPClient()
+
+        with patch("mfa.scraping.core.http_client.time.monotonic", return_value=100.0):
+            waits = [client._reserve_request_slot(0.5) for _ in range(3)]
+
+        assert waits == pytest.approx([0.0, 0.5, 1.0])
+
+    def test_no_wait_once_delay_has_elapsed(self):
+        """Test a request after a quiet period starts immediately."""
+        client = HTTPClient()
+
+        with patch("mfa.scraping.core.http_client.time.monotonic", side_effect=[100.0, 105.0]):
+            client._reserve_request_slot(0.5)
+            assert client._reserve_request_slot(0.5) == 0.0
+
+    def test_get_json_with_delay_sleeps_for_reserved_slot(self):
+        """Test the caller sleeps only for its reserved wait before fetching."""
+        client = HTTPClient()
+
+        with (
+            patch.object(client, "_reserve_request_slot", return_value=0.25),
+            patch.object(client, "get_json", return_value={"ok": True}) as mock_get,
+            patch("mfa.scraping.core.http_client.time.sleep") as mock_sleep,
+        ):
+            assert client.get_json_with_delay("https://api", delay=0.5) == {"ok": True}
+
+        mock_sleep.assert_called_once_with(0.25)
+        mock_get.assert_called_once_with("https://api")
+
+
+class TestHTTPClientRetry:
+    """Test retries back off with jitter and honour rate limiting."""
+
+    def _retry(self, client: HTTPClient) -> Any:
+        return client._session.get_adapter("https://").max_retries
+
+    def test_rate_limited_responses_are_retried(self):
+        """Test 429 is retried by default and Retry-After is respected."""
+        retry = self._retry(HTTPClient())
+
+        assert 429 in retry.status_forcelist
+        assert retry.respect_retry_after_header
+
+    def test_backoff_is_jittered_up_to_exponential_delay(self):
+        """Test each backoff is drawn between zero and the exponential delay."""
+        retry = self._retry(HTTPClient(backoff_factor=0.5))
+        for _ in range(3):
+            retry = retry.increment(method="GET", url="/fund.json")
+
+        with patch("mfa.scraping.core.http_client.random.uniform", return_value=0.3) as uniform:
+            assert retry.get_backoff_time() == 0.3
+
+        uniform.assert_called_once_with(0, 2.0)
+
+    def test_retry_policy_survives_increment(self):
+        """Test urllib3 keeps the jittered policy when it copies the retry state."""
+        retry = self._retry(HTTPClient())
+
+        assert type(retry.increment(method="GET", url="/fund.json")) is type(retry)
+
+
+class TestHTTPClientConnectionPool:
+    """Test keep-alive connections are pooled for concurrent callers."""
+
+    def test_pool_is_sized_for_concurrent_callers(self):
+        """Test the mounted adapters keep as many connections as requested."""
+        client = HTTPClient(pool_maxsize=16)
+
+        for prefix in ("http://", "https://"):
+            assert client._session.get_adapter(prefix)._pool_maxsize == 16
+
+    @pytest.mark.parametrize(("concurrency", "expected"), [(24, 24), (4, 10)])
+    def test_api_scraper_pool_covers_its_concurrency(self, concurrency: int, expected: int):
+        """Test the API scraper sizes its pool to its concurrency, never below the default."""
+        scraper = ZerodhaAPIFundScraper(max_concurrent_requests=concurrency)
+
+        assert scraper._initialize_http_client().pool_maxsize == expected
+
+
+class TestHTTPClientJSONDecoding:
+    """Test responses are decoded from their raw bytes."""
+
+    def _response(self, content: bytes) -> Mock:
+        response = Mock(content=content)
+        response.raise_for_status.return_value = None
+        response.json.side_effect = AssertionError("requests decoder should not be used")
+        return response
+
+    def test_get_json_decodes_raw_content(self):
+        """Test the body bytes are parsed without going through response.json()."""
+        client = HTTPClient()
+
+        with patch.object(
+            client._session, "get", return_value=self._response(b'{"holdings": [1, 2.5]}')
+        ):
+            assert client.get_json("https://api") == {"holdings": [1, 2.5]}
+
+    def test_invalid_json_raises_client_error(self):
+        """Test malformed bodies still surface as HTTPClientError."""
+        client = HTTPClient()
+
+        with (
+            patch.object(client._session, "get", return_value=self._response(b"<html>")),
+            pytest.raises(HTTPClientError, match="Invalid JSON response"),
+        ):
+            client.get_json("https://api")
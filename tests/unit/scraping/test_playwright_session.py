@@ -0,0 +1,339 @@
+"""Unit tests for Playwright session reuse."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from playwright.sync_api import TimeoutError as PwTimeoutError
+
+from mfa.scraping.core.playwright_scraper import (
+    BLOCKED_RESOURCES_GLOB,
+    PlaywrightScraper,
+    PlaywrightSession,
+)
+from mfa.scraping.scraper_factory import ScraperFactory
+from mfa.scraping.zerodha_coin import ZerodhaCoinScraper
+
+
+class _FakeSession(PlaywrightSession):
+    """Session that records lifecycle calls instead of launching a browser."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.open_calls = 0
+        self.close_calls = 0
+
+    def open(self) -> None:
+        if self.is_open:
+            return
+        self.open_calls += 1
+        self._p = object()  # type: ignore[assignment]
+
+    def close(self) -> None:
+        self.close_calls += 1
+        self._p = None
+
+
+class TestPlaywrightSessionReuse:
+    """Test that one browser session serves a whole batch of URLs."""
+
+    def test_session_context_manager(self):
+        """Test the session opens on enter and closes on exit."""
+        session = _FakeSession()
+
+        with session as entered:
+            assert entered is session
+            assert session.is_open
+
+        assert not session.is_open
+        assert (session.open_calls, session.close_calls) == (1, 1)
+
+    def test_scrape_many_opens_owned_session_once(self):
+        """Test an owned session stays open across URLs instead of relaunching per URL."""
+        scraper = ZerodhaCoinScraper()
+        session = _FakeSession()
+        scraper.session = session
+
+        with (
+            patch.object(scraper, "_navigate_to_fund_page"),
+            patch.object(scraper, "_prepare_holdings_section"),
+            patch.object(scraper, "_extract_fund_data", return_value=("Fund", {}, [])),
+            patch.object(scraper, "_log_extraction_results"),
+            patch.object(scraper, "_build_and_optionally_save_document", return_value={}),
+        ):
+            results = scraper.scrape_many(["https://a", "https://b", "https://c"])
+
+        assert len(results) == 3
+        assert (session.open_calls, session.close_calls) == (1, 1)
+
+    def test_single_scrape_closes_owned_session(self):
+        """Test a standalone scrape still cleans up the browser it opened."""
+        scraper = ZerodhaCoinScraper()
+        session = _FakeSession()
+        scraper.session = session
+
+        with (
+            patch.object(scraper, "_navigate_to_fund_page"),
+            patch.object(scraper, "_prepare_holdings_section"),
+            patch.object(scraper, "_extract_fund_data", return_value=("Fund", {}, [])),
+            patch.object(scraper, "_log_extraction_results"),
+            patch.object(scraper, "_build_and_optionally_save_document", return_value={}),
+        ):
+            scraper.scrape("https://a")
+
+        assert (session.open_calls, session.close_calls) == (1, 1)
+
+
+class TestPlaywrightNavigation:
+    """Test how long navigation waits before extraction starts."""
+
+    def test_goto_waits_for_dom_by_default(self):
+        """Test navigation returns once the DOM is ready rather than on network idle."""
+        session = PlaywrightSession(nav_timeout_ms=15000)
+        session._page = Mock(url="https://a")
+
+        session.goto("https://a")
+
+        session._page.goto.assert_called_once_with(
+            "https://a", timeout=15000, wait_until="domcontentloaded"
+        )
+
+    def test_wait_until_is_passed_through_scraper(self):
+        """Test a scraper-owned session uses the requested load event."""
+        scraper = ZerodhaCoinScraper(wait_until="networkidle")
+        scraper.session._page = Mock(url="https://a")
+
+        scraper.session.goto("https://a")
+
+        assert scraper.session._page.goto.call_args.kwargs["wait_until"] == "networkidle"
+
+    def test_dom_timeout_is_not_retried(self):
+        """Test a timeout while waiting for the DOM is raised instead of waiting again."""
+        session = PlaywrightSession(nav_timeout_ms=15000)
+        session._page = Mock(url="https://a")
+        session._page.goto.side_effect = PwTimeoutError("timed out")
+
+        with pytest.raises(PwTimeoutError):
+            session.goto("https://a")
+
+        session._page.wait_for_load_state.assert_not_called()
+
+    def test_open_blocks_images_and_fonts(self):
+        """Test new browser contexts abort image and font requests unless disabled."""
+        for block, routed in ((True, 1), (False, 0)):
+            session = PlaywrightSession(block_resources=block)
+            with patch("mfa.scraping.core.playwright_scraper.sync_playwright") as mock_playwright:
+                session.open()
+
+            context = mock_playwright.return_value.start.return_value.chromium.launch.return_value.new_context.return_value
+            assert context.route.call_count == routed
+            if routed:
+                assert context.route.call_args.args[0] == BLOCKED_RESOURCES_GLOB
+
+    def test_scraper_goto_waits_for_holdings_markup(self):
+        """Test scrapers block only on the holdings markup after navigation."""
+        scraper = ZerodhaCoinScraper()
+        page = Mock(url="https://a")
+        scraper.session._p = object()  # type: ignore[assignment]
+        scraper.session._page = page
+
+        assert scraper.goto("https://a") is page
+
+        page.wait_for_selector.assert_called_once_with(
+            PlaywrightScraper.HOLDINGS_READY_SELECTOR,
+            timeout=PlaywrightScraper.HOLDINGS_READY_TIMEOUT_MS,
+            state="attached",
+        )
+
+    def test_missing_holdings_markup_does_not_fail_navigation(self):
+        """Test pages without the markers still return for the extraction fallbacks."""
+        scraper = ZerodhaCoinScraper()
+        page = Mock(url="https://a")
+        page.wait_for_selector.side_effect = PwTimeoutError("timed out")
+
+        assert scraper.wait_for_holdings_ready(page) is False
+
+
+class TestPlaywrightScraperFactory:
+    """Test scrapers from the factory launch their browser only when first used."""
+
+    def test_browser_is_not_launched_until_first_navigation(self, mock_config_provider):
+        """Test creating and closing an unused scraper never starts Playwright."""
+        with patch.object(PlaywrightSession, "open") as mock_open:
+            scraper = ScraperFactory.create_scraper("playwright", mock_config_provider)
+            scraper.close()
+
+        mock_open.assert_not_called()
+
+    def test_first_navigation_opens_the_shared_session(self, mock_config_provider):
+        """Test the factory's session opens on the first page visit and stays open."""
+        scraper = ScraperFactory.create_scraper("playwright", mock_config_provider)
+        coin_scraper = scraper._scraper  # type: ignore[attr-defined]
+        session = coin_scraper.session
+
+        def fake_open() -> None:
+            session._p = object()
+            session._page = Mock(url="https://a")
+
+        with patch.object(session, "open", side_effect=fake_open) as mock_open:
+            coin_scraper.goto("https://a")
+            coin_scraper.goto("https://b")
+
+        mock_open.assert_called_once_with()
+        assert session.is_open
+
+
+class TestPlaywrightScraperPatterns:
+    """Test the precompiled patterns used to locate holdings on the page."""
+
+    def test_top_holdings_heading_matches_whitespace_variants(self):
+        """Test the strict heading pattern matches real whitespace, not a literal backslash."""
+        pattern = PlaywrightScraper._TOP_HOLDINGS_STRICT
+
+        assert pattern.search("Top  Holdings")
+        assert pattern.search("top\nholdings")
+        assert not pattern.search("Top Holdings (25)")
+
+    def test_container_lookup_uses_strict_heading_pattern(self):
+        """Test the section fallback filters on the same compiled heading pattern."""
+        scraper = ZerodhaCoinScraper()
+        page = Mock()
+        page.get_by_role.side_effect = RuntimeError("no heading")
+
+        scraper.find_holdings_table(page)
+
+        page.locator.return_value.filter.assert_called_once_with(
+            has_text=PlaywrightScraper._TOP_HOLDINGS_STRICT
+        )
+
+    def test_percent_extracts_allocation(self):
+        """Test allocation percentages are pulled out of surrounding cell text."""
+        assert PlaywrightScraper._percent("HDFC Bank 9.87% of AUM") == "9.87%"
+        assert PlaywrightScraper._percent("n/a") is None
+
+
+class TestPlaywrightScraperClicks:
+    """Test tab and show-all clicks are resolved in a single page evaluation."""
+
+    def test_holdings_tab_is_clicked_in_one_evaluation(self):
+        """Test all tab patterns go to the page at once and the click is given time to render."""
+        scraper = ZerodhaCoinScraper()
+        page = Mock()
+        page.evaluate.return_value = True
+
+        scraper.click_holdings_tab(page)
+
+        page.evaluate.assert_called_once_with(
+            PlaywrightScraper._JS_CLICK_FIRST_MATCH, PlaywrightScraper.HOLDINGS_TAB_PATTERNS
+        )
+        page.wait_for_timeout.assert_called_once_with(200)
+        page.get_by_role.assert_not_called()
+
+    def test_missing_show_all_button_does_not_wait(self):
+        """Test pages without a show-all control are not probed further or delayed."""
+        scraper = ZerodhaCoinScraper()
+        page = Mock()
+        page.evaluate.return_value = False
+
+        scraper.click_show_all(page)
+
+        page.evaluate.assert_called_once()
+        page.wait_for_timeout.assert_not_called()
+        page.locator.assert_not_called()
+
+    def test_evaluation_errors_are_ignored(self):
+        """Test a failed evaluation is treated like no match, as the old ladder did."""
+        scraper = ZerodhaCoinScraper()
+        page = Mock()
+        page.evaluate.side_effect = RuntimeError("execution context destroyed")
+
+        scraper.click_show_all(page)
+
+        page.wait_for_timeout.assert_not_called()
+
+
+class TestPlaywrightScraperPageCache:
+    """Test DOM lookups are made once per page visit."""
+
+    def _scraper_with_page(self) -> tuple[ZerodhaCoinScraper, Mock]:
+        scraper = ZerodhaCoinScraper()
+        page = Mock(url="https://a")
+        page.inner_text.return_value = "Fund\tpage"
+        scraper.session._p = object()  # type: ignore[assignment]
+        scraper.session._page = page
+        return scraper, page
+
+    def test_lookups_are_reused_for_the_same_url(self):
+        """Test repeated reads of the same page are served without querying the browser."""
+        scraper, page = self._scraper_with_page()
+
+        for _ in range(3):
+            assert scraper.get_body_text(page) == "Fund page"
+            scraper.extract_heading(page)
+            scraper.find_holdings_table(page)
+
+        page.inner_text.assert_called_once_with("body")
+        page.locator.return_value.first.inner_text.assert_called_once()
+        page.get_by_role.assert_called_once()
+
+    def test_navigation_and_clicks_drop_cached_lookups(self):
+        """Test lookups are made again after goto, a URL change, or a click that changes the DOM."""
+        scraper, page = self._scraper_with_page()
+
+        scraper.get_body_text(page)
+        scraper.goto("https://a")
+        scraper.get_body_text(page)
+        page.url = "https://b"
+        scraper.get_body_text(page)
+        page.evaluate.return_value = True
+        scraper.click_show_all(page)
+        scraper.get_body_text(page)
+
+        assert page.inner_text.call_count == 4
+
+    def test_any_table_reuses_the_holdings_table_lookup(self):
+        """Test the any-table parser does not repeat the heading and section probes."""
+        scraper, page = self._scraper_with_page()
+        heading = page.get_by_role.return_value.first
+        section = page.locator.return_value.filter.return_value.first
+        heading.element_handle.return_value = None
+        section.element_handle.return_value = None
+        page.locator.return_value.all.return_value = []
+
+        assert scraper.find_holdings_table(page) is None
+        assert scraper.parse_holdings_from_any_table(page) == []
+
+        heading.element_handle.assert_called_once()
+        section.element_handle.assert_called_once()
+
+
+class TestParseHoldingsFromTable:
+    """Test table rows are read from the page in one call and parsed locally."""
+
+    def test_rows_are_read_in_one_evaluation(self):
+        """Test allocation comes from the last cell, falling back to the row text."""
+        scraper = ZerodhaCoinScraper()
+        table = Mock()
+        table.evaluate.return_value = [
+            {"name": "HDFC Bank", "last": "9.87%", "row": "HDFC Bank Banks 9.87%"},
+            {"name": "", "last": "5%", "row": "5%"},
+            {"name": "Infosys", "last": "IT", "row": "Infosys 6.1% IT"},
+            {"name": "Cash", "last": "-", "row": "Cash -"},
+            {"name": "TCS", "last": "4%", "row": "TCS 4%"},
+        ]
+
+        holdings = scraper.parse_holdings_from_table(Mock(), table, max_holdings=2)
+
+        table.evaluate.assert_called_once_with(PlaywrightScraper._JS_READ_TABLE_ROWS, 12)
+        assert holdings == [
+            {"rank": 1, "company_name": "HDFC Bank", "allocation_percentage": "9.87%"},
+            {"rank": 2, "company_name": "Infosys", "allocation_percentage": "6.1%"},
+        ]
+
+    def test_unreadable_table_yields_no_holdings(self):
+        """Test a detached or missing table falls through to the other strategies."""
+        scraper = ZerodhaCoinScraper()
+        table = Mock()
+        table.evaluate.side_effect = RuntimeError("element is not attached")
+
+        assert scraper.parse_holdings_from_table(Mock(), table) == []
+        assert scraper.parse_holdings_from_table(Mock(), None) == []
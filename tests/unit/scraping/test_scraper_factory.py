@@ -0,0 +1,85 @@
+"""Unit tests for ScraperFactory and the hybrid API/Playwright scraper."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mfa.scraping.scraper_factory import (
+    APIScraperAdapter,
+    HybridScraperAdapter,
+    PlaywrightScraperAdapter,
+    ScraperFactory,
+)
+
+
+class TestHybridScraperAdapter:
+    """Test the API is tried first and the browser is only used as a fallback."""
+
+    def test_api_results_never_start_a_browser(self):
+        """Test funds served by the API don't create the Playwright scraper."""
+        api = Mock()
+        api.scrape.return_value = {"source": "api"}
+        create_browser = Mock()
+        scraper = HybridScraperAdapter(api, create_browser)
+
+        assert scraper.scrape("https://coin/fund/INF001/a") == {"source": "api"}
+        scraper.close()
+
+        create_browser.assert_not_called()
+        api.close.assert_called_once_with()
+
+    def test_api_failure_falls_back_and_is_remembered(self):
+        """Test a failed URL goes to the browser now and skips the API next time."""
+        api = Mock()
+        api.scrape.side_effect = RuntimeError("no such fund")
+        browser = Mock()
+        browser.scrape.return_value = {"source": "browser"}
+        create_browser = Mock(return_value=browser)
+        scraper = HybridScraperAdapter(api, create_browser)
+
+        for _ in range(2):
+            assert scraper.scrape("https://coin/fund/bad", 5) == {"source": "browser"}
+        scraper.close()
+
+        api.scrape.assert_called_once_with("https://coin/fund/bad", 5, None)
+        create_browser.assert_called_once_with()
+        assert browser.scrape.call_count == 2
+        browser.close.assert_called_once_with()
+
+    def test_remembered_fallbacks_are_bounded(self):
+        """Test the oldest fallback URL is forgotten once the memory is full."""
+        api = Mock()
+        api.scrape.side_effect = RuntimeError("down")
+        scraper = HybridScraperAdapter(api, Mock())
+
+        with patch.object(HybridScraperAdapter, "MAX_REMEMBERED_URLS", 2):
+            for url in ("https://a", "https://b", "https://c"):
+                scraper.scrape(url)
+
+        assert list(scraper._browser_only_urls) == ["https://b", "https://c"]
+
+
+class TestScraperFactory:
+    """Test scraper creation by type."""
+
+    @pytest.mark.parametrize(
+        ("scraper_type", "adapter"),
+        [
+            ("api", APIScraperAdapter),
+            ("playwright", PlaywrightScraperAdapter),
+            ("hybrid", HybridScraperAdapter),
+        ],
+    )
+    def test_creates_each_available_type(self, mock_config_provider, scraper_type, adapter):
+        """Test every advertised scraper type can be created."""
+        assert scraper_type in ScraperFactory.get_available_types()
+
+        scraper = ScraperFactory.create_scraper(scraper_type, mock_config_provider)
+
+        assert isinstance(scraper, adapter)
+        scraper.close()
+
+    def test_unknown_type_is_rejected(self, mock_config_provider):
+        """Test unsupported scraper types raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown scraper type"):
+            ScraperFactory.create_scraper("selenium", mock_config_provider)
@@ -0,0 +1,163 @@
+"""Unit tests for JsonStore."""
+
+import mmap
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from mfa.core.exceptions import StorageError
+from mfa.storage.json_store import JsonStore
+
+
+class TestJsonStore:
+    """Test JsonStore round trips across both read paths."""
+
+    def test_save_and_load_round_trip(self, temp_directory: Path):
+        """Test a small document is saved and loaded unchanged."""
+        path = temp_directory / "nested" / "fund.json"
+        data = {"fund": "Fund A", "holdings": [{"company_name": "X", "rank": 1}]}
+
+        JsonStore.save(data, path)
+
+        assert JsonStore.load(path) == data
+
+    def test_save_writes_compact_json(self, temp_directory: Path):
+        """Test documents are written as compact, valid JSON."""
+        path = temp_directory / "analysis.json"
+        data = {"total_funds": 2, "funds": [{"name": "A"}, {"name": "B"}], "empty": {}}
+
+        JsonStore.save(data, path)
+
+        assert path.read_bytes() == orjson.dumps(data)
+
+    def test_save_rejects_non_str_keys(self, temp_directory: Path):
+        """Test a document with a non-str key raises and never replaces the saved file."""
+        path = temp_directory / "fund.json"
+        JsonStore.save({"version": 1}, path)
+
+        with pytest.raises(StorageError):
+            JsonStore.save({1: "a", "b": 2}, path)  # type: ignore[dict-item]
+
+        assert JsonStore.load(path) == {"version": 1}
+        assert list(temp_directory.iterdir()) == [path]
+
+    def test_save_empty_document(self, temp_directory: Path):
+        """Test an empty dictionary is written as an empty JSON object."""
+        path = temp_directory / "empty.json"
+
+        JsonStore.save({}, path)
+
+        assert JsonStore.load(path) == {}
+
+    def test_load_large_file_uses_memory_map(self, temp_directory: Path):
+        """Test files above the threshold parse identically through the mmap path."""
+        path = temp_directory / "large.json"
+        data = {"holdings": [{"company_name": f"Company {i}"} for i in range(50)]}
+        JsonStore.save(data, path)
+
+        with (
+            patch.object(JsonStore, "MMAP_THRESHOLD_BYTES", 1),
+            patch("mfa.storage.json_store.mmap.mmap", wraps=mmap.mmap) as mock_mmap,
+        ):
+            assert JsonStore.load(path) == data
+
+        mock_mmap.assert_called_once()
+
+    def test_load_rejects_non_object(self, temp_directory: Path):
+        """Test a JSON array is rejected as a storage error."""
+        path = temp_directory / "list.json"
+        path.write_bytes(b"[1, 2, 3]")
+
+        with pytest.raises(StorageError):
+            JsonStore.load(path)
+
+    def test_load_missing_or_directory_path_raises_storage_error(self, temp_directory: Path):
+        """Test paths that cannot be opened as files surface as storage errors."""
+        with pytest.raises(StorageError) as missing:
+            JsonStore.load(temp_directory / "missing.json")
+        with pytest.raises(StorageError) as directory:
+            JsonStore.load(temp_directory)
+
+        assert isinstance(missing.value.__cause__, FileNotFoundError)
+        assert isinstance(directory.value.__cause__, IsADirectoryError)
+
+    def test_save_replaces_file_atomically(self, temp_directory: Path):
+        """Test saving goes through a temporary file that never outlives the write."""
+        path = temp_directory / "fund.json"
+        JsonStore.save({"version": 1}, path)
+
+        with (
+            patch("mfa.storage.json_store.orjson.dumps", side_effect=TypeError("bad value")),
+            pytest.raises(StorageError),
+        ):
+            JsonStore.save({"version": 2}, path)
+
+        # The failed write left the previous document intact and no temporary file behind
+        assert JsonStore.load(path) == {"version": 1}
+        assert [p.name for p in temp_directory.iterdir()] == ["fund.json"]
+
+    def test_save_creates_each_directory_once(self, temp_directory: Path):
+        """Test repeated saves into one directory only create it the first time."""
+        category_dir = temp_directory / "20240903" / "holdings" / "largeCap"
+
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mock_mkdir:
+            for index in range(3):
+                JsonStore.save({"index": index}, category_dir / f"fund_{index}.json")
+
+        # mkdir(parents=True) also calls itself for missing ancestors; count only ours
+        requested = [
+            c
+            for c in mock_mkdir.call_args_list
+            if c.args[0] == category_dir and c.kwargs.get("parents")
+        ]
+        assert len(requested) == 1
+        assert sorted(p.name for p in category_dir.iterdir()) == [
+            "fund_0.json",
+            "fund_1.json",
+            "fund_2.json",
+        ]
+
+    def test_save_recreates_directory_removed_after_first_save(self, temp_directory: Path):
+        """Test a directory deleted behind the cache is created again on the next save."""
+        category_dir = temp_directory / "midCap"
+        JsonStore.save({"index": 0}, category_dir / "first.json")
+
+        (category_dir / "first.json").unlink()
+        category_dir.rmdir()
+        JsonStore.save({"index": 1}, category_dir / "second.json")
+
+        assert JsonStore.load(category_dir / "second.json") == {"index": 1}
+
+    def test_link_shares_document_without_rewriting(self, temp_directory: Path):
+        """Test a linked path holds the same document and survives re-saving the source."""
+        source = temp_directory / "largeCap" / "fund.json"
+        target = temp_directory / "flexiCap" / "fund.json"
+        JsonStore.save({"version": 1}, source)
+
+        JsonStore.link(source, target)
+        JsonStore.save({"version": 2}, source)
+
+        assert JsonStore.load(target) == {"version": 1}
+        assert [p.name for p in target.parent.iterdir()] == ["fund.json"]
+
+    def test_link_falls_back_to_copy(self, temp_directory: Path):
+        """Test filesystems without hard links still get a copy of the document."""
+        source = temp_directory / "fund.json"
+        target = temp_directory / "copy" / "fund.json"
+        JsonStore.save({"version": 1}, source)
+
+        with patch("mfa.storage.json_store.os.link", side_effect=OSError("cross-device")):
+            JsonStore.link(source, target)
+
+        assert JsonStore.load(target) == {"version": 1}
+
+    def test_link_missing_source_raises_storage_error(self, temp_directory: Path):
+        """Test linking a missing file surfaces a storage error and leaves nothing behind."""
+        target = temp_directory / "out" / "fund.json"
+
+        with pytest.raises(StorageError):
+            JsonStore.link(temp_directory / "missing.json", target)
+
+        assert list(target.parent.iterdir()) == []
@@ -0,0 +1,75 @@
+"""Unit tests for PathGenerator."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from mfa.config.settings import ConfigProvider
+from mfa.storage.path_generator import PathGenerator
+
+
+class TestPathGenerator:
+    """Test scraped data path generation."""
+
+    def _make_generator(self, output_dir: str = "outputs/extracted_json") -> PathGenerator:
+        config_provider = Mock(spec=ConfigProvider)
+        config_provider.get_config.return_value.paths.output_dir = output_dir
+        return PathGenerator(config_provider)
+
+    def test_generate_scraped_data_dir_with_category(self):
+        """Test categorized analyses get a category subdirectory."""
+        generator = self._make_generator()
+
+        directory = generator.generate_scraped_data_dir(
+            "largeCap", {"type": "holdings"}, "20240115"
+        )
+
+        assert directory == "outputs/extracted_json/20240115/holdings/largeCap"
+
+    def test_generate_scraped_data_paths_matches_single_path(self):
+        """Test batch path generation matches per-URL generation."""
+        generator = self._make_generator()
+        urls = [
+            "https://coin.zerodha.com/mf/fund/INF204K01XI3/nippon-india-large-cap-fund",
+            "https://coin.zerodha.com/mf/fund/INF179K01XQ0/hdfc-mid-cap-fund/",
+        ]
+        analysis_config = {"type": "portfolio"}
+
+        paths = generator.generate_scraped_data_paths(urls, "", analysis_config, "20240115")
+
+        assert paths == [
+            str(generator.generate_scraped_data_path(url, "", analysis_config, "20240115"))
+            for url in urls
+        ]
+        assert paths[0].endswith(
+            "/20240115/portfolio/coin_INF204K01XI3_nippon-india-large-cap-fund.json"
+        )
+
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            (
+                "https://coin.zerodha.com/mf/fund/INF204K01XI3/nippon",
+                "coin_INF204K01XI3_nippon.json",
+            ),
+            (
+                "https://coin.zerodha.com/mf/fund/INF204K01XI3/nippon/",
+                "coin_INF204K01XI3_nippon.json",
+            ),
+            ("fund-code/", "coin_.json"),
+            ("plain fund", "coin_plain_fund.json"),
+        ],
+    )
+    def test_filename_from_url(self, url: str, expected: str):
+        """Test filenames use the last two URL segments, sanitising bare names."""
+        assert PathGenerator._generate_filename_from_url(url) == expected
+
+    def test_filename_from_url_is_cached(self):
+        """Test repeated lookups for the same URL are served from the cache."""
+        url = "https://coin.zerodha.com/mf/fund/INF000C01CC3/cached-fund"
+        PathGenerator._generate_filename_from_url(url)
+        hits = PathGenerator._generate_filename_from_url.cache_info().hits
+
+        PathGenerator._generate_filename_from_url(url)
+
+        assert PathGenerator._generate_filename_from_url.cache_info().hits == hits + 1
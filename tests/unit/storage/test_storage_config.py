@@ -0,0 +1,70 @@
+"""Unit tests for scraper storage configuration."""
+
+import dataclasses
+
+import pytest
+
+from mfa.storage.storage_config import StorageConfig, coerce_storage_config
+
+
+class TestStorageConfig:
+    """Test StorageConfig construction and conversion."""
+
+    def test_storage_config_is_immutable(self):
+        """Test StorageConfig instances cannot be mutated."""
+        storage_config = StorageConfig(
+            should_save=True,
+            base_dir="outputs",
+            category="largeCap",
+            filename_prefix="coin_",
+            analysis_type="holdings",
+        )
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            storage_config.category = "midCap"  # type: ignore[misc]
+
+    def test_from_dict_accepts_legacy_type_key(self):
+        """Test legacy dicts using the 'type' key are converted."""
+        storage_config = StorageConfig.from_dict(
+            {"should_save": True, "base_dir": "outputs", "category": "", "type": "portfolio"}
+        )
+
+        assert storage_config.analysis_type == "portfolio"
+        assert storage_config.filename_prefix == "coin_"
+        assert storage_config.path_template is None
+
+    def test_to_analysis_config(self):
+        """Test conversion to the PathGenerator analysis config mapping."""
+        storage_config = StorageConfig(
+            should_save=True,
+            base_dir="outputs",
+            category="largeCap",
+            filename_prefix="coin_",
+            analysis_type="holdings",
+            path_template="{category}",
+        )
+
+        assert storage_config.to_analysis_config() == {
+            "type": "holdings",
+            "path_template": "{category}",
+        }
+
+    def test_coerce_storage_config(self):
+        """Test coercion passes through instances and None, and converts dicts."""
+        storage_config = StorageConfig(
+            should_save=False,
+            base_dir="outputs",
+            category="",
+            filename_prefix="coin_",
+            analysis_type="holdings",
+        )
+
+        assert coerce_storage_config(None) is None
+        assert coerce_storage_config(storage_config) is storage_config
+        assert coerce_storage_config({"analysis_type": "holdings"}) == StorageConfig(
+            should_save=False,
+            base_dir="",
+            category="",
+            filename_prefix="coin_",
+            analysis_type="holdings",
+        )